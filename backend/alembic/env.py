@@ -43,6 +43,7 @@ from app.models.projects import Project  # noqa: F401
 from app.models.research import Publication, Infographic  # noqa: F401
 from app.models.plants import Plant  # noqa: F401
 from app.models.media import MediaLink, SiteConfig  # noqa: F401
+from app.models.data_version import DataVersion  # noqa: F401
 
 target_metadata = Base.metadata
 
@@ -0,0 +1,29 @@
+"""Add vinyl_records.photo_variants
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Fresh databases get the column from Base.metadata.create_all (seed_db.py),
+    # so the migration only has to patch databases created before it existed.
+    op.execute(
+        "ALTER TABLE IF EXISTS vinyl_records "
+        "ADD COLUMN IF NOT EXISTS photo_variants JSON"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('vinyl_records', 'photo_variants')
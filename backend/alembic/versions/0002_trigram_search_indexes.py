@@ -0,0 +1,46 @@
+"""Add pg_trgm GIN indexes for bot search
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+# Columns matched with ILIKE '%...%' by BaseRepository.search
+SEARCH_COLUMNS = {
+    'publications': ['title', 'venue'],
+    'plants': ['family', 'genus', 'species', 'common_name'],
+    'projects': ['name', 'description'],
+    'figures': ['name', 'brand'],
+}
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Fresh databases get the indexes from Base.metadata.create_all (seed_db.py),
+    # which runs after migrations; only existing tables are patched here.
+    inspector = sa.inspect(op.get_bind())
+    for table, columns in SEARCH_COLUMNS.items():
+        if not inspector.has_table(table):
+            continue
+        for column in columns:
+            op.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_{table}_{column}_trgm "
+                f"ON {table} USING gin ({column} gin_trgm_ops)"
+            )
+
+
+def downgrade() -> None:
+    for table, columns in SEARCH_COLUMNS.items():
+        for column in columns:
+            op.execute(f"DROP INDEX IF EXISTS ix_{table}_{column}_trgm")
@@ -0,0 +1,49 @@
+"""Add (created_at, id) indexes for keyset pagination
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+# Tables read through BaseRepository.list_page or ordered by SECTION_ORDER
+KEYSET_TABLES = [
+    'vinyl_records',
+    'books',
+    'coffee_brands',
+    'coffees',
+    'figures',
+    'projects',
+    'publications',
+    'infographics',
+    'plants',
+    'media_links',
+    'site_config',
+]
+
+
+def upgrade() -> None:
+    # Fresh databases get the indexes from Base.metadata.create_all (seed_db.py),
+    # which runs after migrations; only existing tables are patched here.
+    inspector = sa.inspect(op.get_bind())
+    for table in KEYSET_TABLES:
+        if not inspector.has_table(table):
+            continue
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS ix_{table}_created_at_id "
+            f"ON {table} (created_at, id)"
+        )
+
+
+def downgrade() -> None:
+    for table in KEYSET_TABLES:
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_created_at_id")
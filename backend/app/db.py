@@ -2,8 +2,44 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.settings import settings
+from app.utils.metrics import InstrumentedQueuePool, install_query_metrics
+from app.utils.query_log import install_query_counter, install_slow_query_log
 
-engine = create_async_engine(settings.database_url, echo=True)
+
+def _connect_args() -> dict:
+    connect_args = {
+        # Cache of asyncpg prepared statements per connection (SQLAlchemy dialect)
+        "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+    }
+    if settings.db_statement_timeout_ms:
+        connect_args["server_settings"] = {
+            "statement_timeout": str(settings.db_statement_timeout_ms)
+        }
+    return connect_args
+
+
+# Every uvicorn worker (see startup.sh) gets its own pool, so the server sees up
+# to workers * (db_pool_size + db_max_overflow) connections
+engine = create_async_engine(
+    settings.database_url,
+    echo=settings.db_echo,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    connect_args=_connect_args(),
+    **({"poolclass": InstrumentedQueuePool} if settings.metrics_enabled else {}),
+)
+install_slow_query_log(
+    engine.sync_engine,
+    threshold_ms=settings.slow_query_threshold_ms,
+    sample_rate=settings.slow_query_sample_rate,
+)
+if settings.db_query_count_header:
+    install_query_counter(engine.sync_engine)
+if settings.metrics_enabled:
+    install_query_metrics(engine.sync_engine)
 AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
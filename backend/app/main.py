@@ -9,12 +9,19 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.routers.all import router as all_router
 from app.routers.health import router as health_router
+from app.routers.metrics import router as metrics_router
+from app.routers.sections import router as sections_router
+from app.settings import settings
+from app.utils.metrics import MetricsMiddleware, mark_process_dead
+from app.utils.query_log import QueryCountMiddleware
+from app.utils.responses import FastJSONResponse
 
 app = FastAPI(
     title="Personal Site API",
     version="1.0.0",
     docs_url=None if os.getenv("ENVIRONMENT") == "production" else "/docs",
-    redoc_url=None if os.getenv("ENVIRONMENT") == "production" else "/redoc"
+    redoc_url=None if os.getenv("ENVIRONMENT") == "production" else "/redoc",
+    default_response_class=FastJSONResponse,
 )
 
 # Security: Trusted hosts
@@ -35,6 +42,14 @@ app.add_middleware(
     allow_headers=["*"],  # Allow all headers for development
 )
 
+if settings.db_query_count_header:
+    app.add_middleware(QueryCountMiddleware)
+
+if settings.metrics_enabled:
+    # Added last, so it is the outermost middleware and times the whole stack
+    app.add_middleware(MetricsMiddleware)
+    app.add_event_handler("shutdown", mark_process_dead)
+
 
 # Global exception handlers
 @app.exception_handler(StarletteHTTPException)
@@ -61,4 +76,7 @@ async def general_exception_handler(request: Request, exc: Exception):
     )
 
 app.include_router(all_router)
+app.include_router(sections_router)  # After all_router: /v1/{section} must not shadow /v1/all
 app.include_router(health_router)
+if settings.metrics_enabled:
+    app.include_router(metrics_router)
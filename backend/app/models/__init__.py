@@ -2,6 +2,7 @@
 from .books import Book
 from .coffee import Coffee, CoffeeBrand, CoffeeReview
 from .common import Base
+from .data_version import DataVersion
 from .figures import Figure
 from .media import MediaLink, SiteConfig
 from .plants import Plant
@@ -15,6 +16,7 @@ __all__ = [
     "Coffee",
     "CoffeeBrand",
     "CoffeeReview",
+    "DataVersion",
     "Figure",
     "MediaLink",
     "SiteConfig",
@@ -1,10 +1,11 @@
 from sqlalchemy import Column, String, Text, JSON
 
-from .common import Base, UUIDMixin
+from .common import Base, UUIDMixin, keyset_index
 
 
 class Book(Base, UUIDMixin):
     __tablename__ = "books"
+    __table_args__ = (keyset_index(__tablename__),)
 
     title = Column(String, nullable=False)
     author = Column(String, nullable=True)
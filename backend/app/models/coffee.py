@@ -2,11 +2,12 @@ from sqlalchemy import Column, Float, ForeignKey, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
-from .common import Base, UUIDMixin
+from .common import Base, UUIDMixin, keyset_index
 
 
 class CoffeeBrand(Base, UUIDMixin):
     __tablename__ = "coffee_brands"
+    __table_args__ = (keyset_index(__tablename__),)
 
     name = Column(String, nullable=False, unique=True)
 
@@ -15,6 +16,7 @@ class CoffeeBrand(Base, UUIDMixin):
 
 class Coffee(Base, UUIDMixin):
     __tablename__ = "coffees"
+    __table_args__ = (keyset_index(__tablename__),)
 
     brand_id = Column(
         UUID(as_uuid=True), ForeignKey("coffee_brands.id"), nullable=False
@@ -24,8 +26,12 @@ class Coffee(Base, UUIDMixin):
     processing = Column(String, nullable=True)
 
     brand = relationship("CoffeeBrand", back_populates="coffees")
+    # Insertion order, matching the reviews array of all_data_sql.ALL_DATA_QUERY
     reviews = relationship(
-        "CoffeeReview", back_populates="coffee", cascade="all, delete-orphan"
+        "CoffeeReview",
+        back_populates="coffee",
+        cascade="all, delete-orphan",
+        order_by=lambda: (CoffeeReview.created_at, CoffeeReview.id),
     )
 
 
@@ -1,12 +1,30 @@
 import uuid
 
-from sqlalchemy import Column, DateTime
+from sqlalchemy import DDL, Column, DateTime, Index, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 
 Base = declarative_base()
 
+# Trigram indexes below need pg_trgm; create_all builds them on fresh databases
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+
+def keyset_index(table: str) -> Index:
+    """B-tree index on the (created_at, id) keyset used by list_page and SECTION_ORDER"""
+    return Index(f"ix_{table}_created_at_id", "created_at", "id")
+
+
+def trigram_index(table: str, column: str) -> Index:
+    """GIN trigram index that serves ``column ILIKE '%...%'`` searches"""
+    return Index(
+        f"ix_{table}_{column}_trgm",
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+    )
+
 
 class UUIDMixin:
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
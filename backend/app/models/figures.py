@@ -1,10 +1,15 @@
 from sqlalchemy import Column, String
 
-from .common import Base, UUIDMixin
+from .common import Base, UUIDMixin, keyset_index, trigram_index
 
 
 class Figure(Base, UUIDMixin):
     __tablename__ = "figures"
+    __table_args__ = (
+        keyset_index(__tablename__),
+        trigram_index(__tablename__, "name"),
+        trigram_index(__tablename__, "brand"),
+    )
 
     name = Column(String, nullable=False)
     brand = Column(String, nullable=False)
@@ -1,10 +1,11 @@
 from sqlalchemy import Column, String
 
-from .common import Base, UUIDMixin
+from .common import Base, UUIDMixin, keyset_index
 
 
 class MediaLink(Base, UUIDMixin):
     __tablename__ = "media_links"
+    __table_args__ = (keyset_index(__tablename__),)
 
     type = Column(String, nullable=False)  # Telegram, GitHub, Email, etc.
     label = Column(String, nullable=True)
@@ -13,6 +14,7 @@ class MediaLink(Base, UUIDMixin):
 
 class SiteConfig(Base, UUIDMixin):
     __tablename__ = "site_config"
+    __table_args__ = (keyset_index(__tablename__),)
 
     external_wish_url = Column(String, nullable=False)
     about_bio = Column(String, nullable=False)
@@ -1,10 +1,17 @@
 from sqlalchemy import Column, String, JSON
 
-from .common import Base, UUIDMixin
+from .common import Base, UUIDMixin, keyset_index, trigram_index
 
 
 class Plant(Base, UUIDMixin):
     __tablename__ = "plants"
+    __table_args__ = (
+        keyset_index(__tablename__),
+        trigram_index(__tablename__, "family"),
+        trigram_index(__tablename__, "genus"),
+        trigram_index(__tablename__, "species"),
+        trigram_index(__tablename__, "common_name"),
+    )
 
     family = Column(String, nullable=True)
     genus = Column(String, nullable=True)
@@ -12,4 +19,4 @@ class Plant(Base, UUIDMixin):
     common_name = Column(String, nullable=True)
 
     # Новое поле для галереи фотографий
-    photos = Column(JSON, nullable=True)  # Массив объектов {url: str, date: str, notes?: str}
+    photos = Column(JSON, nullable=True)  # Массив объектов {url: str, date: str, notes?: str, variants?: [{url, width, height, format}]}
@@ -1,10 +1,15 @@
 from sqlalchemy import ARRAY, Column, String
 
-from .common import Base, UUIDMixin
+from .common import Base, UUIDMixin, keyset_index, trigram_index
 
 
 class Project(Base, UUIDMixin):
     __tablename__ = "projects"
+    __table_args__ = (
+        keyset_index(__tablename__),
+        trigram_index(__tablename__, "name"),
+        trigram_index(__tablename__, "description"),
+    )
 
     name = Column(String, nullable=False)
     description = Column(String, nullable=False)
@@ -1,10 +1,15 @@
 from sqlalchemy import Column, Integer, String
 
-from .common import Base, UUIDMixin
+from .common import Base, UUIDMixin, keyset_index, trigram_index
 
 
 class Publication(Base, UUIDMixin):
     __tablename__ = "publications"
+    __table_args__ = (
+        keyset_index(__tablename__),
+        trigram_index(__tablename__, "title"),
+        trigram_index(__tablename__, "venue"),
+    )
 
     title = Column(String, nullable=False)
     venue = Column(String, nullable=True)
@@ -14,6 +19,7 @@ class Publication(Base, UUIDMixin):
 
 class Infographic(Base, UUIDMixin):
     __tablename__ = "infographics"
+    __table_args__ = (keyset_index(__tablename__),)
 
     topic = Column(String, nullable=True)
     title = Column(String, nullable=False)
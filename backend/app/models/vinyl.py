@@ -1,13 +1,16 @@
-from sqlalchemy import ARRAY, Column, Integer, String
+from sqlalchemy import ARRAY, JSON, Column, Integer, String
 
-from .common import Base, UUIDMixin
+from .common import Base, UUIDMixin, keyset_index
 
 
 class VinylRecord(Base, UUIDMixin):
     __tablename__ = "vinyl_records"
+    __table_args__ = (keyset_index(__tablename__),)
 
     artist = Column(String, nullable=False)
     title = Column(String, nullable=False)
     year = Column(Integer, nullable=True)
     genres = Column(ARRAY(String), nullable=False, default=list)
     photo_url = Column(String, nullable=True)  # URL фото в S3
+    # Уменьшенные копии фото: [{url, width, height, format}, ...]
+    photo_variants = Column(JSON(none_as_null=True), nullable=True)
@@ -1,41 +1,245 @@
-from typing import Generic, Type, TypeVar
+import base64
+import binascii
+import operator
+import struct
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Generic, Sequence, Type, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import func, inspect, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, selectinload
 
 from app.models.common import Base
+from app.repositories.data_version import DataVersionRepository
+from app.utils.query_log import query_source
 
 T = TypeVar("T", bound=Base)
 
+# Filter suffixes accepted by list(), e.g. year__gte=1970 or genre__in=[...]
+FILTER_OPERATORS = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "in": lambda column, value: column.in_(value),
+    "ilike": lambda column, value: column.ilike(value),
+}
+
+DEFAULT_SEARCH_LIMIT = 20
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_CURSOR_FORMAT = ">q16s"  # created_at in microseconds since epoch, id bytes
+
+
+def encode_cursor(created_at: datetime, id: uuid.UUID) -> str:
+    """Opaque keyset cursor; 32 characters, small enough for Telegram callback data"""
+    micros = (created_at - _EPOCH) // (datetime.resolution)
+    packed = struct.pack(_CURSOR_FORMAT, micros, id.bytes)
+    return base64.urlsafe_b64encode(packed).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        micros, id_bytes = struct.unpack(
+            _CURSOR_FORMAT, base64.urlsafe_b64decode(cursor.encode("ascii"))
+        )
+    except (binascii.Error, struct.error, UnicodeEncodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    return _EPOCH + micros * datetime.resolution, uuid.UUID(bytes=id_bytes)
+
+
+def escape_like(value: str, escape: str = "\\") -> str:
+    """Escape LIKE wildcards so user input matches literally"""
+    return (
+        value.replace(escape, escape * 2)
+        .replace("%", escape + "%")
+        .replace("_", escape + "_")
+    )
+
+
+@dataclass
+class Page(Generic[T]):
+    items: list[T]
+    next_cursor: str | None = None
+
 
 class BaseRepository(Generic[T]):
     def __init__(self, model: Type[T], db: AsyncSession):
         self.model = model
         self.db = db
 
-    async def list(self, **kwargs) -> list[T]:
-        query = select(self.model)
+    @query_source
+    async def list_only(
+        self, *fields: str, order_by: str | None = None, descending: bool = False
+    ) -> list[T]:
+        """List rows loading only the given attributes (the primary key is always loaded).
 
-        # Apply filters if any test
-        for key, value in kwargs.items():
-            if hasattr(self.model, key):
-                query = query.where(getattr(self.model, key) == value)
+        Relationship names are eager-loaded with selectinload; accessing any
+        other attribute of the returned rows would trigger a lazy load.
+        ``order_by`` and ``descending`` work as in list().
+        """
+        relationships = inspect(self.model).relationships
+        columns = [self.model.id]
+        options = []
+        for field in fields:
+            if field in relationships:
+                options.append(selectinload(getattr(self.model, field)))
+            elif field != "id":
+                columns.append(getattr(self.model, field))
+
+        query = select(self.model).options(load_only(*columns), *options)
+        if order_by is not None:
+            query = self._apply_order(query, order_by, descending)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    @query_source
+    async def search(
+        self,
+        query: str,
+        fields: Sequence[str],
+        limit: int = DEFAULT_SEARCH_LIMIT,
+    ) -> list[T]:
+        """Rows where any of ``fields`` contains ``query``, case-insensitively.
+
+        Matching is ``ILIKE '%query%'``, served by the pg_trgm GIN indexes on
+        those columns. Results are ranked by the best pg_trgm word similarity
+        across the fields, so closer matches come first.
+        """
+        query = query.strip()
+        if not query:
+            return []
+
+        pattern = f"%{escape_like(query)}%"
+        columns = [getattr(self.model, field) for field in fields]
+        # greatest() skips NULLs, so nullable columns do not hide a match
+        rank = func.greatest(*(func.word_similarity(query, column) for column in columns))
+        statement = (
+            select(self.model)
+            .where(or_(*(column.ilike(pattern, escape="\\") for column in columns)))
+            .order_by(rank.desc(), self.model.created_at.desc(), self.model.id)
+            .limit(limit)
+        )
+        result = await self.db.execute(statement)
+        return list(result.scalars().all())
+
+    @query_source
+    async def list(
+        self,
+        *,
+        limit: int | None = None,
+        after: str | None = None,
+        order_by: str | None = None,
+        descending: bool = False,
+        options: Sequence[Any] = (),
+        **kwargs,
+    ) -> list[T]:
+        """List rows matching the filters.
+
+        Filters are ``field=value`` or ``field__<op>=value`` with op from
+        FILTER_OPERATORS; unknown fields are ignored. Without limit, after or
+        order_by no ORDER BY is added. Otherwise rows are ordered by
+        ``order_by`` or, by default, by the (created_at, id) keyset that
+        ``after`` cursors refer to.
+        """
+        query = select(self.model).options(*options)
+        query = self._apply_filters(query, kwargs)
+
+        if order_by is not None:
+            if after is not None:
+                raise ValueError("Cursor pagination is only supported on (created_at, id)")
+            query = self._apply_order(query, order_by, descending)
+        elif limit is not None or after is not None:
+            query = self._apply_keyset(query, after, descending)
+
+        if limit is not None:
+            query = query.limit(limit)
 
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
+    @query_source
+    async def list_page(
+        self,
+        limit: int,
+        after: str | None = None,
+        descending: bool = False,
+        options: Sequence[Any] = (),
+        **kwargs,
+    ) -> Page[T]:
+        """One keyset page of rows and the cursor of the next page, if any"""
+        items = await self.list(
+            limit=limit + 1, after=after, descending=descending, options=options, **kwargs
+        )
+        if len(items) <= limit:
+            return Page(items=items)
+
+        items = items[:limit]
+        last = items[-1]
+        return Page(items=items, next_cursor=encode_cursor(last.created_at, last.id))
+
+    def _apply_filters(self, query, filters: dict):
+        for key, value in filters.items():
+            field, _, op = key.partition("__")
+            if not hasattr(self.model, field):
+                continue
+            if op and op not in FILTER_OPERATORS:
+                raise ValueError(f"Unknown filter operator: {op}")
+            compare = FILTER_OPERATORS[op or "eq"]
+            query = query.where(compare(getattr(self.model, field), value))
+        return query
+
+    def _apply_order(self, query, order_by: str, descending: bool):
+        # id breaks ties, so rows with equal values keep a stable order
+        column = getattr(self.model, order_by)
+        return query.order_by(
+            column.desc() if descending else column.asc(),
+            self.model.id.desc() if descending else self.model.id.asc(),
+        )
+
+    def _apply_keyset(self, query, after: str | None, descending: bool):
+        created_at, id = self.model.created_at, self.model.id
+        if after is not None:
+            cursor_created_at, cursor_id = decode_cursor(after)
+            if descending:
+                query = query.where(
+                    or_(
+                        created_at < cursor_created_at,
+                        (created_at == cursor_created_at) & (id < cursor_id),
+                    )
+                )
+            else:
+                query = query.where(
+                    or_(
+                        created_at > cursor_created_at,
+                        (created_at == cursor_created_at) & (id > cursor_id),
+                    )
+                )
+
+        if descending:
+            return query.order_by(created_at.desc(), id.desc())
+        return query.order_by(created_at.asc(), id.asc())
+
+    @query_source
     async def get_by_id(self, id: str) -> T | None:
         query = select(self.model).where(self.model.id == id)
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
+    @query_source
     async def create(self, **kwargs) -> T:
         instance = self.model(**kwargs)
         self.db.add(instance)
         await self.db.flush()
         await self.db.refresh(instance)
+        await self._bump_data_version()
         return instance
 
+    @query_source
     async def update(self, id: str, **kwargs) -> T | None:
         instance = await self.get_by_id(id)
         if not instance:
@@ -46,8 +250,10 @@ class BaseRepository(Generic[T]):
 
         await self.db.flush()
         await self.db.refresh(instance)
+        await self._bump_data_version()
         return instance
 
+    @query_source
     async def delete(self, id: str) -> bool:
         instance = await self.get_by_id(id)
         if not instance:
@@ -55,4 +261,9 @@ class BaseRepository(Generic[T]):
 
         await self.db.delete(instance)
         await self.db.flush()
+        await self._bump_data_version()
         return True
+
+    async def _bump_data_version(self) -> None:
+        # Invalidates cached /v1/all snapshots once the transaction commits
+        await DataVersionRepository(self.db).bump()
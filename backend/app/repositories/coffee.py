@@ -1,8 +1,8 @@
-from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from app.models.coffee import Coffee, CoffeeBrand, CoffeeReview
 from app.repositories.base import BaseRepository
+from app.utils.query_log import query_source
 
 
 class CoffeeBrandRepository(BaseRepository[CoffeeBrand]):
@@ -14,12 +14,12 @@ class CoffeeRepository(BaseRepository[Coffee]):
     def __init__(self, db):
         super().__init__(Coffee, db)
 
-    async def list_with_reviews(self) -> list[Coffee]:
-        query = select(Coffee).options(
-            selectinload(Coffee.reviews), selectinload(Coffee.brand)
+    @query_source
+    async def list_with_reviews(self, **kwargs) -> list[Coffee]:
+        return await self.list(
+            options=(selectinload(Coffee.reviews), selectinload(Coffee.brand)),
+            **kwargs,
         )
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
 
 
 class CoffeeReviewRepository(BaseRepository[CoffeeReview]):
@@ -0,0 +1,77 @@
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import func
+
+from app.models.common import Base, UUIDMixin
+from app.models.data_version import DataVersion
+from app.utils.query_log import query_source
+
+DATA_VERSION_ID = 1
+# NOTIFY channel signalled on every bump, delivered when the write commits
+DATA_VERSION_CHANNEL = "data_version"
+
+
+class DataVersionRepository:
+    """Global data version counter shared by the backend and the Telegram bot"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @query_source
+    async def get(self) -> int:
+        query = select(DataVersion.version).where(DataVersion.id == DATA_VERSION_ID)
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none() or 0
+
+    @query_source
+    async def bump(self) -> None:
+        """Increment the version inside the caller's transaction"""
+        query = (
+            insert(DataVersion)
+            .values(id=DATA_VERSION_ID, version=1)
+            .on_conflict_do_update(
+                index_elements=[DataVersion.id],
+                set_={"version": DataVersion.version + 1, "updated_at": func.now()},
+            )
+            .returning(DataVersion.version)
+        )
+        result = await self.db.execute(query)
+        version = result.scalar_one()
+        await self.db.execute(
+            select(func.pg_notify(DATA_VERSION_CHANNEL, str(version)))
+        )
+
+    @query_source
+    async def last_modified(self) -> datetime | None:
+        """Latest change time across all UUIDMixin tables and the version row.
+
+        Rows only get updated_at on update, so created_at is used for rows
+        that were never edited; the version row accounts for deletions.
+        """
+        timestamps = [
+            select(func.max(func.coalesce(model.updated_at, model.created_at)))
+            .scalar_subquery()
+            for model in _uuid_models()
+        ]
+        timestamps.append(
+            select(DataVersion.updated_at)
+            .where(DataVersion.id == DATA_VERSION_ID)
+            .scalar_subquery()
+        )
+        # greatest() ignores NULLs in PostgreSQL
+        result = await self.db.execute(select(func.greatest(*timestamps)))
+        return result.scalar_one_or_none()
+
+
+def _uuid_models() -> list:
+    return sorted(
+        (
+            mapper.class_
+            for mapper in Base.registry.mappers
+            if issubclass(mapper.class_, UUIDMixin)
+        ),
+        key=lambda model: model.__tablename__,
+    )
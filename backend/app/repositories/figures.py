@@ -1,7 +1,17 @@
+from sqlalchemy import func, select
+
 from app.models.figures import Figure
 from app.repositories.base import BaseRepository
+from app.utils.query_log import query_source
 
 
 class FigureRepository(BaseRepository[Figure]):
     def __init__(self, db):
         super().__init__(Figure, db)
+
+    @query_source
+    async def count_by_brand(self) -> dict[str, int]:
+        """Number of figures per brand"""
+        query = select(Figure.brand, func.count()).group_by(Figure.brand)
+        result = await self.db.execute(query)
+        return dict(result.all())
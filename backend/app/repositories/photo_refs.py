@@ -0,0 +1,54 @@
+from typing import Set
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.utils.query_log import query_source
+
+# Every stored photo URL, one row per reference: vinyl covers and their
+# variants, plant gallery photos and their variants. Photo objects are
+# content-addressed and shared, so an object may be referenced many times.
+_REFERENCES = """
+    SELECT photo_url AS url FROM vinyl_records WHERE photo_url IS NOT NULL
+    UNION ALL
+    SELECT variant->>'url'
+    FROM vinyl_records,
+         json_array_elements(
+             CASE WHEN json_typeof(photo_variants) = 'array' THEN photo_variants ELSE '[]' END
+         ) AS variant
+    UNION ALL
+    SELECT photo->>'url'
+    FROM plants,
+         json_array_elements(
+             CASE WHEN json_typeof(photos) = 'array' THEN photos ELSE '[]' END
+         ) AS photo
+    UNION ALL
+    SELECT variant->>'url'
+    FROM plants,
+         json_array_elements(
+             CASE WHEN json_typeof(photos) = 'array' THEN photos ELSE '[]' END
+         ) AS photo,
+         json_array_elements(
+             CASE WHEN json_typeof(photo->'variants') = 'array' THEN photo->'variants' ELSE '[]' END
+         ) AS variant
+"""
+
+REFERENCE_COUNT_QUERY = text(f"SELECT count(*) FROM ({_REFERENCES}) refs WHERE url = :url")
+REFERENCED_URLS_QUERY = text(f"SELECT DISTINCT url FROM ({_REFERENCES}) refs WHERE url IS NOT NULL")
+
+
+class PhotoReferenceRepository:
+    """Reference counts for photo URLs stored in vinyl_records and plants"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @query_source
+    async def count(self, url: str) -> int:
+        result = await self.db.execute(REFERENCE_COUNT_QUERY, {"url": url})
+        return result.scalar_one()
+
+    @query_source
+    async def referenced_urls(self) -> Set[str]:
+        result = await self.db.execute(REFERENCED_URLS_QUERY)
+        return set(result.scalars())
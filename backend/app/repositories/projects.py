@@ -1,7 +1,18 @@
+from sqlalchemy import func, select
+
 from app.models.projects import Project
 from app.repositories.base import BaseRepository
+from app.utils.query_log import query_source
 
 
 class ProjectRepository(BaseRepository[Project]):
     def __init__(self, db):
         super().__init__(Project, db)
+
+    @query_source
+    async def count_by_tag(self) -> dict[str, int]:
+        """Number of projects per tag"""
+        tags = select(func.unnest(Project.tags).label("tag")).subquery()
+        query = select(tags.c.tag, func.count()).group_by(tags.c.tag)
+        result = await self.db.execute(query)
+        return dict(result.all())
@@ -0,0 +1,108 @@
+import json
+from typing import Any
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.data_version import DATA_VERSION_ID
+from app.utils.query_log import query_source
+
+DEFAULT_TOP = 5
+
+# Collection statistics in one round-trip. Counts per table, the most common
+# vinyl genres, project tags, figure brands and book genres, and coffee
+# ratings. The data version is read by the same statement, so the result
+# matches exactly the version it is cached under.
+STATISTICS_QUERY = text(
+    """
+    WITH vinyl_genres AS (
+        SELECT genre AS name, count(*) AS count
+        FROM vinyl_records, unnest(genres) AS genre
+        GROUP BY genre
+    ), project_tags AS (
+        SELECT tag AS name, count(*) AS count
+        FROM projects, unnest(tags) AS tag
+        GROUP BY tag
+    ), figure_brands AS (
+        SELECT brand AS name, count(*) AS count
+        FROM figures
+        GROUP BY brand
+    ), book_genres AS (
+        SELECT genre AS name, count(*) AS count
+        FROM books
+        WHERE genre IS NOT NULL AND genre <> ''
+        GROUP BY genre
+    ), coffee_ratings AS (
+        SELECT c.name, cb.name AS brand, avg(r.rating) AS rating, count(*) AS count
+        FROM coffee_reviews r
+        JOIN coffees c ON c.id = r.coffee_id
+        JOIN coffee_brands cb ON cb.id = c.brand_id
+        WHERE r.rating IS NOT NULL
+        GROUP BY c.id, c.name, cb.name
+    ), method_ratings AS (
+        SELECT method AS name, avg(rating) AS rating, count(*) AS count
+        FROM coffee_reviews
+        WHERE rating IS NOT NULL
+        GROUP BY method
+    )
+    SELECT json_build_object(
+        'version', COALESCE((SELECT version FROM data_version WHERE id = :version_id), 0),
+        'counts', json_build_object(
+            'vinyl', (SELECT count(*) FROM vinyl_records),
+            'books', (SELECT count(*) FROM books),
+            'coffee_brands', (SELECT count(*) FROM coffee_brands),
+            'coffee', (SELECT count(*) FROM coffees),
+            'coffee_reviews', (SELECT count(*) FROM coffee_reviews),
+            'figures', (SELECT count(*) FROM figures),
+            'projects', (SELECT count(*) FROM projects),
+            'publications', (SELECT count(*) FROM publications),
+            'infographics', (SELECT count(*) FROM infographics),
+            'plants', (SELECT count(*) FROM plants)
+        ),
+        'vinyl_genres', COALESCE((
+            SELECT json_agg(json_build_object('name', name, 'count', count))
+            FROM (SELECT * FROM vinyl_genres ORDER BY count DESC, name LIMIT :top) t
+        ), '[]'::json),
+        'project_tags', COALESCE((
+            SELECT json_agg(json_build_object('name', name, 'count', count))
+            FROM (SELECT * FROM project_tags ORDER BY count DESC, name LIMIT :top) t
+        ), '[]'::json),
+        'figure_brands', COALESCE((
+            SELECT json_agg(json_build_object('name', name, 'count', count))
+            FROM (SELECT * FROM figure_brands ORDER BY count DESC, name LIMIT :top) t
+        ), '[]'::json),
+        'book_genres', COALESCE((
+            SELECT json_agg(json_build_object('name', name, 'count', count))
+            FROM (SELECT * FROM book_genres ORDER BY count DESC, name LIMIT :top) t
+        ), '[]'::json),
+        'coffee_rating', (
+            SELECT round(avg(rating)::numeric, 2) FROM coffee_reviews
+        ),
+        'coffee_methods', COALESCE((
+            SELECT json_agg(json_build_object(
+                'name', name, 'rating', round(rating::numeric, 2), 'count', count
+            ))
+            FROM (SELECT * FROM method_ratings ORDER BY rating DESC, name) t
+        ), '[]'::json),
+        'top_coffee', COALESCE((
+            SELECT json_agg(json_build_object(
+                'name', name, 'brand', brand,
+                'rating', round(rating::numeric, 2), 'count', count
+            ))
+            FROM (SELECT * FROM coffee_ratings ORDER BY rating DESC, count DESC, name LIMIT :top) t
+        ), '[]'::json)
+    )::text
+    """
+).bindparams(bindparam("version_id", DATA_VERSION_ID))
+
+
+class StatisticsRepository:
+    """Aggregated collection statistics computed inside PostgreSQL"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @query_source
+    async def collect(self, top: int = DEFAULT_TOP) -> dict[str, Any]:
+        result = await self.db.execute(STATISTICS_QUERY, {"top": top})
+        return json.loads(result.scalar_one())
@@ -1,14 +1,38 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db import get_db
-from app.services.all_data import AllDataService
+from app.services.snapshot import snapshot_cache
+from app.settings import settings
+from app.utils.http import choose_encoding, http_date, is_not_modified
 
 router = APIRouter()
 
 
 @router.get("/v1/all")
-async def get_all_data(db: AsyncSession = Depends(get_db)):
+async def get_all_data(request: Request, db: AsyncSession = Depends(get_db)):
     """Get all site data in frontend-compatible format"""
-    service = AllDataService(db)
-    return await service.get_all_data()
+    snapshot = await snapshot_cache.get(db)
+    encoding = choose_encoding(
+        request.headers.get("accept-encoding", ""), snapshot.encodings
+    )
+    etag = snapshot.etag_for(encoding)
+
+    headers = {
+        "ETag": etag,
+        "Cache-Control": settings.all_data_cache_control,
+        "Vary": "Accept-Encoding",
+    }
+    if snapshot.last_modified is not None:
+        headers["Last-Modified"] = http_date(snapshot.last_modified)
+
+    if is_not_modified(request, etag, snapshot.last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    body = snapshot.body
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+        body = snapshot.encodings[encoding]
+
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,14 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from app.utils.metrics import render_metrics
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics of all workers; nginx keeps this endpoint internal"""
+    body, content_type = render_metrics()
+    # Passed as a header: media_type would append a second charset
+    return Response(content=body, headers={"Content-Type": content_type})
@@ -0,0 +1,34 @@
+from enum import Enum
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import get_db
+from app.services.all_data import PUBLIC_SECTIONS, AllDataService
+from app.utils.responses import FastJSONResponse
+
+router = APIRouter()
+
+Section = Enum("Section", {name: name for name in PUBLIC_SECTIONS}, type=str)
+
+
+@router.get("/v1/{section}")
+async def get_section(
+    section: Section,
+    fields: str | None = Query(None, description="Comma-separated list of fields"),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get a single section of site data in frontend-compatible format"""
+    requested = None
+    if fields:
+        requested = [field.strip() for field in fields.split(",") if field.strip()]
+        allowed = PUBLIC_SECTIONS[section.value][1]
+        unknown = [field for field in requested if field not in allowed]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields for {section.value}: {', '.join(unknown)}",
+            )
+
+    service = AllDataService(db)
+    return FastJSONResponse(await service.load_section(section.value, requested))
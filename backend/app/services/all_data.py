@@ -1,5 +1,8 @@
+import asyncio
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db import AsyncSessionLocal
 from app.repositories.books import BookRepository
 from app.repositories.coffee import CoffeeBrandRepository, CoffeeRepository
 from app.repositories.figures import FigureRepository
@@ -8,62 +11,148 @@ from app.repositories.plants import PlantRepository
 from app.repositories.projects import ProjectRepository
 from app.repositories.research import InfographicRepository, PublicationRepository
 from app.repositories.vinyl import VinylRepository
+from app.settings import settings
+
+FETCH_SEQUENTIAL = "sequential"
+FETCH_CONCURRENT = "concurrent"
+
+# Repository class and method used to load each section
+SECTION_LOADERS = {
+    "vinyl": (VinylRepository, "list"),
+    "books": (BookRepository, "list"),
+    "coffee": (CoffeeRepository, "list_with_reviews"),
+    "coffeeBrands": (CoffeeBrandRepository, "list"),
+    "figures": (FigureRepository, "list"),
+    "projects": (ProjectRepository, "list"),
+    "publications": (PublicationRepository, "list"),
+    "infographics": (InfographicRepository, "list"),
+    "plants": (PlantRepository, "list"),
+    "mediaLinks": (MediaLinkRepository, "list"),
+    "siteConfig": (SiteConfigRepository, "list"),
+}
+
+# Every section is listed in insertion order, as the unordered scans it
+# replaces returned in practice; all_data_sql.ALL_DATA_QUERY uses the same
+# ORDER BY created_at, id, so both engines return equal lists
+SECTION_ORDER = {"order_by": "created_at", "descending": False}
+
+# Sections exposed by /v1/{section}: mapper method and, for every output
+# field, the model attribute it is built from
+PUBLIC_SECTIONS = {
+    "vinyl": (
+        "_map_vinyl",
+        {
+            "id": "id",
+            "artist": "artist",
+            "title": "title",
+            "year": "year",
+            "genres": "genres",
+            "photo_url": "photo_url",
+            "photo_variants": "photo_variants",
+        },
+    ),
+    "books": (
+        "_map_book",
+        {
+            "id": "id",
+            "title": "title",
+            "author": "author",
+            "genre": "genre",
+            "language": "language",
+            "format": "format",
+            "review": "review",
+        },
+    ),
+    "coffeeBrands": ("_map_coffee_brand", {"id": "id", "name": "name"}),
+    "coffee": (
+        "_map_coffee",
+        {
+            "id": "id",
+            "brandId": "brand_id",
+            "name": "name",
+            "region": "region",
+            "processing": "processing",
+            "reviews": "reviews",
+        },
+    ),
+    "figures": ("_map_figure", {"id": "id", "name": "name", "brand": "brand"}),
+    "projects": (
+        "_map_project",
+        {"id": "id", "name": "name", "desc": "description", "tags": "tags"},
+    ),
+    "publications": (
+        "_map_publication",
+        {"id": "id", "title": "title", "venue": "venue", "year": "year", "url": "url"},
+    ),
+    "infographics": (
+        "_map_infographic",
+        {"id": "id", "topic": "topic", "title": "title"},
+    ),
+    "plants": (
+        "_map_plant",
+        {
+            "id": "id",
+            "family": "family",
+            "genus": "genus",
+            "species": "species",
+            "commonName": "common_name",
+        },
+    ),
+}
+
+
+class _PartialRow:
+    """Read-only view of a partially loaded row: attributes that were not
+    selected read as None instead of triggering a lazy load"""
+
+    def __init__(self, instance, loaded: set[str]):
+        self._instance = instance
+        self._loaded = loaded
+
+    def __getattr__(self, name):
+        if name in self._loaded:
+            return getattr(self._instance, name)
+        return None
 
 
 class AllDataService:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, session_factory=AsyncSessionLocal):
         self.db = db
-        self.vinyl_repo = VinylRepository(db)
-        self.book_repo = BookRepository(db)
-        self.coffee_repo = CoffeeRepository(db)
-        self.coffee_brand_repo = CoffeeBrandRepository(db)
-        self.figure_repo = FigureRepository(db)
-        self.project_repo = ProjectRepository(db)
-        self.publication_repo = PublicationRepository(db)
-        self.infographic_repo = InfographicRepository(db)
-        self.plant_repo = PlantRepository(db)
-        self.media_link_repo = MediaLinkRepository(db)
-        self.site_config_repo = SiteConfigRepository(db)
+        self.session_factory = session_factory
 
     async def get_all_data(self) -> dict:
         """Aggregate all data and return as dict matching frontend contract"""
 
         try:
-            # Fetch all data in parallel
-            vinyl_records = await self.vinyl_repo.list() or []
-            books = await self.book_repo.list() or []
-            coffees = await self.coffee_repo.list_with_reviews() or []
-            coffee_brands = await self.coffee_brand_repo.list() or []
-            figures = await self.figure_repo.list() or []
-            projects = await self.project_repo.list() or []
-            publications = await self.publication_repo.list() or []
-            infographics = await self.infographic_repo.list() or []
-            plants = await self.plant_repo.list() or []
-            media_links = await self.media_link_repo.list() or []
-            site_config = await self.site_config_repo.list() or []
-
-            site_config = site_config[0] if site_config else None
+            return await self.load_all_data()
         except Exception as e:
             # Log the error and return empty data structure
             print(f"Error fetching data: {e}")
             # Return empty data structure that matches frontend expectations
-            return {
-                "about": {"bio": ""},
-                "vinylGenres": [],
-                "vinyl": [],
-                "books": [],
-                "coffeeBrands": [],
-                "coffee": [],
-                "figures": [],
-                "projects": [],
-                "publications": [],
-                "infographics": [],
-                "plants": [],
-                "media": {
-                    "externalWishUrl": "",
-                    "links": [],
-                },
-            }
+            return self.empty_data()
+
+    async def load_all_data(self, fetch_mode: str | None = None) -> dict:
+        """Same as get_all_data, but database errors are propagated to the caller"""
+
+        fetch_mode = fetch_mode or settings.all_data_fetch_mode
+        if fetch_mode == FETCH_CONCURRENT:
+            sections = await self._fetch_concurrent()
+        else:
+            sections = await self._fetch_sequential()
+
+        vinyl_records = sections["vinyl"]
+        books = sections["books"]
+        coffees = sections["coffee"]
+        coffee_brands = sections["coffeeBrands"]
+        figures = sections["figures"]
+        projects = sections["projects"]
+        publications = sections["publications"]
+        infographics = sections["infographics"]
+        plants = sections["plants"]
+        media_links = sections["mediaLinks"]
+        site_config = sections["siteConfig"]
+
+        site_config = site_config[0] if site_config else None
 
         # Build response structure
         result = {
@@ -86,6 +175,71 @@ class AllDataService:
 
         return result
 
+    async def load_section(self, section: str, fields: list[str] | None = None) -> list[dict]:
+        """Load one public section, optionally projected to the given output fields"""
+        repo_class, method = SECTION_LOADERS[section]
+        mapper_name, field_attributes = PUBLIC_SECTIONS[section]
+        mapper = getattr(self, mapper_name)
+        repo = repo_class(self.db)
+
+        if not fields:
+            records = await getattr(repo, method)(**SECTION_ORDER) or []
+            return [mapper(record) for record in records]
+
+        attributes = {field_attributes[field] for field in fields}
+        records = await repo.list_only(*attributes, **SECTION_ORDER)
+        return [
+            {field: mapped[field] for field in fields}
+            for mapped in (mapper(_PartialRow(record, attributes)) for record in records)
+        ]
+
+    async def _fetch_sequential(self) -> dict[str, list]:
+        """Load every section one after another on the request session"""
+        sections = {}
+        for name, (repo_class, method) in SECTION_LOADERS.items():
+            sections[name] = await getattr(repo_class(self.db), method)(**SECTION_ORDER) or []
+        return sections
+
+    async def _fetch_concurrent(self) -> dict[str, list]:
+        """Load every section at the same time, each on its own pooled connection.
+
+        Sections are read in separate transactions, so a write committed in
+        between may be visible in some of them; the data version bump of that
+        write makes the snapshot cache rebuild on the next check anyway.
+        """
+        results = await asyncio.gather(
+            *(
+                self._fetch_section(repo_class, method)
+                for repo_class, method in SECTION_LOADERS.values()
+            )
+        )
+        return dict(zip(SECTION_LOADERS, results))
+
+    async def _fetch_section(self, repo_class, method: str) -> list:
+        async with self.session_factory() as session:
+            return await getattr(repo_class(session), method)(**SECTION_ORDER) or []
+
+    @staticmethod
+    def empty_data() -> dict:
+        """Empty data structure that matches frontend expectations"""
+        return {
+            "about": {"bio": ""},
+            "vinylGenres": [],
+            "vinyl": [],
+            "books": [],
+            "coffeeBrands": [],
+            "coffee": [],
+            "figures": [],
+            "projects": [],
+            "publications": [],
+            "infographics": [],
+            "plants": [],
+            "media": {
+                "externalWishUrl": "",
+                "links": [],
+            },
+        }
+
     def _extract_vinyl_genres(self, vinyl_records) -> list[str]:
         """Extract unique genres from all vinyl records"""
         all_genres = set()
@@ -96,18 +250,19 @@ class AllDataService:
     def _map_vinyl(self, record) -> dict:
         """Map vinyl record to frontend format"""
         return {
-            "id": str(record.id),
+            "id": record.id,
             "artist": record.artist,
             "title": record.title,
             "year": record.year,
             "genres": record.genres or [],
             "photo_url": record.photo_url,
+            "photo_variants": record.photo_variants or [],
         }
 
     def _map_book(self, book) -> dict:
         """Map book to frontend format"""
         return {
-            "id": str(book.id),
+            "id": book.id,
             "title": book.title,
             "author": book.author,
             "genre": book.genre,
@@ -118,17 +273,19 @@ class AllDataService:
 
     def _map_coffee_brand(self, brand) -> dict:
         """Map coffee brand to frontend format"""
-        return {"id": str(brand.id), "name": brand.name}
+        return {"id": brand.id, "name": brand.name}
 
     def _map_coffee(self, coffee) -> dict:
         """Map coffee to frontend format"""
         return {
-            "id": str(coffee.id),
+            "id": coffee.id,
             "brandId": str(coffee.brand_id),
             "name": coffee.name,
             "region": coffee.region,
             "processing": coffee.processing,
-            "reviews": [self._map_coffee_review(review) for review in coffee.reviews],
+            "reviews": [
+                self._map_coffee_review(review) for review in coffee.reviews or []
+            ],
         }
 
     def _map_coffee_review(self, review) -> dict:
@@ -137,12 +294,12 @@ class AllDataService:
 
     def _map_figure(self, figure) -> dict:
         """Map figure to frontend format"""
-        return {"id": str(figure.id), "name": figure.name, "brand": figure.brand}
+        return {"id": figure.id, "name": figure.name, "brand": figure.brand}
 
     def _map_project(self, project) -> dict:
         """Map project to frontend format"""
         return {
-            "id": str(project.id),
+            "id": project.id,
             "name": project.name,
             "desc": project.description,
             "tags": project.tags or [],
@@ -151,7 +308,7 @@ class AllDataService:
     def _map_publication(self, publication) -> dict:
         """Map publication to frontend format"""
         return {
-            "id": str(publication.id),
+            "id": publication.id,
             "title": publication.title,
             "venue": publication.venue,
             "year": publication.year,
@@ -161,7 +318,7 @@ class AllDataService:
     def _map_infographic(self, infographic) -> dict:
         """Map infographic to frontend format"""
         return {
-            "id": str(infographic.id),
+            "id": infographic.id,
             "topic": infographic.topic,
             "title": infographic.title,
         }
@@ -169,7 +326,7 @@ class AllDataService:
     def _map_plant(self, plant) -> dict:
         """Map plant to frontend format"""
         return {
-            "id": str(plant.id),
+            "id": plant.id,
             "family": plant.family,
             "genus": plant.genus,
             "species": plant.species,
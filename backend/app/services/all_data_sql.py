@@ -0,0 +1,137 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Builds the whole frontend contract in one round-trip. Must stay in sync with
+# the _map_* methods of AllDataService: json_build_object keeps key order,
+# COLLATE "C" makes vinylGenres sort like Python's sorted(), and every list is
+# ordered oldest first like all_data.SECTION_ORDER.
+ALL_DATA_QUERY = text(
+    """
+    WITH cfg AS (
+        SELECT about_bio, external_wish_url FROM site_config
+        ORDER BY created_at, id
+        LIMIT 1
+    )
+    SELECT json_build_object(
+        'about', json_build_object(
+            'bio', COALESCE((SELECT about_bio FROM cfg), '')
+        ),
+        'vinylGenres', COALESCE((
+            SELECT json_agg(g.genre ORDER BY g.genre COLLATE "C")
+            FROM (SELECT DISTINCT unnest(genres) AS genre FROM vinyl_records) g
+        ), '[]'::json),
+        'vinyl', COALESCE((
+            SELECT json_agg(json_build_object(
+                'id', v.id::text,
+                'artist', v.artist,
+                'title', v.title,
+                'year', v.year,
+                'genres', COALESCE(to_json(v.genres), '[]'::json),
+                'photo_url', v.photo_url,
+                'photo_variants', COALESCE(v.photo_variants, '[]'::json)
+            ) ORDER BY v.created_at, v.id)
+            FROM vinyl_records v
+        ), '[]'::json),
+        'books', COALESCE((
+            SELECT json_agg(json_build_object(
+                'id', b.id::text,
+                'title', b.title,
+                'author', b.author,
+                'genre', b.genre,
+                'language', b.language,
+                'format', b.format,
+                'review', b.review
+            ) ORDER BY b.created_at, b.id)
+            FROM books b
+        ), '[]'::json),
+        'coffeeBrands', COALESCE((
+            SELECT json_agg(
+                json_build_object('id', cb.id::text, 'name', cb.name)
+                ORDER BY cb.created_at, cb.id
+            )
+            FROM coffee_brands cb
+        ), '[]'::json),
+        'coffee', COALESCE((
+            SELECT json_agg(json_build_object(
+                'id', c.id::text,
+                'brandId', c.brand_id::text,
+                'name', c.name,
+                'region', c.region,
+                'processing', c.processing,
+                'reviews', COALESCE((
+                    SELECT json_agg(json_build_object(
+                        'method', r.method,
+                        'rating', r.rating,
+                        'notes', r.notes
+                    ) ORDER BY r.created_at, r.id)
+                    FROM coffee_reviews r
+                    WHERE r.coffee_id = c.id
+                ), '[]'::json)
+            ) ORDER BY c.created_at, c.id)
+            FROM coffees c
+        ), '[]'::json),
+        'figures', COALESCE((
+            SELECT json_agg(json_build_object(
+                'id', f.id::text, 'name', f.name, 'brand', f.brand
+            ) ORDER BY f.created_at, f.id)
+            FROM figures f
+        ), '[]'::json),
+        'projects', COALESCE((
+            SELECT json_agg(json_build_object(
+                'id', p.id::text,
+                'name', p.name,
+                'desc', p.description,
+                'tags', COALESCE(to_json(p.tags), '[]'::json)
+            ) ORDER BY p.created_at, p.id)
+            FROM projects p
+        ), '[]'::json),
+        'publications', COALESCE((
+            SELECT json_agg(json_build_object(
+                'id', pub.id::text,
+                'title', pub.title,
+                'venue', pub.venue,
+                'year', pub.year,
+                'url', pub.url
+            ) ORDER BY pub.created_at, pub.id)
+            FROM publications pub
+        ), '[]'::json),
+        'infographics', COALESCE((
+            SELECT json_agg(json_build_object(
+                'id', i.id::text, 'topic', i.topic, 'title', i.title
+            ) ORDER BY i.created_at, i.id)
+            FROM infographics i
+        ), '[]'::json),
+        'plants', COALESCE((
+            SELECT json_agg(json_build_object(
+                'id', pl.id::text,
+                'family', pl.family,
+                'genus', pl.genus,
+                'species', pl.species,
+                'commonName', pl.common_name
+            ) ORDER BY pl.created_at, pl.id)
+            FROM plants pl
+        ), '[]'::json),
+        'media', json_build_object(
+            'externalWishUrl', COALESCE((SELECT external_wish_url FROM cfg), ''),
+            'links', COALESCE((
+                SELECT json_agg(json_build_object(
+                    'type', m.type, 'label', m.label, 'value', m.value
+                ) ORDER BY m.created_at, m.id)
+                FROM media_links m
+            ), '[]'::json)
+        )
+    )::text
+    """
+)
+
+
+class AllDataSqlService:
+    """Builds the /v1/all payload inside PostgreSQL, skipping ORM hydration"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def load_all_data_json(self) -> bytes:
+        """Serialized payload, semantically identical to AllDataService output"""
+        result = await self.db.execute(ALL_DATA_QUERY)
+        return result.scalar_one().encode("utf-8")
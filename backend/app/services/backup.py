@@ -0,0 +1,212 @@
+"""Streaming backup and restore of every collection table.
+
+A backup is a gzip-compressed JSON Lines file:
+
+    {"format": "my_easy_site-backup", "version": 1, "created_at": ..., "data_version": 42}
+    {"table": "coffee_brands", "columns": ["name", "id", "created_at", "updated_at"]}
+    ["Tasty Coffee", "5b0c...", "2026-10-17T12:00:00+00:00", null]
+    ...
+
+Each table starts with a header line naming its columns, followed by one
+JSON array per row. Tables come in foreign key order, so the file can be
+restored front to back.
+
+Export reads every table through a server-side cursor inside one
+REPEATABLE READ transaction: memory stays constant and all tables come
+from the same snapshot. Restore bulk-loads rows with COPY in batches.
+"""
+
+import datetime
+import gzip
+import json
+import uuid
+from dataclasses import dataclass, field
+from typing import IO, Any, Callable, Iterator
+
+from sqlalchemy import JSON, Date, DateTime, Table, exists, select, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Base
+from app.models.data_version import DataVersion
+from app.repositories.data_version import DataVersionRepository
+
+BACKUP_FORMAT = "my_easy_site-backup"
+BACKUP_VERSION = 1
+
+# Rows fetched per round-trip of the server-side cursor
+EXPORT_BATCH_SIZE = 1000
+# Rows sent per COPY during restore
+RESTORE_BATCH_SIZE = 5000
+GZIP_LEVEL = 6
+
+
+@dataclass
+class BackupStats:
+    data_version: int = 0
+    rows: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return sum(self.rows.values())
+
+
+def backup_tables() -> list[Table]:
+    """Tables in a backup, parents before children.
+
+    data_version is left out: a restore bumps it instead so that caches
+    keyed by it are invalidated.
+    """
+    return [
+        table
+        for table in Base.metadata.sorted_tables
+        if table is not DataVersion.__table__
+    ]
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _line(value: Any) -> bytes:
+    return (
+        json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=_default)
+        + "\n"
+    ).encode("utf-8")
+
+
+async def export_backup(db: AsyncSession, output: IO[bytes]) -> BackupStats:
+    """Stream every table into ``output`` as gzip-compressed JSON Lines"""
+    # Must be the first statement of the session's transaction
+    await db.connection(
+        execution_options={"isolation_level": "REPEATABLE READ", "postgresql_readonly": True}
+    )
+    stats = BackupStats(data_version=await DataVersionRepository(db).get())
+
+    with gzip.GzipFile(fileobj=output, mode="wb", compresslevel=GZIP_LEVEL) as archive:
+        archive.write(_line({
+            "format": BACKUP_FORMAT,
+            "version": BACKUP_VERSION,
+            "created_at": datetime.datetime.now(datetime.timezone.utc),
+            "data_version": stats.data_version,
+        }))
+
+        for table in backup_tables():
+            columns = [column.name for column in table.columns]
+            archive.write(_line({"table": table.name, "columns": columns}))
+
+            count = 0
+            result = await db.stream(
+                select(table),
+                execution_options={"yield_per": EXPORT_BATCH_SIZE},
+            )
+            async for partition in result.partitions():
+                archive.write(b"".join(_line(list(row)) for row in partition))
+                count += len(partition)
+            stats.rows[table.name] = count
+
+    return stats
+
+
+def _decoder(column) -> Callable[[Any], Any]:
+    """Convert a JSON value back into what asyncpg's COPY expects for the column"""
+    column_type = column.type
+    if isinstance(column_type, UUID):
+        return lambda value: uuid.UUID(value) if value is not None else None
+    if isinstance(column_type, DateTime):
+        return lambda value: datetime.datetime.fromisoformat(value) if value is not None else None
+    if isinstance(column_type, Date):
+        return lambda value: datetime.date.fromisoformat(value) if value is not None else None
+    if isinstance(column_type, JSON):
+        # json columns travel as text; JSON null is stored as SQL NULL
+        return lambda value: json.dumps(value, ensure_ascii=False) if value is not None else None
+    return lambda value: value
+
+
+def _read_lines(archive: IO[bytes]) -> Iterator[Any]:
+    for number, line in enumerate(archive, 1):
+        if line.strip():
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Line {number}: invalid JSON ({e})") from e
+
+
+async def restore_backup(
+    db: AsyncSession, source: IO[bytes], truncate: bool = False
+) -> BackupStats:
+    """Load a backup written by export_backup with COPY, in the caller's transaction.
+
+    The target tables must be empty unless ``truncate`` is set, in which
+    case they are emptied first. Columns missing from the current schema
+    are dropped; columns missing from the backup get their defaults.
+    """
+    tables = {table.name: table for table in backup_tables()}
+
+    if truncate:
+        names = ", ".join(f'"{name}"' for name in tables)
+        await db.execute(text(f"TRUNCATE {names} CASCADE"))
+    else:
+        for table in tables.values():
+            if await db.scalar(select(exists().select_from(table))):
+                raise ValueError(
+                    f"Table {table.name} is not empty; restore with truncate to replace the data"
+                )
+
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver = raw_connection.driver_connection
+
+    stats = BackupStats()
+    with gzip.GzipFile(fileobj=source, mode="rb") as archive:
+        lines = _read_lines(archive)
+        header = next(lines, None)
+        if not isinstance(header, dict) or header.get("format") != BACKUP_FORMAT:
+            raise ValueError("Not a backup file")
+        if header.get("version") != BACKUP_VERSION:
+            raise ValueError(f"Unsupported backup version: {header.get('version')}")
+        stats.data_version = header.get("data_version", 0)
+
+        table = None
+        for line in lines:
+            if isinstance(line, dict):
+                if table is not None:
+                    await _copy(driver, table, columns, batch)
+                table = tables.get(line.get("table"))
+                if table is None:
+                    raise ValueError(f"Unknown table in backup: {line.get('table')}")
+                # Keep only columns the current schema still has
+                positions = [
+                    (index, table.columns[name])
+                    for index, name in enumerate(line["columns"])
+                    if name in table.columns
+                ]
+                columns = [column.name for _, column in positions]
+                decoders = [(index, _decoder(column)) for index, column in positions]
+                batch = []
+                stats.rows[table.name] = 0
+                continue
+
+            if table is None:
+                raise ValueError("Row before the first table header")
+            batch.append(tuple(decode(line[index]) for index, decode in decoders))
+            stats.rows[table.name] += 1
+            if len(batch) >= RESTORE_BATCH_SIZE:
+                await _copy(driver, table, columns, batch)
+                batch = []
+
+        if table is not None:
+            await _copy(driver, table, columns, batch)
+
+    # Invalidate every cache keyed by the data version (snapshots, bot statistics)
+    await DataVersionRepository(db).bump()
+    return stats
+
+
+async def _copy(driver, table: Table, columns: list[str], batch: list[tuple]) -> None:
+    if batch:
+        await driver.copy_records_to_table(table.name, records=batch, columns=columns)
@@ -0,0 +1,175 @@
+import asyncio
+import gzip
+import hashlib
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import brotli
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.data_version import DataVersionRepository
+from app.services.all_data import AllDataService
+from app.services.all_data_sql import AllDataSqlService
+from app.settings import settings
+from app.utils.metrics import SNAPSHOT_CACHE_LOOKUPS
+from app.utils.serialization import dumps
+
+ENGINE_ORM = "orm"
+ENGINE_SQL = "sql"
+
+
+async def render_all_data(db: AsyncSession, engine: str | None = None) -> bytes:
+    """Serialized /v1/all payload from the configured engine; errors propagate"""
+    engine = engine or settings.all_data_engine
+    if engine == ENGINE_SQL:
+        return await AllDataSqlService(db).load_all_data_json()
+    return dumps(await AllDataService(db).load_all_data())
+
+
+# Bodies smaller than this are not worth compressing (same as nginx gzip_min_length)
+MIN_COMPRESS_SIZE = 1024
+
+
+def compress_variants(body: bytes) -> dict[str, bytes]:
+    """Content-Encoding -> compressed body, computed once per snapshot"""
+    if len(body) < MIN_COMPRESS_SIZE:
+        return {}
+    return {
+        "br": brotli.compress(body, quality=settings.snapshot_brotli_quality),
+        # mtime=0 keeps the output identical across workers
+        "gzip": gzip.compress(body, compresslevel=settings.snapshot_gzip_level, mtime=0),
+    }
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Serialized /v1/all payload with its HTTP validators"""
+
+    body: bytes
+    etag: str
+    last_modified: datetime | None = None
+    version: int | None = None
+    encodings: dict[str, bytes] = field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls,
+        body: bytes,
+        last_modified: datetime | None = None,
+        version: int | None = None,
+        encodings: dict[str, bytes] | None = None,
+    ) -> "Snapshot":
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        return cls(
+            body=body,
+            etag=etag,
+            last_modified=last_modified,
+            version=version,
+            encodings=encodings or {},
+        )
+
+    def etag_for(self, encoding: str | None) -> str:
+        """Strong validators must differ between content-codings"""
+        if encoding is None:
+            return self.etag
+        return f'{self.etag[:-1]}-{encoding}"'
+
+
+async def build_snapshot(
+    db: AsyncSession, version: int | None = None, precompress: bool = False
+) -> Snapshot:
+    """Render the payload and its Last-Modified; errors propagate"""
+    body = await render_all_data(db)
+    last_modified = await DataVersionRepository(db).last_modified()
+    encodings = None
+    if precompress:
+        # brotli at high quality takes a while on large payloads
+        encodings = await asyncio.to_thread(compress_variants, body)
+    return Snapshot.build(
+        body, last_modified=last_modified, version=version, encodings=encodings
+    )
+
+
+def empty_snapshot() -> Snapshot:
+    return Snapshot.build(dumps(AllDataService.empty_data()))
+
+
+class SnapshotCache:
+    """Process-local cache of the serialized /v1/all payload.
+
+    The snapshot is keyed by the global data version that every
+    BaseRepository write bumps, so edits made from the Telegram bot
+    invalidate it in all uvicorn workers. The version itself is only
+    re-read once per ``check_interval`` seconds.
+    """
+
+    def __init__(self, enabled: bool = True, check_interval: float = 1.0):
+        self.enabled = enabled
+        self.check_interval = check_interval
+        self.snapshot: Snapshot | None = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def invalidate(self) -> None:
+        self.snapshot = None
+        self._checked_at = 0.0
+
+    def _is_fresh(self) -> bool:
+        return (
+            self.snapshot is not None
+            and time.monotonic() - self._checked_at < self.check_interval
+        )
+
+    async def get(self, db: AsyncSession) -> Snapshot:
+        """Return the current snapshot, rebuilding it if the data changed"""
+        if not self.enabled:
+            SNAPSHOT_CACHE_LOOKUPS.labels("bypass").inc()
+            try:
+                return await build_snapshot(db)
+            except Exception as e:
+                print(f"Error fetching data: {e}")
+                return empty_snapshot()
+
+        if self._is_fresh():
+            SNAPSHOT_CACHE_LOOKUPS.labels("hit").inc()
+            return self.snapshot
+
+        async with self._lock:
+            # Another request may have refreshed the snapshot while we waited
+            if self._is_fresh():
+                SNAPSHOT_CACHE_LOOKUPS.labels("hit").inc()
+                return self.snapshot
+
+            try:
+                # Read the version before the data: a write that lands in between
+                # only causes one extra rebuild on the next check
+                version = await DataVersionRepository(db).get()
+                if self.snapshot is not None and version == self.snapshot.version:
+                    SNAPSHOT_CACHE_LOOKUPS.labels("revalidated").inc()
+                    self._checked_at = time.monotonic()
+                    return self.snapshot
+
+                snapshot = await build_snapshot(
+                    db, version=version, precompress=settings.snapshot_precompress
+                )
+            except Exception as e:
+                print(f"Error fetching data: {e}")
+                if self.snapshot is not None:
+                    # Serve the stale snapshot rather than an empty page
+                    SNAPSHOT_CACHE_LOOKUPS.labels("stale").inc()
+                    return self.snapshot
+                SNAPSHOT_CACHE_LOOKUPS.labels("empty").inc()
+                return empty_snapshot()
+
+            SNAPSHOT_CACHE_LOOKUPS.labels("rebuilt").inc()
+            self.snapshot = snapshot
+            self._checked_at = time.monotonic()
+            return self.snapshot
+
+
+snapshot_cache = SnapshotCache(
+    enabled=settings.snapshot_cache_enabled,
+    check_interval=settings.snapshot_check_interval,
+)
@@ -0,0 +1,76 @@
+import asyncio
+import gzip
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.data_version import DataVersionRepository
+from app.services.snapshot import MIN_COMPRESS_SIZE, build_snapshot
+from app.settings import settings
+from app.utils.http import http_date
+from app.utils.serialization import dumps
+
+MANIFEST_NAME = "manifest.json"
+SNAPSHOT_PREFIX = "all."
+# Older files stay around so pages that already read the manifest can finish loading
+KEEP_SNAPSHOTS = 3
+# Precompressed copy picked up by nginx gzip_static. The stock nginx image
+# has no brotli_static, so no .br file is written
+GZIP_SUFFIX = ".gz"
+# Also removed when pruning: older exports wrote .br files
+STALE_SUFFIXES = ("", GZIP_SUFFIX, ".br")
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _prune(output_dir: Path, current: str) -> None:
+    snapshots = sorted(
+        output_dir.glob(f"{SNAPSHOT_PREFIX}*.json"),
+        key=lambda path: path.stat().st_mtime,
+        reverse=True,
+    )
+    for path in [p for p in snapshots if p.name != current][KEEP_SNAPSHOTS - 1:]:
+        for suffix in STALE_SUFFIXES:
+            path.with_name(path.name + suffix).unlink(missing_ok=True)
+
+
+async def export_snapshot(db: AsyncSession, output_dir: Path) -> dict:
+    """Write the current /v1/all payload as a content-hashed static file.
+
+    The payload goes to all.<hash>.json (plus a .gz copy) and
+    manifest.json is replaced last to point at it, so readers never see
+    a partially written snapshot. Returns the manifest.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    version = await DataVersionRepository(db).get()
+    snapshot = await build_snapshot(db, version=version)
+
+    digest = snapshot.etag.strip('"')[:16]
+    name = f"{SNAPSHOT_PREFIX}{digest}.json"
+    path = output_dir / name
+    _write_atomic(path, snapshot.body)
+    if len(snapshot.body) >= MIN_COMPRESS_SIZE:
+        compressed = await asyncio.to_thread(
+            gzip.compress, snapshot.body, settings.snapshot_gzip_level, mtime=0
+        )
+        _write_atomic(path.with_name(name + GZIP_SUFFIX), compressed)
+
+    manifest = {
+        "version": version,
+        "file": name,
+        "etag": snapshot.etag,
+        "lastModified": (
+            http_date(snapshot.last_modified) if snapshot.last_modified else None
+        ),
+        "generatedAt": datetime.now(timezone.utc).isoformat(),
+    }
+    _write_atomic(output_dir / MANIFEST_NAME, dumps(manifest))
+    _prune(output_dir, current=name)
+    return manifest
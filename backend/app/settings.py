@@ -5,6 +5,49 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     database_url: str = ""
 
+    # Connection pool (per uvicorn worker)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0  # Seconds to wait for a free connection
+    db_pool_recycle: int = 1800  # Seconds before a connection is replaced
+    db_pool_pre_ping: bool = True
+    db_statement_timeout_ms: int = 5000  # 0 disables the server-side timeout
+    db_prepared_statement_cache_size: int = 100
+    db_echo: bool = False  # Log every statement; for local debugging only
+
+    # Slow query log: statements slower than the threshold, sampled
+    slow_query_threshold_ms: float = 200.0  # 0 disables the log
+    slow_query_sample_rate: float = 1.0
+
+    # Report statements per request in an X-DB-Query-Count header; for benchmarks
+    db_query_count_header: bool = False
+
+    # Prometheus metrics at /metrics (see app/utils/metrics.py)
+    metrics_enabled: bool = True
+
+    # Snapshot cache for GET /v1/all
+    snapshot_cache_enabled: bool = True
+    snapshot_check_interval: float = 1.0  # Seconds between data version checks
+    snapshot_precompress: bool = True  # Keep gzip and brotli variants of each snapshot
+    snapshot_gzip_level: int = 9
+    snapshot_brotli_quality: int = 11
+
+    # How AllDataService loads sections: "sequential" or "concurrent"
+    all_data_fetch_mode: str = "sequential"
+
+    # Engine building the /v1/all payload: "orm" (AllDataService) or "sql"
+    # (single json_build_object query in PostgreSQL)
+    all_data_engine: str = "orm"
+
+    # Clients keep /v1/all but revalidate it with If-None-Match on every load
+    all_data_cache_control: str = "public, no-cache"
+
+    # Directory export_snapshot.py writes the static /v1/all snapshot to
+    static_snapshot_dir: str = "static-data"
+
+    # JSON serializer for API responses: "stdlib" or "orjson"
+    json_backend: str = "stdlib"
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if not self.database_url:
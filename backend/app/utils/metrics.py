@@ -0,0 +1,172 @@
+"""Prometheus metrics of the API, served at /metrics.
+
+startup.sh runs four uvicorn workers, each with its own memory, so it sets
+PROMETHEUS_MULTIPROC_DIR: prometheus_client then keeps samples in
+per-process files in that directory and /metrics aggregates all of them
+with MultiProcessCollector. Without the variable (a single local process)
+the default in-process registry is used.
+
+Per repository method, db_query_duration_seconds counts statements
+(``_count``) and their total time (``_sum``); the method is the one marked
+with @query_source that issued the statement.
+"""
+
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.utils.query_log import current_query_source
+
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+METRICS_PATH = "/metrics"
+
+# Anything else is reported as "other" to keep label cardinality bounded
+KNOWN_METHODS = {"GET", "HEAD", "OPTIONS", "POST", "PUT", "PATCH", "DELETE"}
+
+DB_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being served",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "HTTP response body size, after compression",
+    ["route"],
+    buckets=SIZE_BUCKETS,
+)
+POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a connection from the pool",
+    buckets=DB_BUCKETS,
+)
+QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "SQL statement duration by repository method",
+    ["source"],
+    buckets=DB_BUCKETS,
+)
+SNAPSHOT_CACHE_LOOKUPS = Counter(
+    "snapshot_cache_lookups_total",
+    "/v1/all snapshot cache lookups: hit, revalidated, rebuilt, stale, empty or bypass",
+    ["result"],
+)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool recording how long each checkout waits for a connection,
+    including the time to open a new one
+    """
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+
+
+def install_query_metrics(engine: Engine) -> None:
+    """Record the duration of every statement under its repository method"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("metrics_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started_at = conn.info["metrics_started_at"].pop()
+        QUERY_DURATION.labels(current_query_source()).observe(
+            time.perf_counter() - started_at
+        )
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(context):
+        # Keep the timing stack balanced when a statement fails
+        if context.connection is None:
+            return
+        started = context.connection.info.get("metrics_started_at")
+        if started:
+            started.pop()
+
+
+def _route(scope) -> str:
+    # FastAPI stores the matched route in the scope; unmatched paths share one label
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency, in-flight requests and response
+    sizes per route template
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] == METRICS_PATH:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"] if scope["method"] in KNOWN_METHODS else "other"
+        status_code = 500
+        size = 0
+
+        async def send_with_metrics(message):
+            nonlocal status_code, size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        in_progress = REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            in_progress.dec()
+            route = _route(scope)
+            REQUEST_DURATION.labels(method, route, str(status_code)).observe(
+                time.perf_counter() - started
+            )
+            RESPONSE_SIZE.labels(route).observe(size)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Metrics of every worker in the Prometheus text format, and its content type"""
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """Drop this worker's live gauges from the aggregate when it exits"""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,132 @@
+import functools
+import json
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger("app.db.slow_query")
+
+MAX_STATEMENT_LENGTH = 1000
+
+QUERY_COUNT_HEADER = b"x-db-query-count"
+
+# Statement counter of the current request, set by count_queries()
+_query_counter: ContextVar[list[int] | None] = ContextVar("query_counter", default=None)
+
+# "<Repository>.<method>" issuing the current statements, set by @query_source
+_query_source: ContextVar[str] = ContextVar("query_source", default="other")
+
+
+def current_query_source() -> str:
+    return _query_source.get()
+
+
+def query_source(method):
+    """Attribute statements of a repository method to "<Repository>.<method>" """
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        token = _query_source.set(f"{type(self).__name__}.{method.__name__}")
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            _query_source.reset(token)
+
+    return wrapper
+
+
+def install_slow_query_log(
+    engine: Engine, threshold_ms: float, sample_rate: float = 1.0
+) -> None:
+    """Log statements slower than threshold_ms as one JSON object per line.
+
+    Only a sample_rate fraction of slow statements is logged, to keep the
+    log cheap under load. Parameters are never logged.
+    """
+    if threshold_ms <= 0 or sample_rate <= 0:
+        return
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started_at = conn.info["query_started_at"].pop()
+        duration_ms = (time.perf_counter() - started_at) * 1000
+        if duration_ms < threshold_ms or random.random() >= sample_rate:
+            return
+
+        logger.warning(
+            json.dumps(
+                {
+                    "event": "slow_query",
+                    "duration_ms": round(duration_ms, 2),
+                    "threshold_ms": threshold_ms,
+                    "rowcount": cursor.rowcount,
+                    "executemany": executemany,
+                    "statement": " ".join(statement.split())[:MAX_STATEMENT_LENGTH],
+                },
+                ensure_ascii=False,
+            )
+        )
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(context):
+        # Keep the timing stack balanced when a statement fails
+        if context.connection is None:
+            return
+        started = context.connection.info.get("query_started_at")
+        if started:
+            started.pop()
+
+
+def install_query_counter(engine: Engine) -> None:
+    """Count statements executed inside count_queries() blocks"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count_query(conn, cursor, statement, parameters, context, executemany):
+        counter = _query_counter.get()
+        if counter is not None:
+            counter[0] += 1
+
+
+@contextmanager
+def count_queries() -> Iterator[list[int]]:
+    """Count statements of this context (and tasks it starts) in ``counter[0]``"""
+    counter = [0]
+    token = _query_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _query_counter.reset(token)
+
+
+class QueryCountMiddleware:
+    """ASGI middleware reporting the number of statements per request in a
+    X-DB-Query-Count header; needs install_query_counter on the engine.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with count_queries() as counter:
+            async def send_with_count(message):
+                if message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    headers.append((QUERY_COUNT_HEADER, str(counter[0]).encode()))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_with_count)
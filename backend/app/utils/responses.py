@@ -0,0 +1,18 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from app.utils.serialization import dumps
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse that serializes with the configured JSON backend.
+
+    Pre-encoded bytes (e.g. a cached snapshot) are sent unchanged. Return an
+    instance directly from a route to also skip FastAPI's jsonable_encoder.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
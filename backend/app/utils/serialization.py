@@ -0,0 +1,34 @@
+import json
+import uuid
+
+import orjson
+
+from app.settings import settings
+
+JSON_BACKEND_STDLIB = "stdlib"
+JSON_BACKEND_ORJSON = "orjson"
+
+
+def _default(value):
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(data) -> bytes:
+    """Serialize to compact UTF-8 JSON with the configured backend.
+
+    Both backends produce the same bytes as FastAPI's JSONResponse and
+    write UUIDs in their canonical string form, so mappers can return
+    them as-is.
+    """
+    if settings.json_backend == JSON_BACKEND_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(
+        data,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+        default=_default,
+    ).encode("utf-8")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Back up every collection to gzip-compressed JSON Lines, or restore a backup.
+
+    python backup.py export                        # backup-<timestamp>.jsonl.gz
+    python backup.py export -o - > backup.jsonl.gz
+    python backup.py restore backup.jsonl.gz       # into empty tables
+    python backup.py restore backup.jsonl.gz --truncate
+
+Export streams each table through a server-side cursor, so memory stays
+constant however large the tables are. Restore loads rows with COPY in a
+single transaction: a failed restore leaves the database untouched.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from datetime import datetime, timezone
+
+from app.db import AsyncSessionLocal, engine
+from app.services.backup import export_backup, restore_backup
+
+
+def _print_stats(stats) -> None:
+    for table, count in stats.rows.items():
+        print(f"   {table}: {count}", file=sys.stderr)
+
+
+async def export(output_path: str) -> int:
+    if output_path == "-":
+        output, close = sys.stdout.buffer, False
+    else:
+        # Written under a temporary name so an interrupted export is never mistaken for a backup
+        tmp_path = f"{output_path}.tmp"
+        output, close = open(tmp_path, "wb"), True
+
+    try:
+        async with AsyncSessionLocal() as db:
+            stats = await export_backup(db, output)
+    except Exception as e:
+        print(f"❌ Export failed: {e}", file=sys.stderr)
+        if close:
+            output.close()
+            os.unlink(tmp_path)
+        return 1
+
+    if close:
+        output.close()
+        os.replace(tmp_path, output_path)
+    print(
+        f"✅ Exported {stats.total} rows (data version {stats.data_version}) to {output_path}",
+        file=sys.stderr,
+    )
+    _print_stats(stats)
+    return 0
+
+
+async def restore(input_path: str, truncate: bool) -> int:
+    try:
+        with open(input_path, "rb") as source:
+            async with AsyncSessionLocal() as db:
+                stats = await restore_backup(db, source, truncate=truncate)
+                await db.commit()
+    except Exception as e:
+        print(f"❌ Restore failed, nothing was changed: {e}", file=sys.stderr)
+        return 1
+
+    print(
+        f"✅ Restored {stats.total} rows (data version {stats.data_version} at export)",
+        file=sys.stderr,
+    )
+    _print_stats(stats)
+    return 0
+
+
+async def main(args) -> int:
+    try:
+        if args.command == "export":
+            return await export(args.output)
+        return await restore(args.input, args.truncate)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = commands.add_parser("export", help="write a backup")
+    export_parser.add_argument(
+        "-o", "--output",
+        default=f"backup-{datetime.now(timezone.utc):%Y%m%d-%H%M%S}.jsonl.gz",
+        help="output file, or - for stdout",
+    )
+
+    restore_parser = commands.add_parser("restore", help="load a backup with COPY")
+    restore_parser.add_argument("input")
+    restore_parser.add_argument(
+        "--truncate", action="store_true", help="replace existing data instead of requiring empty tables"
+    )
+
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,4 @@
+"""
+Benchmark scripts for the backend, run from the backend directory:
+python -m benchmarks.<name>
+"""
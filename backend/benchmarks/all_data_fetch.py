@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmark sequential vs concurrent section loading in AllDataService
+Run against a seeded database (python seed_db.py) from the backend directory:
+    python -m benchmarks.all_data_fetch --iterations 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.db import AsyncSessionLocal, engine
+from app.services.all_data import FETCH_CONCURRENT, FETCH_SEQUENTIAL, AllDataService
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+async def measure(fetch_mode: str, iterations: int, warmup: int) -> list[float]:
+    """Return per-call latencies of load_all_data in milliseconds"""
+    samples = []
+    for i in range(warmup + iterations):
+        async with AsyncSessionLocal() as session:
+            service = AllDataService(session)
+            started = time.perf_counter()
+            await service.load_all_data(fetch_mode=fetch_mode)
+            elapsed = (time.perf_counter() - started) * 1000
+        if i >= warmup:
+            samples.append(elapsed)
+    return samples
+
+
+async def run(iterations: int, warmup: int) -> None:
+    print("⏱️  AllDataService fetch benchmark")
+    print("=" * 50)
+
+    results = {}
+    for fetch_mode in (FETCH_SEQUENTIAL, FETCH_CONCURRENT):
+        samples = await measure(fetch_mode, iterations, warmup)
+        results[fetch_mode] = samples
+        print(
+            f"   {fetch_mode:<10} "
+            f"mean {statistics.mean(samples):7.2f} ms  "
+            f"p50 {percentile(samples, 50):7.2f} ms  "
+            f"p95 {percentile(samples, 95):7.2f} ms"
+        )
+
+    speedup = statistics.mean(results[FETCH_SEQUENTIAL]) / statistics.mean(
+        results[FETCH_CONCURRENT]
+    )
+    print("=" * 50)
+    print(f"   Concurrent speedup: {speedup:.2f}x")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.iterations, args.warmup))
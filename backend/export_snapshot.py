@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Export the /v1/all payload as a static, content-hashed JSON file for nginx.
+
+    python export_snapshot.py                 # export once
+    python export_snapshot.py --watch         # re-export whenever data changes
+
+Watch mode LISTENs for the NOTIFY sent by every repository write (the
+Telegram bot included) and also polls the data version as a fallback.
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from app.db import AsyncSessionLocal, engine
+from app.repositories.data_version import DATA_VERSION_CHANNEL, DataVersionRepository
+from app.services.static_export import export_snapshot
+from app.settings import settings
+
+
+async def export_once(output_dir: Path) -> bool:
+    try:
+        async with AsyncSessionLocal() as db:
+            manifest = await export_snapshot(db, output_dir)
+    except Exception as e:
+        print(f"❌ Snapshot export failed: {e}")
+        return False
+
+    print(f"✅ Exported data version {manifest['version']} to {output_dir / manifest['file']}")
+    return True
+
+
+async def watch(output_dir: Path, poll_interval: float) -> None:
+    changed = asyncio.Event()
+    exported_version = None
+
+    async with engine.connect() as conn:
+        raw_connection = await conn.get_raw_connection()
+        await raw_connection.driver_connection.add_listener(
+            DATA_VERSION_CHANNEL, lambda *args: changed.set()
+        )
+        print(f"👀 Watching for data changes (poll every {poll_interval:g}s)...")
+
+        while True:
+            changed.clear()
+            try:
+                async with AsyncSessionLocal() as db:
+                    version = await DataVersionRepository(db).get()
+            except Exception as e:
+                print(f"❌ Failed to read data version: {e}")
+                version = None
+
+            if version is not None and version != exported_version:
+                if await export_once(output_dir):
+                    exported_version = version
+
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+async def main(args) -> int:
+    output_dir = Path(args.output_dir)
+    try:
+        if args.watch:
+            await watch(output_dir, args.poll_interval)
+            return 0
+        return 0 if await export_once(output_dir) else 1
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output-dir", default=settings.static_snapshot_dir)
+    parser.add_argument("--watch", action="store_true")
+    parser.add_argument("--poll-interval", type=float, default=30.0)
+    args = parser.parse_args()
+
+    try:
+        sys.exit(asyncio.run(main(args)))
+    except KeyboardInterrupt:
+        print("\n⏹️ Export watcher stopped")
@@ -1,9 +1,24 @@
+"""
+Create tables and seed the database with a small demo dataset.
+
+    python seed_db.py                                  # demo data, once
+    python seed_db.py --synthetic 100000               # + 100k rows per collection
+    python seed_db.py --synthetic 100000 --seed 2      # add another 100k with new ids
+
+Synthetic mode generates vinyl, books, coffees with reviews and plants with
+photo galleries for benchmarks and loads them with COPY
+(see benchmarks/synthetic_data.py).
+"""
+
+import argparse
 import asyncio
 import os
+import time
 
 from app.models.books import Book
 from app.models.coffee import Coffee, CoffeeBrand, CoffeeReview
 from app.models.common import Base
+from app.models.data_version import DataVersion  # noqa: F401
 from app.models.figures import Figure
 from app.models.media import MediaLink, SiteConfig
 from app.models.plants import Plant
@@ -292,10 +307,38 @@ async def seed_data():
         print("Database seeded successfully!")
 
 
-async def main():
+async def seed_synthetic(rows: int, seed: int):
+    from benchmarks.synthetic_data import load_synthetic_data
+
+    counts = {"vinyl": rows, "books": rows, "coffees": rows, "plants": rows}
+    started = time.perf_counter()
+
+    def progress(table: str, count: int):
+        print(f"   {table}: {count} rows ({time.perf_counter() - started:.1f}s)")
+
+    async with AsyncSessionLocal() as session:
+        stats = await load_synthetic_data(session, counts, seed=seed, progress=progress)
+        await session.commit()
+    print(f"Synthetic data loaded: {stats.total} rows in {time.perf_counter() - started:.1f}s")
+
+
+async def main(args):
     await create_tables()
     await seed_data()
+    if args.synthetic:
+        await seed_synthetic(args.synthetic, args.seed)
+    await engine.dispose()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--synthetic", type=int, default=0, metavar="ROWS",
+        help="also COPY this many synthetic rows into each collection",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="random seed of the synthetic data"
+    )
+    asyncio.run(main(parser.parse_args()))
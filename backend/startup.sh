@@ -43,8 +43,17 @@ if not asyncio.run(setup_database()):
   sleep 3
 done
 
+echo "🧱 Applying database migrations..."
+alembic upgrade head
+
 echo "🗃️  Database is ready! Creating tables and seeding data..."
 python seed_db.py
 
+# Workers share Prometheus metrics through per-process files in this
+# directory (see app/utils/metrics.py); stale files of a previous run are dropped
+export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus-metrics}"
+rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
 echo "🚀 Starting application..."
 exec uvicorn app.main:app --host 0.0.0.0 --port 8000 --workers 4
\ No newline at end of file
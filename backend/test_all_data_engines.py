@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Diff test: the PostgreSQL JSON engine must return the same /v1/all contract
+as the ORM engine. Run against a seeded database from the backend directory:
+    python test_all_data_engines.py
+"""
+
+import asyncio
+import json
+
+from app.db import AsyncSessionLocal, engine
+from app.services.snapshot import ENGINE_ORM, ENGINE_SQL, render_all_data
+
+
+def diff(expected, actual, path="$") -> list[str]:
+    """Return human-readable differences between two JSON documents.
+
+    Arrays are compared by position: both engines order every list oldest
+    first (all_data.SECTION_ORDER), so equal data gives equal order.
+    """
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        problems = []
+        if list(expected) != list(actual):
+            problems.append(f"{path}: keys {list(expected)} != {list(actual)}")
+        for key in expected:
+            if key in actual:
+                problems.extend(diff(expected[key], actual[key], f"{path}.{key}"))
+        return problems
+
+    if isinstance(expected, list) and isinstance(actual, list):
+        if len(expected) != len(actual):
+            return [f"{path}: length {len(expected)} != {len(actual)}"]
+        problems = []
+        for i, (left, right) in enumerate(zip(expected, actual)):
+            problems.extend(diff(left, right, f"{path}[{i}]"))
+        return problems
+
+    if expected != actual:
+        return [f"{path}: {expected!r} != {actual!r}"]
+    return []
+
+
+async def test_engines_match():
+    """Compare ORM and SQL engine output on the current database"""
+
+    print("🧪 Comparing /v1/all engines...")
+    print("=" * 50)
+
+    async with AsyncSessionLocal() as session:
+        orm_data = json.loads(await render_all_data(session, engine=ENGINE_ORM))
+        sql_data = json.loads(await render_all_data(session, engine=ENGINE_SQL))
+
+    await engine.dispose()
+
+    problems = diff(orm_data, sql_data)
+    for section, value in orm_data.items():
+        size = len(value) if isinstance(value, list) else "-"
+        print(f"   {section}: {size}")
+
+    print("=" * 50)
+    if problems:
+        print(f"❌ {len(problems)} difference(s) found:")
+        for problem in problems[:50]:
+            print(f"   {problem}")
+        return False
+
+    print("✅ Engines produce identical output.")
+    return True
+
+
+if __name__ == "__main__":
+    result = asyncio.run(test_engines_match())
+    exit(0 if result else 1)
@@ -7,9 +7,32 @@
 
   // API configuration
   const API_BASE = '/api/v1';
+  // Static snapshot of /v1/all exported by the backend
+  const STATIC_DATA_BASE = '/data';
+
+  // Load data from the static snapshot, API is the fallback
+  async function loadStaticData() {
+    const manifestResponse = await fetch(`${STATIC_DATA_BASE}/manifest.json`, { cache: 'no-cache' });
+    if (!manifestResponse.ok) {
+      throw new Error(`HTTP error! status: ${manifestResponse.status}`);
+    }
+    const manifest = await manifestResponse.json();
+    const response = await fetch(`${STATIC_DATA_BASE}/${manifest.file}`);
+    if (!response.ok) {
+      throw new Error(`HTTP error! status: ${response.status}`);
+    }
+    return response.json();
+  }
 
   // Load data from API
   async function loadData() {
+    try {
+      DATA = await loadStaticData();
+      return DATA;
+    } catch (error) {
+      console.warn('Static snapshot unavailable, falling back to API:', error);
+    }
+
     try {
       const response = await fetch(`${API_BASE}/all`);
       if (!response.ok) {
@@ -275,8 +298,9 @@
           // Создаем содержимое карточки с фотографией или диском
           const discContent = v.photo_url ?
             `<div class="vinyl-photo">
-               <img src="${escapeHtml(v.photo_url)}" alt="Обложка ${escapeHtml(v.artist)} - ${escapeHtml(v.title)}"
-                    onerror="this.style.display='none'; this.nextElementSibling.style.display='block';">
+               ${pictureHtml(v.photo_url, v.photo_variants, '(max-width: 600px) 50vw, 240px',
+                 `alt="Обложка ${escapeHtml(v.artist)} - ${escapeHtml(v.title)}"
+                  onerror="this.parentElement.style.display='none'; this.parentElement.nextElementSibling.style.display='block';"`)}
                <div class="disc fallback-disc" style="display: none;"><div class="label"></div></div>
              </div>` :
             `<div class="disc"><div class="label"></div></div>`;
@@ -783,7 +807,8 @@
       card.innerHTML = `
         <div class="plant-photo" style="height:140px; border-radius: var(--radius2); background: rgba(255,255,255,.03); position: relative; overflow: hidden; border: 1px solid var(--line);">
           ${latestPhoto ?
-            `<img src="${latestPhoto.url}" alt="Фото растения" style="width: 100%; height: 100%; object-fit: cover;" onerror="this.style.display='none'; this.nextElementSibling.style.display='flex';">
+            `${pictureHtml(latestPhoto.url, latestPhoto.variants, '(max-width: 600px) 100vw, 320px',
+               `alt="Фото растения" style="width: 100%; height: 100%; object-fit: cover;" onerror="this.parentElement.style.display='none'; this.parentElement.nextElementSibling.style.display='flex';"`)}
              <div style="display: none; width: 100%; height: 100%; align-items: center; justify-content: center; color: var(--muted);">Фото недоступно</div>` :
             `<div style="width: 100%; height: 100%; display: flex; align-items: center; justify-content: center; color: var(--muted);">Фото пока нет</div>`
           }
@@ -827,9 +852,10 @@
           ${photos.map((photo, index) => `
             <div class="gallery-item" style="flex: 0 0 280px; position: relative;">
               <div style="width: 280px; height: 200px; border-radius: var(--radius2); overflow: hidden; border: 1px solid var(--line); position: relative;">
-                <img src="${photo.url}" alt="Фото растения от ${new Date(photo.date).toLocaleDateString('ru-RU')}"
-                     style="width: 100%; height: 100%; object-fit: cover;"
-                     onerror="this.style.display='none'; this.nextElementSibling.style.display='flex';">
+                ${pictureHtml(photo.url, photo.variants, '280px',
+                  `alt="Фото растения от ${new Date(photo.date).toLocaleDateString('ru-RU')}"
+                   style="width: 100%; height: 100%; object-fit: cover;"
+                   onerror="this.parentElement.style.display='none'; this.parentElement.nextElementSibling.style.display='flex';"`)}
                 <div style="display: none; width: 100%; height: 100%; align-items: center; justify-content: center; color: var(--muted); background: rgba(255,255,255,.03);">Фото недоступно</div>
               </div>
               <div style="margin-top: 8px; text-align: center;">
@@ -930,6 +956,20 @@
       .replaceAll("'",'&#039;');
   }
 
+  // <picture> с AVIF/WebP/JPEG копиями разной ширины; браузер сам выбирает
+  // формат и размер по sizes, исходный url остается запасным вариантом
+  function pictureHtml(url, variants, sizes, imgAttrs){
+    const byFormat = {};
+    (variants || []).forEach(v => {
+      (byFormat[v.format] = byFormat[v.format] || []).push(`${escapeHtml(v.url)} ${v.width}w`);
+    });
+    const sources = ['avif', 'webp', 'jpeg']
+      .filter(format => byFormat[format])
+      .map(format => `<source type="image/${format}" srcset="${byFormat[format].join(', ')}" sizes="${sizes}">`)
+      .join('');
+    return `<picture>${sources}<img src="${escapeHtml(url)}" loading="lazy" decoding="async" ${imgAttrs}></picture>`;
+  }
+
   function isProbablyUrl(s){
     return /^https?:\/\//i.test(String(s||''));
   }
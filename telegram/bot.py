@@ -7,10 +7,13 @@ import sys
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
-from aiogram.fsm.storage.memory import MemoryStorage
 
 from config import config
-from handlers import start, coffee, vinyl, books
+from fsm_storage import create_storage
+from services.image_processing import shutdown_image_pool
+from services.s3_service import shutdown_s3
+from webhook import run_webhook
+from handlers import start, coffee, vinyl, books, import_data, backup
 from middlewares.auth import AdminMiddleware
 from middlewares.error_handler import ErrorHandlerMiddleware, error_handler
 
@@ -48,15 +51,21 @@ async def main():
         logger.error(f"Ошибка конфигурации: {e}")
         sys.exit(1)
 
+    # Без секрета webhook-сервер принял бы поддельные обновления от кого угодно
+    if config.bot_mode == "webhook" and not config.webhook_secret:
+        logger.error("❌ В webhook-режиме обязателен WEBHOOK_SECRET")
+        sys.exit(1)
+
     # Создаем бота и диспетчер
     bot = Bot(
         token=config.bot_token,
         default=DefaultBotProperties(parse_mode=ParseMode.HTML)
     )
 
-    # Используем MemoryStorage для FSM (в продакшене можно заменить на Redis)
-    storage = MemoryStorage()
-    dp = Dispatcher(storage=storage)
+    # FSM-хранилище: Redis в продакшене (FSM_STORAGE=redis), иначе in-memory
+    storage = create_storage()
+    dp = Dispatcher(storage=storage, events_isolation=storage.create_isolation())
+    logger.info(f"FSM storage: {type(storage).__name__}")
 
     # Регистрируем middleware
     dp.message.middleware(AdminMiddleware())
@@ -72,6 +81,8 @@ async def main():
     dp.include_router(vinyl.router)
     dp.include_router(books.router)
     dp.include_router(coffee.router)
+    dp.include_router(import_data.router)
+    dp.include_router(backup.router)
 
     logger.info("📝 Middleware и роутеры зарегистрированы")
 
@@ -114,9 +125,14 @@ async def main():
     logger.info("✅ Бот полностью инициализирован")
 
     try:
-        # Запускаем polling
-        logger.info("🔄 Начинаем polling...")
-        await dp.start_polling(bot)
+        if config.bot_mode == "webhook":
+            logger.info("🌐 Запускаем webhook-сервер...")
+            await run_webhook(dp, bot)
+        else:
+            # getUpdates не работает, пока установлен webhook
+            await bot.delete_webhook()
+            logger.info("🔄 Начинаем polling...")
+            await dp.start_polling(bot)
     except KeyboardInterrupt:
         logger.info("⏹️ Получен сигнал остановки")
     except Exception as e:
@@ -136,6 +152,10 @@ async def main():
 
         logger.info("🛑 Закрываем соединения...")
         await bot.session.close()
+        await dp.storage.close()
+        await dp.fsm.events_isolation.close()
+        await asyncio.to_thread(shutdown_s3)
+        await asyncio.to_thread(shutdown_image_pool)
         logger.info("✅ Бот остановлен")
 
 
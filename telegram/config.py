@@ -2,7 +2,7 @@
 Конфигурация Telegram-бота
 """
 import os
-from typing import Optional
+from typing import Dict, List, Optional
 from pydantic_settings import BaseSettings
 
 
@@ -24,6 +24,63 @@ class BotConfig(BaseSettings):
     # Logging level
     log_level: str = "INFO"
 
+    # FSM storage: "memory" (по умолчанию) или "redis" для нескольких реплик
+    fsm_storage: str = "memory"
+    redis_url: str = "redis://redis:6379/0"
+    # TTL состояний FSM в секундах и переопределения по состояниям/группам,
+    # например FSM_STATE_TTLS='{"VinylStates:waiting_for_photo": 3600}'
+    fsm_state_ttl: int = 24 * 60 * 60
+    fsm_state_ttls: Dict[str, int] = {}
+
+    # Режим получения обновлений: "polling" или "webhook"
+    bot_mode: str = "polling"
+    # Публичный адрес сайта, на который Telegram будет слать обновления
+    webhook_base_url: str = ""
+    webhook_path: str = "/telegram/webhook"
+    # Секрет для заголовка X-Telegram-Bot-Api-Secret-Token; обязателен
+    # в webhook-режиме, без него бот не запустится
+    webhook_secret: str = ""
+    webhook_host: str = "0.0.0.0"
+    webhook_port: int = 8080
+    # Параллельная обработка обновлений в webhook-режиме
+    webhook_workers: int = 8
+    webhook_queue_size: int = 100
+
+    # S3: число одновременных запросов, попытки и таймауты (секунды)
+    s3_max_concurrency: int = 4
+    s3_max_attempts: int = 5
+    s3_connect_timeout: float = 5.0
+    s3_read_timeout: float = 30.0
+    # Потоковая загрузка: размер части multipart (не меньше 5 МиБ),
+    # число частей в полете и размер чанка при скачивании из Telegram
+    s3_part_size: int = 8 * 1024 * 1024
+    s3_parts_in_flight: int = 2
+    s3_download_chunk_size: int = 64 * 1024
+
+    # Обработка фото: ширины и форматы уменьшенных копий, качество,
+    # размер пула процессов и максимальный размер исходного файла
+    image_variant_widths: List[int] = [320, 640, 1280]
+    image_variant_formats: List[str] = ["avif", "webp", "jpeg"]
+    image_quality: int = 80
+    image_workers: int = 2
+    image_max_bytes: int = 20 * 1024 * 1024
+    # Фото без ссылок удаляется не раньше, чем через столько часов после
+    # последней загрузки: сценарий, загрузивший его, мог еще не сохранить
+    # запись. Должно быть не меньше FSM_STATE_TTL
+    photo_gc_grace_hours: float = 24.0
+
+    # TTL (секунды) кеша словарей для клавиатур: жанры, теги, бренды...
+    vocabulary_cache_ttl: float = 300
+
+    # Записей на странице в списках и клавиатурах выбора
+    page_size: int = 10
+
+    # Массовый импорт: записей в одном INSERT, максимальный размер файла
+    # и минимальный интервал (секунды) между обновлениями статуса
+    import_batch_size: int = 500
+    import_max_bytes: int = 20 * 1024 * 1024
+    import_progress_interval: float = 2.0
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -0,0 +1,231 @@
+"""
+Хранилища FSM для Telegram-бота
+
+Redis-хранилище позволяет запускать несколько реплик бота и переживать
+перезапуски без потери незавершенных сценариев добавления/редактирования.
+In-memory хранилище с той же семантикой TTL и сериализации используется
+локально и в тестах.
+"""
+import json
+import time
+import zlib
+from typing import Any, Callable, Dict, Optional
+
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import (
+    BaseEventIsolation, BaseStorage, DefaultKeyBuilder, KeyBuilder, StateType, StorageKey
+)
+from aiogram.fsm.storage.memory import SimpleEventIsolation
+from aiogram.fsm.storage.redis import RedisEventIsolation
+from redis.asyncio import ConnectionPool, Redis
+
+from config import config
+
+STATE_FIELD = "state"
+DATA_FIELD = "data"
+
+
+class FSMDataCodec:
+    """Компактная сериализация данных state.update_data
+
+    JSON без пробелов и экранирования кириллицы; крупные payload'ы
+    (например, список брендов в сценарии добавления кофе) сжимаются zlib.
+    Первый байт указывает формат.
+    """
+
+    PLAIN = b"j"
+    COMPRESSED = b"z"
+
+    def __init__(self, compress_threshold: int = 512):
+        self.compress_threshold = compress_threshold
+
+    def dumps(self, data: Dict[str, Any]) -> bytes:
+        raw = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        if len(raw) >= self.compress_threshold:
+            return self.COMPRESSED + zlib.compress(raw)
+        return self.PLAIN + raw
+
+    def loads(self, blob: Optional[bytes]) -> Dict[str, Any]:
+        if not blob:
+            return {}
+        marker, payload = blob[:1], blob[1:]
+        if marker == self.COMPRESSED:
+            payload = zlib.decompress(payload)
+        return json.loads(payload.decode("utf-8"))
+
+
+class StateTTLPolicy:
+    """TTL состояний FSM в секундах
+
+    Переопределения задаются для конкретного состояния
+    (``VinylStates:waiting_for_photo``) или для всей группы (``VinylStates``).
+    Данные сценария живут столько же, сколько его текущее состояние.
+    """
+
+    def __init__(self, default_ttl: int, overrides: Optional[Dict[str, int]] = None):
+        self.default_ttl = default_ttl
+        self.overrides = overrides or {}
+
+    def ttl_for(self, state: Optional[str]) -> int:
+        if state is None:
+            return self.default_ttl
+        if state in self.overrides:
+            return self.overrides[state]
+        group = state.split(":", 1)[0]
+        return self.overrides.get(group, self.default_ttl)
+
+
+def _state_name(state: StateType) -> Optional[str]:
+    return state.state if isinstance(state, State) else state
+
+
+class RedisTTLStorage(BaseStorage):
+    """FSM-хранилище в Redis с TTL на уровне состояния
+
+    Состояние и данные пользователя хранятся в одном hash-ключе, поэтому
+    TTL текущего состояния распространяется и на данные сценария.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        key_builder: Optional[KeyBuilder] = None,
+        ttl_policy: Optional[StateTTLPolicy] = None,
+        codec: Optional[FSMDataCodec] = None,
+    ):
+        self.redis = redis
+        self.key_builder = key_builder or DefaultKeyBuilder()
+        self.ttl_policy = ttl_policy or StateTTLPolicy(config.fsm_state_ttl)
+        self.codec = codec or FSMDataCodec()
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> "RedisTTLStorage":
+        """Создать хранилище по URL вида redis://host:6379/0"""
+        pool = ConnectionPool.from_url(url)
+        return cls(redis=Redis(connection_pool=pool), **kwargs)
+
+    def create_isolation(self) -> BaseEventIsolation:
+        """Блокировка событий одного пользователя между репликами бота"""
+        return RedisEventIsolation(redis=self.redis, key_builder=self.key_builder)
+
+    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
+        redis_key = self.key_builder.build(key)
+        state_name = _state_name(state)
+
+        if state_name is None:
+            await self.redis.hdel(redis_key, STATE_FIELD)
+            return
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(redis_key, STATE_FIELD, state_name)
+            pipe.expire(redis_key, self.ttl_policy.ttl_for(state_name))
+            await pipe.execute()
+
+    async def get_state(self, key: StorageKey) -> Optional[str]:
+        value = await self.redis.hget(self.key_builder.build(key), STATE_FIELD)
+        return value.decode("utf-8") if value else None
+
+    async def set_data(self, key: StorageKey, data: Dict[str, Any]) -> None:
+        redis_key = self.key_builder.build(key)
+
+        if not data:
+            await self.redis.hdel(redis_key, DATA_FIELD)
+            return
+
+        # Каждое изменение данных продлевает сценарий на TTL текущего
+        # состояния (без состояния — на TTL по умолчанию)
+        state = await self.redis.hget(redis_key, STATE_FIELD)
+        ttl = self.ttl_policy.ttl_for(state.decode("utf-8") if state else None)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(redis_key, DATA_FIELD, self.codec.dumps(data))
+            pipe.expire(redis_key, ttl)
+            await pipe.execute()
+
+    async def get_data(self, key: StorageKey) -> Dict[str, Any]:
+        blob = await self.redis.hget(self.key_builder.build(key), DATA_FIELD)
+        return self.codec.loads(blob)
+
+    async def close(self) -> None:
+        await self.redis.aclose()
+
+
+class MemoryTTLStorage(BaseStorage):
+    """In-memory замена RedisTTLStorage для локального запуска и тестов
+
+    Повторяет семантику TTL и прогоняет данные через тот же кодек, поэтому
+    несериализуемые значения в state.update_data обнаруживаются без Redis.
+    """
+
+    def __init__(
+        self,
+        ttl_policy: Optional[StateTTLPolicy] = None,
+        codec: Optional[FSMDataCodec] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_policy = ttl_policy or StateTTLPolicy(config.fsm_state_ttl)
+        self.codec = codec or FSMDataCodec()
+        self.clock = clock
+        self._records: Dict[StorageKey, Dict[str, Any]] = {}
+
+    def create_isolation(self) -> BaseEventIsolation:
+        return SimpleEventIsolation()
+
+    def _record(self, key: StorageKey) -> Optional[Dict[str, Any]]:
+        record = self._records.get(key)
+        if record is not None and record["expires_at"] <= self.clock():
+            del self._records[key]
+            return None
+        return record
+
+    def _cleanup(self, key: StorageKey) -> None:
+        record = self._records.get(key)
+        if record is not None and record[STATE_FIELD] is None and record[DATA_FIELD] is None:
+            del self._records[key]
+
+    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
+        state_name = _state_name(state)
+        record = self._record(key)
+
+        if state_name is None:
+            if record is not None:
+                record[STATE_FIELD] = None
+                self._cleanup(key)
+            return
+
+        if record is None:
+            record = self._records[key] = {DATA_FIELD: None}
+        record[STATE_FIELD] = state_name
+        record["expires_at"] = self.clock() + self.ttl_policy.ttl_for(state_name)
+
+    async def get_state(self, key: StorageKey) -> Optional[str]:
+        record = self._record(key)
+        return record[STATE_FIELD] if record else None
+
+    async def set_data(self, key: StorageKey, data: Dict[str, Any]) -> None:
+        record = self._record(key)
+
+        if not data:
+            if record is not None:
+                record[DATA_FIELD] = None
+                self._cleanup(key)
+            return
+
+        if record is None:
+            record = self._records[key] = {STATE_FIELD: None}
+        record[DATA_FIELD] = self.codec.dumps(data)
+        record["expires_at"] = self.clock() + self.ttl_policy.ttl_for(record[STATE_FIELD])
+
+    async def get_data(self, key: StorageKey) -> Dict[str, Any]:
+        record = self._record(key)
+        return self.codec.loads(record[DATA_FIELD]) if record else {}
+
+    async def close(self) -> None:
+        self._records.clear()
+
+
+def create_storage() -> BaseStorage:
+    """Создать FSM-хранилище согласно конфигурации (FSM_STORAGE=memory|redis)"""
+    ttl_policy = StateTTLPolicy(config.fsm_state_ttl, config.fsm_state_ttls)
+    if config.fsm_storage == "redis":
+        return RedisTTLStorage.from_url(config.redis_url, ttl_policy=ttl_policy)
+    return MemoryTTLStorage(ttl_policy=ttl_policy)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Сборка мусора в S3: удаление фото, на которые не ссылается ни одна запись
+
+Фото хранятся по ключам из хеша содержимого и могут использоваться
+несколькими записями, поэтому бот удаляет их только по нулевому счетчику
+ссылок и только если фото загружено раньше PHOTO_GC_GRACE_HOURS назад.
+Этот скрипт убирает все, что осталось: фото без ссылок в vinyl_records/plants,
+загруженные или переиспользованные раньше этого срока.
+
+Пример:
+    python gc_photos.py --dry-run
+    python gc_photos.py --grace-hours 24
+"""
+import argparse
+import asyncio
+import logging
+import sys
+from datetime import timedelta
+from typing import Dict, List
+
+from config import config
+from database import get_db_session
+from services.s3_service import S3Service, content_stem, photo_gc_cutoff, shutdown_s3
+
+# services.s3_service добавляет backend в sys.path
+from app.repositories.photo_refs import PhotoReferenceRepository  # noqa: E402
+
+DEFAULT_PREFIXES = ["vinyl/", "plants/"]
+
+
+async def collect_garbage(prefixes, grace: timedelta, dry_run: bool) -> int:
+    service = S3Service()
+    if not service.configured:
+        print("❌ S3 не настроен (S3_ACCESS_KEY, S3_SECRET_KEY, S3_BUCKET_NAME)")
+        return 1
+
+    async with get_db_session() as db:
+        urls = await PhotoReferenceRepository(db).referenced_urls()
+    referenced = {content_stem(key) for key in map(service._key_from_url, urls) if key}
+    print(f"🔗 Фото со ссылками: {len(referenced)}")
+
+    # Фото, загруженное или переиспользованное позже cutoff, не трогаем:
+    # запись с его URL могла еще не закоммититься. Возраст фото — возраст
+    # самого нового из его объектов (повторная загрузка обновляет манифест)
+    cutoff = photo_gc_cutoff(grace)
+    scanned = 0
+    garbage = []
+    garbage_bytes = 0
+
+    for prefix in prefixes:
+        photos: Dict[str, List[dict]] = {}
+        async for item in service.list_objects(prefix):
+            scanned += 1
+            photos.setdefault(content_stem(item["Key"]), []).append(item)
+
+        for stem, items in photos.items():
+            if stem in referenced:
+                continue
+            if max(item["LastModified"] for item in items) > cutoff:
+                continue
+            garbage.extend(item["Key"] for item in items)
+            garbage_bytes += sum(item["Size"] for item in items)
+
+    print(f"📦 Просмотрено объектов: {scanned}")
+    print(f"🗑️ Без ссылок: {len(garbage)} ({garbage_bytes / 1024 / 1024:.1f} МиБ)")
+
+    if dry_run:
+        for key in garbage:
+            print(f"   {key}")
+        return 0
+
+    failed = await service.delete_objects(garbage)
+    print(f"✅ Удалено: {len(garbage) - len(failed)}, ошибок: {len(failed)}")
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Удалить из S3 фото без ссылок в БД")
+    parser.add_argument("--prefix", action="append", dest="prefixes",
+                        help=f"префикс ключей (по умолчанию: {', '.join(DEFAULT_PREFIXES)})")
+    parser.add_argument("--grace-hours", type=float, default=config.photo_gc_grace_hours,
+                        help="не удалять фото, загруженные позже этого срока (по умолчанию PHOTO_GC_GRACE_HOURS)")
+    parser.add_argument("--dry-run", action="store_true", help="только показать, что будет удалено")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    try:
+        code = asyncio.run(collect_garbage(
+            args.prefixes or DEFAULT_PREFIXES,
+            timedelta(hours=args.grace_hours),
+            args.dry_run
+        ))
+    finally:
+        shutdown_s3()
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
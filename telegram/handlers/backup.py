@@ -0,0 +1,47 @@
+"""
+Обработчики резервного копирования
+"""
+import logging
+import os
+from datetime import datetime, timezone
+
+from aiogram import Router
+from aiogram.filters import Command
+from aiogram.types import Message, FSInputFile
+
+from services.backup_service import TELEGRAM_UPLOAD_LIMIT, create_backup_file
+
+router = Router()
+logger = logging.getLogger(__name__)
+
+
+@router.message(Command("backup"))
+async def cmd_backup(message: Message):
+    """Выгрузить все коллекции в gzip JSON Lines и отправить файлом"""
+    status = await message.answer("⏳ Создание резервной копии...")
+
+    try:
+        path, stats = await create_backup_file()
+    except Exception as e:
+        logger.error(f"Ошибка при создании резервной копии: {e}", exc_info=True)
+        await status.edit_text("❌ Не удалось создать резервную копию")
+        return
+
+    try:
+        size = os.path.getsize(path)
+        if size > TELEGRAM_UPLOAD_LIMIT:
+            await status.edit_text(
+                f"❌ Резервная копия занимает {size // (1024 * 1024)} МБ — больше лимита Telegram.\n"
+                "Используйте на сервере: python backup.py export"
+            )
+            return
+
+        filename = f"backup-{datetime.now(timezone.utc):%Y%m%d-%H%M%S}.jsonl.gz"
+        await message.answer_document(
+            FSInputFile(path, filename=filename),
+            caption=f"💾 Резервная копия: {stats.total} записей, версия данных {stats.data_version}"
+        )
+        await status.delete()
+        logger.info(f"Резервная копия отправлена: {stats.total} записей, {size} байт")
+    finally:
+        os.unlink(path)
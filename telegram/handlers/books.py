@@ -6,11 +6,13 @@ from aiogram import Router, F
 from aiogram.types import Message, CallbackQuery
 from aiogram.fsm.context import FSMContext
 
+from config import config
 from database import get_db_session
-from services.books_service import BooksService
+from services.books_service import BooksService, Page
 from states.books_states import BooksStates
+from keyboards.pagination import PageCallback
 from keyboards.books_keyboards import (
-    books_menu_keyboard, books_selection_keyboard, book_edit_fields_keyboard,
+    books_menu_keyboard, books_selection_keyboard, books_list_keyboard, book_edit_fields_keyboard,
     dynamic_genres_keyboard, dynamic_languages_keyboard, dynamic_formats_keyboard,
     confirm_delete_book_keyboard, cancel_keyboard, skip_keyboard
 )
@@ -21,18 +23,30 @@ logger = logging.getLogger(__name__)
 
 # === ОСНОВНОЕ МЕНЮ ===
 
-@router.callback_query(F.data == "books_list")
-async def show_books_list(callback: CallbackQuery):
-    """Показать список всех книг"""
+async def load_books_page(cursor: str = "", number: int = 1):
+    """Загрузить одну страницу книг; при неверном курсоре — первую"""
     async with get_db_session() as db:
         service = BooksService(db)
-        books = await service.get_all_books()
+        try:
+            page = await service.get_books_page(cursor)
+        except ValueError:
+            # Курсор поврежден — начинаем сначала
+            page = await service.get_books_page()
+            number = 1
+    return page, number
 
-    if not books:
+
+async def show_books_list_page(callback: CallbackQuery, cursor: str = "", number: int = 1):
+    """Показать страницу списка книг"""
+    page, number = await load_books_page(cursor, number)
+
+    if not page.items and number == 1:
         text = "📋 *Список книг*\n\n❌ Книги не найдены"
+        reply_markup = books_menu_keyboard()
     else:
-        text = "📋 *Список книг:*\n\n"
-        for i, book in enumerate(books, 1):
+        text = f"📋 *Список книг* (стр. {number}):\n\n"
+        first = (number - 1) * config.page_size + 1
+        for i, book in enumerate(page.items, first):
             text += f"{i}. *{book.title}*"
             if book.author:
                 text += f" - {book.author}"
@@ -41,15 +55,64 @@ async def show_books_list(callback: CallbackQuery):
             if book.language:
                 text += f" | 🌐 {book.language}"
             text += "\n\n"
+        reply_markup = books_list_keyboard(number, page.next_cursor)
 
     await callback.message.edit_text(
         text,
-        reply_markup=books_menu_keyboard(),
+        reply_markup=reply_markup,
+        parse_mode="Markdown"
+    )
+    await callback.answer()
+
+
+@router.callback_query(F.data == "books_list")
+async def show_books_list(callback: CallbackQuery):
+    """Показать первую страницу списка книг"""
+    await show_books_list_page(callback)
+
+
+@router.callback_query(PageCallback.filter(F.section == "books_list"))
+async def turn_books_list_page(callback: CallbackQuery, callback_data: PageCallback):
+    """Перелистнуть список книг"""
+    await show_books_list_page(callback, callback_data.cursor, callback_data.number)
+
+
+# Заголовки выбора книги по текущему состоянию FSM
+SELECTION_TITLES = {
+    BooksStates.waiting_for_delete_selection.state: "🗑️ *Удаление книги*\n\nВыберите книгу для удаления:",
+    BooksStates.waiting_for_book_selection.state: "✏️ *Редактирование книги*\n\nВыберите книгу для редактирования:",
+}
+
+
+async def show_books_selection_page(callback: CallbackQuery, title: str, page: Page, number: int = 1):
+    """Показать загруженную страницу клавиатуры выбора книги"""
+    await callback.message.edit_text(
+        title,
+        reply_markup=books_selection_keyboard(page.items, number, page.next_cursor),
         parse_mode="Markdown"
     )
     await callback.answer()
 
 
+@router.callback_query(PageCallback.filter(F.section == "books_select"))
+async def turn_books_selection_page(callback: CallbackQuery, callback_data: PageCallback, state: FSMContext):
+    """Перелистнуть клавиатуру выбора книги"""
+    title = SELECTION_TITLES.get(await state.get_state())
+    if title is None:
+        # Сценарий завершен или истек по TTL
+        await callback.message.edit_text(
+            "📚 *Управление книгами*\n\n"
+            "Выберите действие:",
+            reply_markup=books_menu_keyboard(),
+            parse_mode="Markdown"
+        )
+        await callback.answer()
+        return
+
+    page, number = await load_books_page(callback_data.cursor, callback_data.number)
+    await show_books_selection_page(callback, title, page, number)
+
+
 @router.callback_query(F.data == "books_add")
 async def start_add_book(callback: CallbackQuery, state: FSMContext):
     """Начать добавление новой книги"""
@@ -359,11 +422,9 @@ async def finish_adding_book_with_data(message: Message, state: FSMContext):
 @router.callback_query(F.data == "books_delete")
 async def start_delete_book(callback: CallbackQuery, state: FSMContext):
     """Начать удаление книги"""
-    async with get_db_session() as db:
-        service = BooksService(db)
-        books = await service.get_all_books()
+    page, _ = await load_books_page()
 
-    if not books:
+    if not page.items:
         await callback.message.edit_text(
             "🗑️ *Удаление книги*\n\n❌ Книги не найдены",
             reply_markup=books_menu_keyboard(),
@@ -373,14 +434,7 @@ async def start_delete_book(callback: CallbackQuery, state: FSMContext):
         return
 
     await state.set_state(BooksStates.waiting_for_delete_selection)
-
-    await callback.message.edit_text(
-        "🗑️ *Удаление книги*\n\n"
-        "Выберите книгу для удаления:",
-        reply_markup=books_selection_keyboard(books),
-        parse_mode="Markdown"
-    )
-    await callback.answer()
+    await show_books_selection_page(callback, SELECTION_TITLES[BooksStates.waiting_for_delete_selection.state], page)
 
 
 @router.callback_query(F.data.startswith("select_book_"), BooksStates.waiting_for_delete_selection)
@@ -458,11 +512,9 @@ async def delete_book_confirmed(callback: CallbackQuery, state: FSMContext):
 @router.callback_query(F.data == "books_edit")
 async def start_edit_book(callback: CallbackQuery, state: FSMContext):
     """Начать редактирование книги"""
-    async with get_db_session() as db:
-        service = BooksService(db)
-        books = await service.get_all_books()
+    page, _ = await load_books_page()
 
-    if not books:
+    if not page.items:
         await callback.message.edit_text(
             "✏️ *Редактирование книги*\n\n❌ Книги не найдены",
             reply_markup=books_menu_keyboard(),
@@ -472,14 +524,7 @@ async def start_edit_book(callback: CallbackQuery, state: FSMContext):
         return
 
     await state.set_state(BooksStates.waiting_for_book_selection)
-
-    await callback.message.edit_text(
-        "✏️ *Редактирование книги*\n\n"
-        "Выберите книгу для редактирования:",
-        reply_markup=books_selection_keyboard(books),
-        parse_mode="Markdown"
-    )
-    await callback.answer()
+    await show_books_selection_page(callback, SELECTION_TITLES[BooksStates.waiting_for_book_selection.state], page)
 
 
 @router.callback_query(F.data.startswith("select_book_"), BooksStates.waiting_for_book_selection)
@@ -0,0 +1,167 @@
+"""
+Обработчики массового импорта коллекций из CSV/JSON-файлов
+"""
+import csv
+import logging
+import os
+import time
+
+from aiogram import Bot, Router, F
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.filters import Command
+from aiogram.fsm.context import FSMContext
+from aiogram.types import Message, CallbackQuery
+
+from config import config
+from database import get_db_session
+from services.import_service import (
+    COLLECTIONS, SUPPORTED_EXTENSIONS, ImportResult, ImportService, ImportValidationError,
+    download_document, read_records
+)
+from states.import_states import ImportStates
+from keyboards.import_keyboards import import_collections_keyboard, cancel_keyboard
+
+router = Router()
+logger = logging.getLogger(__name__)
+
+# Поля файла для каждой коллекции
+FIELDS_HELP = {
+    "vinyl": "artist, title, year, genres",
+    "books": "title, author, genre, language, format, review, opinion",
+    "coffee": "brand, name, region, processing",
+}
+
+
+class ImportProgress:
+    """Обновляет одно статусное сообщение не чаще IMPORT_PROGRESS_INTERVAL"""
+
+    def __init__(self, message: Message, title: str):
+        self.message = message
+        self.title = title
+        self._updated_at = time.monotonic()
+
+    async def update(self, result: ImportResult):
+        now = time.monotonic()
+        if now - self._updated_at < config.import_progress_interval:
+            return
+        self._updated_at = now
+        await self.edit(
+            f"⏳ Импорт: {self.title}\n\n"
+            f"Обработано: {result.processed}\n"
+            f"Добавлено: {result.inserted}"
+        )
+
+    async def edit(self, text: str):
+        try:
+            await self.message.edit_text(text)
+        except TelegramBadRequest as e:
+            # Например, "message is not modified"
+            logger.debug(f"Не удалось обновить статус импорта: {e}")
+
+
+@router.message(Command("import"))
+async def cmd_import(message: Message, state: FSMContext):
+    """Начать импорт: выбор коллекции"""
+    await state.clear()
+
+    await message.answer(
+        "📥 *Импорт из файла*\n\n"
+        "Выберите коллекцию:",
+        reply_markup=import_collections_keyboard(),
+        parse_mode="Markdown"
+    )
+
+
+@router.callback_query(F.data.in_({"import_vinyl", "import_books", "import_coffee"}))
+async def choose_import_collection(callback: CallbackQuery, state: FSMContext):
+    """Запросить файл для выбранной коллекции"""
+    collection = callback.data.removeprefix("import_")
+    await state.set_state(ImportStates.waiting_for_document)
+    await state.update_data(collection=collection)
+
+    title = COLLECTIONS[collection][2]
+    await callback.message.edit_text(
+        f"📥 *Импорт: {title}*\n\n"
+        "Отправьте файл CSV (с заголовком), JSON (массив объектов) или JSON Lines.\n\n"
+        f"Поля: `{FIELDS_HELP[collection]}`\n"
+        + ("Жанры в CSV перечисляются через «;».\n" if collection == "vinyl" else "")
+        + "Поле `id` необязательно: записи без него сопоставляются по названию, "
+        "поэтому повторная загрузка файла не создает дубликатов.",
+        reply_markup=cancel_keyboard(),
+        parse_mode="Markdown"
+    )
+    await callback.answer()
+
+
+@router.message(ImportStates.waiting_for_document, F.document)
+async def process_import_document(message: Message, state: FSMContext, bot: Bot):
+    """Импортировать записи из присланного файла"""
+    data = await state.get_data()
+    collection = data["collection"]
+    title = COLLECTIONS[collection][2]
+    document = message.document
+    filename = document.file_name or ""
+
+    if os.path.splitext(filename.lower())[1] not in SUPPORTED_EXTENSIONS:
+        await message.answer(
+            f"❌ Поддерживаются файлы {', '.join(SUPPORTED_EXTENSIONS)}. Попробуйте еще раз:",
+            reply_markup=cancel_keyboard()
+        )
+        return
+
+    if document.file_size and document.file_size > config.import_max_bytes:
+        await message.answer(
+            f"❌ Файл больше {config.import_max_bytes // (1024 * 1024)} МБ",
+            reply_markup=cancel_keyboard()
+        )
+        return
+
+    await state.clear()
+    status = await message.answer(f"⏳ Импорт: {title}\n\nЗагрузка файла...")
+    progress = ImportProgress(status, title)
+
+    try:
+        with await download_document(bot, document.file_id) as stream:
+            # Весь файл — одна транзакция: при ошибке get_db_session откатит ее
+            async with get_db_session() as db:
+                service = ImportService(db)
+                result = await service.import_records(
+                    collection, read_records(stream, filename), progress.update
+                )
+                await service.commit()
+
+    except ImportValidationError as e:
+        await progress.edit(
+            f"❌ Импорт: {title} — ничего не добавлено\n\n"
+            f"Некорректных записей: {e.total}\n"
+            + "\n".join(e.errors)
+            + ("\n..." if e.total > len(e.errors) else "")
+        )
+        return
+    except (ValueError, csv.Error) as e:
+        await progress.edit(f"❌ Импорт: {title} — не удалось прочитать файл\n\n{e}")
+        return
+    except Exception as e:
+        logger.error(f"Ошибка при импорте ({collection}): {e}", exc_info=True)
+        await progress.edit(f"❌ Импорт: {title} — произошла ошибка, ничего не добавлено")
+        return
+
+    logger.info(
+        f"Импорт {collection}: обработано {result.processed}, "
+        f"добавлено {result.inserted}, пропущено {result.skipped}"
+    )
+    await progress.edit(
+        f"✅ Импорт: {title}\n\n"
+        f"Обработано: {result.processed}\n"
+        f"Добавлено: {result.inserted}\n"
+        f"Уже были в базе: {result.skipped}"
+    )
+
+
+@router.message(ImportStates.waiting_for_document)
+async def expect_import_document(message: Message):
+    """Напомнить, что ожидается файл"""
+    await message.answer(
+        "📎 Отправьте файл CSV, JSON или JSON Lines документом:",
+        reply_markup=cancel_keyboard()
+    )
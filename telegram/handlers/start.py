@@ -7,6 +7,8 @@ from aiogram.types import Message, CallbackQuery
 from aiogram.filters import CommandStart
 from aiogram.fsm.context import FSMContext
 
+from database import get_db_session
+from services.statistics_service import StatisticsService
 from keyboards.coffee_keyboards import main_menu_keyboard, coffee_menu_keyboard, collections_menu_keyboard
 from keyboards.vinyl_keyboards import vinyl_menu_keyboard
 from keyboards.books_keyboards import books_menu_keyboard
@@ -169,11 +171,16 @@ async def projects_management(message: Message, state: FSMContext):
 @router.message(F.text == "📊 Статистика")
 async def show_statistics(message: Message):
     """Показать статистику"""
-    # TODO: Реализовать статистику
+    try:
+        async with get_db_session() as db:
+            statistics = await StatisticsService(db).get_statistics()
+    except Exception as e:
+        logger.error(f"Ошибка при получении статистики: {e}")
+        await message.answer("❌ Не удалось получить статистику")
+        return
+
     await message.answer(
-        "📊 *Статистика*\n\n"
-        "🚧 Раздел в разработке...\n"
-        "Здесь будет отображаться статистика по всем коллекциям.",
+        StatisticsService.format_statistics(statistics),
         parse_mode="Markdown"
     )
 
@@ -185,7 +192,9 @@ async def show_help(message: Message):
         "❓ *Помощь*\n\n"
         "*Доступные команды:*\n"
         "• /start - Перезапустить бота\n"
-        "• /help - Показать эту справку\n\n"
+        "• /help - Показать эту справку\n"
+        "• /import - Импорт винила, книг или кофе из CSV/JSON\n"
+        "• /backup - Резервная копия всех коллекций\n\n"
         "*Разделы:*\n"
         "• ☕ Управление кофе - Добавление и редактирование информации о кофе\n"
         "• 📊 Статистика - Просмотр статистики коллекций\n\n"
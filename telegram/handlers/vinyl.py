@@ -6,12 +6,14 @@ from aiogram import Router, F, Bot
 from aiogram.types import Message, CallbackQuery
 from aiogram.fsm.context import FSMContext
 
+from config import config
 from database import get_db_session
-from services.vinyl_service import VinylService
+from services.vinyl_service import Page, VinylService
 from services.s3_service import S3Service
 from states.vinyl_states import VinylStates
+from keyboards.pagination import PageCallback
 from keyboards.vinyl_keyboards import (
-    vinyl_menu_keyboard, vinyl_selection_keyboard, vinyl_edit_fields_keyboard,
+    vinyl_menu_keyboard, vinyl_selection_keyboard, vinyl_list_keyboard, vinyl_edit_fields_keyboard,
     year_selection_keyboard, popular_genres_keyboard, confirm_delete_keyboard,
     cancel_keyboard, skip_keyboard, photo_upload_keyboard
 )
@@ -22,18 +24,30 @@ logger = logging.getLogger(__name__)
 
 # === ОСНОВНОЕ МЕНЮ ===
 
-@router.callback_query(F.data == "vinyl_list")
-async def show_vinyl_list(callback: CallbackQuery):
-    """Показать список всего винила"""
+async def load_vinyl_page(cursor: str = "", number: int = 1):
+    """Загрузить одну страницу винила; при неверном курсоре — первую"""
     async with get_db_session() as db:
         service = VinylService(db)
-        vinyl_records = await service.get_all_vinyl()
+        try:
+            page = await service.get_vinyl_page(cursor)
+        except ValueError:
+            # Курсор поврежден — начинаем сначала
+            page = await service.get_vinyl_page()
+            number = 1
+    return page, number
+
 
-    if not vinyl_records:
+async def show_vinyl_list_page(callback: CallbackQuery, cursor: str = "", number: int = 1):
+    """Показать страницу списка винила"""
+    page, number = await load_vinyl_page(cursor, number)
+
+    if not page.items and number == 1:
         text = "📋 *Список винила*\n\n❌ Винил не найден"
+        reply_markup = vinyl_menu_keyboard()
     else:
-        text = "📋 *Список винила:*\n\n"
-        for i, vinyl in enumerate(vinyl_records, 1):
+        text = f"📋 *Список винила* (стр. {number}):\n\n"
+        first = (number - 1) * config.page_size + 1
+        for i, vinyl in enumerate(page.items, first):
             text += f"{i}. *{vinyl.artist} - {vinyl.title}*"
             if vinyl.year:
                 text += f" ({vinyl.year})"
@@ -43,15 +57,64 @@ async def show_vinyl_list(callback: CallbackQuery):
                 if len(vinyl.genres) > 3:
                     text += f" +{len(vinyl.genres) - 3}"
             text += "\n\n"
+        reply_markup = vinyl_list_keyboard(number, page.next_cursor)
 
     await callback.message.edit_text(
         text,
-        reply_markup=vinyl_menu_keyboard(),
+        reply_markup=reply_markup,
         parse_mode="Markdown"
     )
     await callback.answer()
 
 
+@router.callback_query(F.data == "vinyl_list")
+async def show_vinyl_list(callback: CallbackQuery):
+    """Показать первую страницу списка винила"""
+    await show_vinyl_list_page(callback)
+
+
+@router.callback_query(PageCallback.filter(F.section == "vinyl_list"))
+async def turn_vinyl_list_page(callback: CallbackQuery, callback_data: PageCallback):
+    """Перелистнуть список винила"""
+    await show_vinyl_list_page(callback, callback_data.cursor, callback_data.number)
+
+
+# Заголовки выбора винила по текущему состоянию FSM
+SELECTION_TITLES = {
+    VinylStates.waiting_for_delete_selection.state: "🗑️ *Удаление винила*\n\nВыберите винил для удаления:",
+    VinylStates.waiting_for_vinyl_selection.state: "✏️ *Редактирование винила*\n\nВыберите винил для редактирования:",
+}
+
+
+async def show_vinyl_selection_page(callback: CallbackQuery, title: str, page: Page, number: int = 1):
+    """Показать загруженную страницу клавиатуры выбора винила"""
+    await callback.message.edit_text(
+        title,
+        reply_markup=vinyl_selection_keyboard(page.items, number, page.next_cursor),
+        parse_mode="Markdown"
+    )
+    await callback.answer()
+
+
+@router.callback_query(PageCallback.filter(F.section == "vinyl_select"))
+async def turn_vinyl_selection_page(callback: CallbackQuery, callback_data: PageCallback, state: FSMContext):
+    """Перелистнуть клавиатуру выбора винила"""
+    title = SELECTION_TITLES.get(await state.get_state())
+    if title is None:
+        # Сценарий завершен или истек по TTL
+        await callback.message.edit_text(
+            "🎵 *Управление винилом*\n\n"
+            "Выберите действие:",
+            reply_markup=vinyl_menu_keyboard(),
+            parse_mode="Markdown"
+        )
+        await callback.answer()
+        return
+
+    page, number = await load_vinyl_page(callback_data.cursor, callback_data.number)
+    await show_vinyl_selection_page(callback, title, page, number)
+
+
 @router.callback_query(F.data == "vinyl_add")
 async def start_add_vinyl(callback: CallbackQuery, state: FSMContext):
     """Начать добавление нового винила"""
@@ -222,12 +285,12 @@ async def process_photo(message: Message, state: FSMContext, bot: Bot):
     # Получаем самое большое фото
     photo = message.photo[-1]
 
-    # Загружаем фото в S3
+    # Загружаем фото и его уменьшенные копии в S3
     s3_service = S3Service()
-    photo_url = await s3_service.upload_photo(bot, photo, "vinyl")
+    uploaded = await s3_service.upload_image(bot, photo, "vinyl")
 
-    if photo_url:
-        await state.update_data(photo_url=photo_url)
+    if uploaded:
+        await state.update_data(photo_url=uploaded["url"], photo_variants=uploaded["variants"])
         await message.answer("📸 Фото успешно загружено!")
     else:
         await message.answer("⚠️ Не удалось загрузить фото, но винил будет добавлен без фото.")
@@ -271,7 +334,8 @@ async def finish_adding_vinyl_with_data(message: Message, state: FSMContext):
                 title=data['title'],
                 year=data.get('year'),
                 genres=data.get('genres', []),
-                photo_url=data.get('photo_url')
+                photo_url=data.get('photo_url'),
+                photo_variants=data.get('photo_variants')
             )
             await service.commit()
 
@@ -343,11 +407,9 @@ async def skip_field(callback: CallbackQuery, state: FSMContext):
 @router.callback_query(F.data == "vinyl_delete")
 async def start_delete_vinyl(callback: CallbackQuery, state: FSMContext):
     """Начать удаление винила"""
-    async with get_db_session() as db:
-        service = VinylService(db)
-        vinyl_records = await service.get_all_vinyl()
+    page, _ = await load_vinyl_page()
 
-    if not vinyl_records:
+    if not page.items:
         await callback.message.edit_text(
             "🗑️ *Удаление винила*\n\n❌ Винил не найден",
             reply_markup=vinyl_menu_keyboard(),
@@ -357,14 +419,7 @@ async def start_delete_vinyl(callback: CallbackQuery, state: FSMContext):
         return
 
     await state.set_state(VinylStates.waiting_for_delete_selection)
-
-    await callback.message.edit_text(
-        "🗑️ *Удаление винила*\n\n"
-        "Выберите винил для удаления:",
-        reply_markup=vinyl_selection_keyboard(vinyl_records),
-        parse_mode="Markdown"
-    )
-    await callback.answer()
+    await show_vinyl_selection_page(callback, SELECTION_TITLES[VinylStates.waiting_for_delete_selection.state], page)
 
 
 @router.callback_query(F.data.startswith("select_vinyl_"), VinylStates.waiting_for_delete_selection)
@@ -408,6 +463,7 @@ async def delete_vinyl_confirmed(callback: CallbackQuery, state: FSMContext):
     try:
         async with get_db_session() as db:
             service = VinylService(db)
+            vinyl = await service.get_vinyl_by_id(vinyl_id)
             success = await service.delete_vinyl(vinyl_id)
 
             if success:
@@ -425,6 +481,10 @@ async def delete_vinyl_confirmed(callback: CallbackQuery, state: FSMContext):
                     parse_mode="Markdown"
                 )
 
+        # Фото удаляется из S3, только если оно больше нигде не используется
+        if success and vinyl and vinyl.photo_url:
+            await S3Service().release_photo(vinyl.photo_url, vinyl.photo_variants)
+
     except Exception as e:
         logger.error(f"Ошибка при удалении винила: {e}")
         await callback.message.edit_text(
@@ -442,11 +502,9 @@ async def delete_vinyl_confirmed(callback: CallbackQuery, state: FSMContext):
 @router.callback_query(F.data == "vinyl_edit")
 async def start_edit_vinyl(callback: CallbackQuery, state: FSMContext):
     """Начать редактирование винила"""
-    async with get_db_session() as db:
-        service = VinylService(db)
-        vinyl_records = await service.get_all_vinyl()
+    page, _ = await load_vinyl_page()
 
-    if not vinyl_records:
+    if not page.items:
         await callback.message.edit_text(
             "✏️ *Редактирование винила*\n\n❌ Винил не найден",
             reply_markup=vinyl_menu_keyboard(),
@@ -456,14 +514,7 @@ async def start_edit_vinyl(callback: CallbackQuery, state: FSMContext):
         return
 
     await state.set_state(VinylStates.waiting_for_vinyl_selection)
-
-    await callback.message.edit_text(
-        "✏️ *Редактирование винила*\n\n"
-        "Выберите винил для редактирования:",
-        reply_markup=vinyl_selection_keyboard(vinyl_records),
-        parse_mode="Markdown"
-    )
-    await callback.answer()
+    await show_vinyl_selection_page(callback, SELECTION_TITLES[VinylStates.waiting_for_vinyl_selection.state], page)
 
 
 @router.callback_query(F.data.startswith("select_vinyl_"), VinylStates.waiting_for_vinyl_selection)
@@ -671,6 +722,7 @@ async def process_edit_photo(message: Message, state: FSMContext, bot: Bot):
 
     # Получаем старое фото для удаления из S3
     old_photo_url = None
+    old_photo_variants = None
     if vinyl_id:
         try:
             async with get_db_session() as db:
@@ -678,20 +730,26 @@ async def process_edit_photo(message: Message, state: FSMContext, bot: Bot):
                 vinyl = await service.get_vinyl_by_id(vinyl_id)
                 if vinyl and hasattr(vinyl, 'photo_url'):
                     old_photo_url = vinyl.photo_url
+                    old_photo_variants = vinyl.photo_variants
         except Exception as e:
             logger.error(f"Ошибка при получении старого фото: {e}")
 
-    # Загружаем новое фото в S3
+    # Загружаем новое фото и его уменьшенные копии в S3
     s3_service = S3Service()
-    photo_url = await s3_service.upload_photo(bot, photo, "vinyl")
-
-    if photo_url:
-        # Удаляем старое фото из S3
-        if old_photo_url:
-            await s3_service.delete_photo(old_photo_url)
+    uploaded = await s3_service.upload_image(bot, photo, "vinyl")
 
+    if uploaded:
         await message.answer("📸 Фото успешно обновлено!")
-        await update_vinyl_field(message, state, photo_url=photo_url)
+        await update_vinyl_field(
+            message, state,
+            photo_url=uploaded["url"],
+            photo_variants=uploaded["variants"]
+        )
+
+        # Старое фото удаляем после сохранения новой ссылки и только если
+        # на него больше никто не ссылается (то же фото могло быть загружено снова)
+        if old_photo_url and old_photo_url != uploaded["url"]:
+            await s3_service.release_photo(old_photo_url, old_photo_variants)
     else:
         await message.answer("⚠️ Не удалось загрузить новое фото.")
         await update_vinyl_field(message, state)
@@ -705,18 +763,19 @@ async def skip_edit_photo(callback: CallbackQuery, state: FSMContext):
     vinyl_id = data.get('vinyl_id')
 
     # Получаем старое фото для удаления из S3
+    vinyl = None
     if vinyl_id:
         try:
             async with get_db_session() as db:
                 service = VinylService(db)
                 vinyl = await service.get_vinyl_by_id(vinyl_id)
-                if vinyl and hasattr(vinyl, 'photo_url') and vinyl.photo_url:
-                    s3_service = S3Service()
-                    await s3_service.delete_photo(vinyl.photo_url)
         except Exception as e:
-            logger.error(f"Ошибка при удалении старого фото: {e}")
+            logger.error(f"Ошибка при получении старого фото: {e}")
+
+    await update_vinyl_field(callback.message, state, clear_photo=True)
 
-    await update_vinyl_field(callback.message, state, photo_url=None)
+    if vinyl and vinyl.photo_url:
+        await S3Service().release_photo(vinyl.photo_url, vinyl.photo_variants)
     await callback.answer("Фото удалено")
 
 
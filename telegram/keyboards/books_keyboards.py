@@ -1,9 +1,13 @@
 """
 Клавиатуры для управления книгами
 """
+from typing import Optional
+
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
+from keyboards.pagination import button_text, paginated_keyboard
+
 
 def books_menu_keyboard() -> InlineKeyboardMarkup:
     """Меню управления книгами"""
@@ -13,34 +17,40 @@ def books_menu_keyboard() -> InlineKeyboardMarkup:
         InlineKeyboardButton(text="➕ Добавить книгу", callback_data="books_add"),
         InlineKeyboardButton(text="✏️ Редактировать", callback_data="books_edit"),
         InlineKeyboardButton(text="🗑️ Удалить", callback_data="books_delete"),
+        InlineKeyboardButton(text="📥 Импорт из файла", callback_data="import_books"),
         InlineKeyboardButton(text="🔙 Назад", callback_data="main_menu")
     )
-    builder.adjust(1, 1, 2, 1)
+    builder.adjust(1, 1, 2, 1, 1)
     return builder.as_markup()
 
 
-def books_selection_keyboard(books) -> InlineKeyboardMarkup:
-    """Клавиатура выбора книги"""
-    builder = InlineKeyboardBuilder()
-
-    for book in books:
+def books_selection_keyboard(books, number: int = 1, next_cursor: Optional[str] = None) -> InlineKeyboardMarkup:
+    """Клавиатура выбора книги (одна страница)"""
+    def book_button(book) -> InlineKeyboardButton:
         display_text = book.title
         if book.author:
             display_text += f" - {book.author}"
+        return InlineKeyboardButton(text=button_text(display_text), callback_data=f"select_book_{book.id}")
+
+    return paginated_keyboard(
+        books,
+        book_button,
+        section="books_select",
+        number=number,
+        next_cursor=next_cursor,
+        back_callback="books_menu"
+    )
 
-        if len(display_text) > 40:
-            display_text = display_text[:37] + "..."
 
-        builder.add(
-            InlineKeyboardButton(
-                text=display_text,
-                callback_data=f"select_book_{book.id}"
-            )
-        )
-
-    builder.add(InlineKeyboardButton(text="🔙 Назад", callback_data="books_menu"))
-    builder.adjust(1)
-    return builder.as_markup()
+def books_list_keyboard(number: int = 1, next_cursor: Optional[str] = None) -> InlineKeyboardMarkup:
+    """Навигация по страницам списка книг"""
+    return paginated_keyboard(
+        (), None,
+        section="books_list",
+        number=number,
+        next_cursor=next_cursor,
+        back_callback="books_menu"
+    )
 
 
 def book_edit_fields_keyboard() -> InlineKeyboardMarkup:
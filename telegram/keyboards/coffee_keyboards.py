@@ -47,9 +47,10 @@ def coffee_menu_keyboard() -> InlineKeyboardMarkup:
         InlineKeyboardButton(text="🏷️ Бренды", callback_data="coffee_brands"),
         InlineKeyboardButton(text="☕ Кофе", callback_data="coffee_list"),
         InlineKeyboardButton(text="📝 Отзывы", callback_data="coffee_reviews"),
+        InlineKeyboardButton(text="📥 Импорт из файла", callback_data="import_coffee"),
         InlineKeyboardButton(text="🔙 Назад", callback_data="main_menu")
     )
-    builder.adjust(2, 1, 1)
+    builder.adjust(2, 1, 1, 1)
     return builder.as_markup()
 
 
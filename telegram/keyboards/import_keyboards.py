@@ -0,0 +1,25 @@
+"""
+Клавиатуры для массового импорта
+"""
+from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
+from aiogram.utils.keyboard import InlineKeyboardBuilder
+
+
+def import_collections_keyboard() -> InlineKeyboardMarkup:
+    """Выбор коллекции для импорта"""
+    builder = InlineKeyboardBuilder()
+    builder.add(
+        InlineKeyboardButton(text="🎵 Винил", callback_data="import_vinyl"),
+        InlineKeyboardButton(text="📚 Книги", callback_data="import_books"),
+        InlineKeyboardButton(text="☕ Кофе", callback_data="import_coffee"),
+        InlineKeyboardButton(text="🔙 Назад", callback_data="main_menu")
+    )
+    builder.adjust(3, 1)
+    return builder.as_markup()
+
+
+def cancel_keyboard() -> InlineKeyboardMarkup:
+    """Клавиатура отмены"""
+    builder = InlineKeyboardBuilder()
+    builder.add(InlineKeyboardButton(text="❌ Отмена", callback_data="cancel_action"))
+    return builder.as_markup()
@@ -0,0 +1,84 @@
+"""
+Постраничные inline-клавиатуры для больших коллекций
+
+Страницы загружаются по одной keyset-запросом (BaseRepository.list_page),
+а кнопки навигации несут курсор следующей страницы в callback data —
+поэтому ни клавиатура, ни запрос не растут вместе с коллекцией.
+"""
+from typing import Callable, Iterable, Optional
+
+from aiogram.filters.callback_data import CallbackData
+from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
+from aiogram.utils.keyboard import InlineKeyboardBuilder
+
+# Максимальная длина текста кнопки с записью
+BUTTON_TEXT_LIMIT = 40
+
+
+class PageCallback(CallbackData, prefix="pg"):
+    """
+    Переход на страницу списка
+
+    section — какой список листается (например, "vinyl_select"),
+    cursor — курсор keyset-страницы (пустой для первой), number — номер
+    страницы для подписи. Вместе не больше 64 байт, которые допускает Telegram.
+    """
+    section: str
+    cursor: str = ""
+    number: int = 1
+
+
+def button_text(text: str) -> str:
+    """Обрезать текст кнопки до BUTTON_TEXT_LIMIT символов"""
+    if len(text) > BUTTON_TEXT_LIMIT:
+        return text[:BUTTON_TEXT_LIMIT - 3] + "..."
+    return text
+
+
+def pagination_buttons(section: str, number: int, next_cursor: Optional[str]) -> list:
+    """Кнопки навигации: в начало и на следующую страницу"""
+    buttons = []
+    if number > 1:
+        buttons.append(InlineKeyboardButton(
+            text="⏮️ В начало",
+            callback_data=PageCallback(section=section).pack()
+        ))
+    if next_cursor:
+        buttons.append(InlineKeyboardButton(
+            text=f"Стр. {number + 1} ▶️",
+            callback_data=PageCallback(section=section, cursor=next_cursor, number=number + 1).pack()
+        ))
+    return buttons
+
+
+def paginated_keyboard(
+    items: Iterable,
+    item_button: Optional[Callable[[object], InlineKeyboardButton]],
+    section: str,
+    number: int,
+    next_cursor: Optional[str],
+    back_callback: str
+) -> InlineKeyboardMarkup:
+    """
+    Клавиатура одной страницы списка
+
+    Args:
+        items: Записи текущей страницы
+        item_button: Кнопка для записи; None — список без кнопок записей
+        section: Имя списка для PageCallback
+        number: Номер текущей страницы
+        next_cursor: Курсор следующей страницы (None на последней)
+        back_callback: callback data кнопки «Назад»
+    """
+    builder = InlineKeyboardBuilder()
+
+    if item_button is not None:
+        for item in items:
+            builder.row(item_button(item))
+
+    navigation = pagination_buttons(section, number, next_cursor)
+    if navigation:
+        builder.row(*navigation)
+
+    builder.row(InlineKeyboardButton(text="🔙 Назад", callback_data=back_callback))
+    return builder.as_markup()
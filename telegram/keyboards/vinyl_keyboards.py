@@ -1,9 +1,13 @@
 """
 Клавиатуры для управления винилом
 """
+from typing import Optional
+
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
+from keyboards.pagination import button_text, paginated_keyboard
+
 
 def vinyl_menu_keyboard() -> InlineKeyboardMarkup:
     """Меню управления винилом"""
@@ -13,31 +17,37 @@ def vinyl_menu_keyboard() -> InlineKeyboardMarkup:
         InlineKeyboardButton(text="➕ Добавить винил", callback_data="vinyl_add"),
         InlineKeyboardButton(text="✏️ Редактировать", callback_data="vinyl_edit"),
         InlineKeyboardButton(text="🗑️ Удалить", callback_data="vinyl_delete"),
+        InlineKeyboardButton(text="📥 Импорт из файла", callback_data="import_vinyl"),
         InlineKeyboardButton(text="🔙 Назад", callback_data="main_menu")
     )
-    builder.adjust(1, 1, 2, 1)
+    builder.adjust(1, 1, 2, 1, 1)
     return builder.as_markup()
 
 
-def vinyl_selection_keyboard(vinyl_records) -> InlineKeyboardMarkup:
-    """Клавиатура выбора винила"""
-    builder = InlineKeyboardBuilder()
-
-    for vinyl in vinyl_records:
-        display_text = f"{vinyl.artist} - {vinyl.title}"
-        if len(display_text) > 40:
-            display_text = display_text[:37] + "..."
+def vinyl_selection_keyboard(vinyl_records, number: int = 1, next_cursor: Optional[str] = None) -> InlineKeyboardMarkup:
+    """Клавиатура выбора винила (одна страница)"""
+    return paginated_keyboard(
+        vinyl_records,
+        lambda vinyl: InlineKeyboardButton(
+            text=button_text(f"{vinyl.artist} - {vinyl.title}"),
+            callback_data=f"select_vinyl_{vinyl.id}"
+        ),
+        section="vinyl_select",
+        number=number,
+        next_cursor=next_cursor,
+        back_callback="vinyl_menu"
+    )
 
-        builder.add(
-            InlineKeyboardButton(
-                text=display_text,
-                callback_data=f"select_vinyl_{vinyl.id}"
-            )
-        )
 
-    builder.add(InlineKeyboardButton(text="🔙 Назад", callback_data="vinyl_menu"))
-    builder.adjust(1)
-    return builder.as_markup()
+def vinyl_list_keyboard(number: int = 1, next_cursor: Optional[str] = None) -> InlineKeyboardMarkup:
+    """Навигация по страницам списка винила"""
+    return paginated_keyboard(
+        (), None,
+        section="vinyl_list",
+        number=number,
+        next_cursor=next_cursor,
+        back_callback="vinyl_menu"
+    )
 
 
 def vinyl_edit_fields_keyboard() -> InlineKeyboardMarkup:
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Отправка записанных обновлений в локальный webhook-сервер бота
+
+Пример:
+    BOT_MODE=webhook python bot.py
+    python post_update.py sample_updates/start.json --user-id $ADMIN_TELEGRAM_ID
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+import aiohttp
+
+SECRET_TOKEN_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+
+def load_updates(paths):
+    """Прочитать обновления из .json (объект или список) и .jsonl файлов"""
+    for path in paths:
+        text = Path(path).read_text(encoding="utf-8")
+        if path.endswith(".jsonl"):
+            for line in text.splitlines():
+                if line.strip():
+                    yield json.loads(line)
+            continue
+        data = json.loads(text)
+        yield from (data if isinstance(data, list) else [data])
+
+
+def override_user(update: dict, user_id: int) -> dict:
+    """Подставить ID пользователя, чтобы обновление прошло AdminMiddleware"""
+    for event in update.values():
+        if not isinstance(event, dict):
+            continue
+        if "from" in event:
+            event["from"]["id"] = user_id
+        chat = event.get("chat") or (event.get("message") or {}).get("chat")
+        if chat and chat.get("type") == "private":
+            chat["id"] = user_id
+    return update
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Отправить записанные обновления в webhook")
+    parser.add_argument("files", nargs="+", help="JSON/JSONL файлы с обновлениями")
+    parser.add_argument("--url", default="http://localhost:8080/telegram/webhook")
+    parser.add_argument(
+        "--secret", default=os.environ.get("WEBHOOK_SECRET", ""),
+        help="значение WEBHOOK_SECRET (по умолчанию из окружения)"
+    )
+    parser.add_argument("--user-id", type=int, help="подставить ID пользователя")
+    parser.add_argument("--concurrency", type=int, default=1, help="одновременных запросов")
+    args = parser.parse_args()
+
+    updates = list(load_updates(args.files))
+    if args.user_id:
+        updates = [override_user(update, args.user_id) for update in updates]
+
+    headers = {SECRET_TOKEN_HEADER: args.secret} if args.secret else {}
+    semaphore = asyncio.Semaphore(args.concurrency)
+    failed = 0
+
+    async with aiohttp.ClientSession(headers=headers) as session:
+        async def post(update):
+            nonlocal failed
+            async with semaphore:
+                async with session.post(args.url, json=update) as response:
+                    print(f"update_id={update.get('update_id')}: {response.status}")
+                    if response.status != 200:
+                        failed += 1
+
+        await asyncio.gather(*(post(update) for update in updates))
+
+    print(f"Отправлено: {len(updates)}, ошибок: {failed}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
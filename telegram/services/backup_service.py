@@ -0,0 +1,37 @@
+"""
+Резервная копия всех коллекций для отправки в Telegram
+Использует потоковый экспорт из backend (app.services.backup)
+"""
+import sys
+import os
+import tempfile
+from typing import Tuple
+
+from database import get_db_session
+
+# Добавляем путь к backend для импорта сервиса резервного копирования
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../backend'))
+
+# Импорты после добавления пути
+from app.services.backup import BackupStats, export_backup  # noqa: E402
+
+# Максимальный размер файла, который бот может отправить через Bot API
+TELEGRAM_UPLOAD_LIMIT = 50 * 1024 * 1024
+
+
+async def create_backup_file() -> Tuple[str, BackupStats]:
+    """
+    Записать резервную копию (gzip JSON Lines) во временный файл
+
+    Returns:
+        Путь к файлу и статистика; удалить файл должен вызывающий
+    """
+    fd, path = tempfile.mkstemp(prefix="backup-", suffix=".jsonl.gz")
+    try:
+        with os.fdopen(fd, "wb") as output:
+            async with get_db_session() as db:
+                stats = await export_backup(db, output)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path, stats
@@ -8,12 +8,16 @@ from typing import List, Optional, Dict, Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from config import config
+
 # Добавляем путь к backend для импорта моделей и репозиториев
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../backend'))
 
 # Импорты после добавления пути
 from app.models.books import Book  # noqa: E402
+from app.repositories.base import Page  # noqa: E402
 from app.repositories.books import BookRepository  # noqa: E402
+from services.vocabulary_service import VocabularyService, vocabulary_cache  # noqa: E402
 
 
 class BooksService:
@@ -29,6 +33,10 @@ class BooksService:
         """Получить все книги"""
         return await self.book_repo.list()
 
+    async def get_books_page(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page[Book]:
+        """Страница книг (новые первыми) и курсор следующей страницы"""
+        return await self.book_repo.list_page(limit or config.page_size, after=cursor or None, descending=True)
+
     async def create_book(
         self,
         title: str,
@@ -137,36 +145,15 @@ class BooksService:
 
     async def get_all_genres(self) -> List[str]:
         """Получить все уникальные жанры из базы данных"""
-        all_books = await self.get_all_books()
-        genres = set()
-
-        for book in all_books:
-            if book.genre:
-                genres.add(book.genre)
-
-        return sorted(list(genres))
+        return await VocabularyService(self.db).get("book_genres")
 
     async def get_all_languages(self) -> List[str]:
         """Получить все уникальные языки из базы данных"""
-        all_books = await self.get_all_books()
-        languages = set()
-
-        for book in all_books:
-            if book.language:
-                languages.add(book.language)
-
-        return sorted(list(languages))
+        return await VocabularyService(self.db).get("book_languages")
 
     async def get_all_formats(self) -> List[str]:
         """Получить все уникальные форматы из базы данных"""
-        all_books = await self.get_all_books()
-        formats = set()
-
-        for book in all_books:
-            if book.format:
-                formats.add(book.format)
-
-        return sorted(list(formats))
+        return await VocabularyService(self.db).get("book_formats")
 
     async def add_quote_to_book(
         self,
@@ -190,6 +177,8 @@ class BooksService:
     async def commit(self):
         """Зафиксировать изменения в БД"""
         await self.db.commit()
+        # Новые значения должны сразу появиться в клавиатурах
+        vocabulary_cache.invalidate_model(Book)
 
     async def rollback(self):
         """Откатить изменения в БД"""
@@ -13,7 +13,9 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '../../backend'))
 
 # Импорты после добавления пути
 from app.models.figures import Figure  # noqa: E402
+from app.repositories.base import DEFAULT_SEARCH_LIMIT  # noqa: E402
 from app.repositories.figures import FigureRepository  # noqa: E402
+from services.vocabulary_service import VocabularyService, vocabulary_cache  # noqa: E402
 
 
 class FiguresService:
@@ -66,16 +68,9 @@ class FiguresService:
         """Удалить фигурку"""
         return await self.figure_repo.delete(figure_id)
 
-    async def search_figures(self, query: str) -> List[Figure]:
-        """Поиск фигурок по названию или бренду"""
-        all_figures = await self.get_all_figures()
-        query_lower = query.lower()
-
-        return [
-            figure for figure in all_figures
-            if (query_lower in figure.name.lower()) or
-            (query_lower in figure.brand.lower())
-        ]
+    async def search_figures(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Figure]:
+        """Поиск фигурок по названию или бренду (ILIKE по trigram-индексам, лучшие совпадения первыми)"""
+        return await self.figure_repo.search(query, ("name", "brand"), limit=limit)
 
     async def get_figures_by_brand(self, brand: str) -> List[Figure]:
         """Получить фигурки по бренду"""
@@ -96,27 +91,17 @@ class FiguresService:
 
     async def get_all_brands(self) -> List[str]:
         """Получить все уникальные бренды"""
-        all_figures = await self.get_all_figures()
-        brands = set()
-
-        for figure in all_figures:
-            brands.add(figure.brand)
-
-        return sorted(list(brands))
+        return await VocabularyService(self.db).get("figure_brands")
 
     async def get_figures_count_by_brand(self) -> dict:
         """Получить количество фигурок по брендам"""
-        all_figures = await self.get_all_figures()
-        brand_counts = {}
-
-        for figure in all_figures:
-            brand_counts[figure.brand] = brand_counts.get(figure.brand, 0) + 1
-
-        return brand_counts
+        return await self.figure_repo.count_by_brand()
 
     async def commit(self):
         """Зафиксировать изменения в БД"""
         await self.db.commit()
+        # Новые значения должны сразу появиться в клавиатурах
+        vocabulary_cache.invalidate_model(Figure)
 
     async def rollback(self):
         """Откатить изменения в БД"""
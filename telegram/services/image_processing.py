@@ -0,0 +1,136 @@
+"""
+Обработка изображений перед загрузкой в S3
+
+Декодирование и кодирование изображений нагружают CPU, поэтому выполняются
+в пуле процессов, а не в event loop бота. Для каждого фото создаются:
+оригинал без EXIF (ориентация применяется заранее) и уменьшенные копии
+нескольких ширин в WebP/AVIF/JPEG.
+"""
+import asyncio
+import io
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+from PIL import Image, ImageOps, features
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPES = {
+    "jpeg": "image/jpeg",
+    "webp": "image/webp",
+    "avif": "image/avif",
+}
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+@dataclass
+class ImageVariant:
+    """Закодированная версия изображения"""
+    width: int
+    height: int
+    format: str
+    data: bytes
+    # False для оригинала (без EXIF), True для уменьшенных копий
+    resized: bool = True
+
+    @property
+    def content_type(self) -> str:
+        return CONTENT_TYPES[self.format]
+
+    @property
+    def extension(self) -> str:
+        return "jpg" if self.format == "jpeg" else self.format
+
+
+def available_formats(formats: Sequence[str]) -> List[str]:
+    """Форматы, которые поддерживает установленная сборка Pillow"""
+    return [fmt for fmt in formats if fmt == "jpeg" or features.check(fmt)]
+
+
+def _encode(image: Image.Image, fmt: str, quality: int) -> bytes:
+    buffer = io.BytesIO()
+    if fmt == "jpeg":
+        image.convert("RGB").save(buffer, "JPEG", quality=quality, optimize=True, progressive=True)
+    elif fmt == "webp":
+        image.save(buffer, "WEBP", quality=quality, method=6)
+    elif fmt == "avif":
+        image.save(buffer, "AVIF", quality=quality)
+    else:
+        raise ValueError(f"Unsupported image format: {fmt}")
+    # Метаданные не передаются в save(), поэтому EXIF/GPS в результат не попадают
+    return buffer.getvalue()
+
+
+def process_image(path: str, widths: Sequence[int], formats: Sequence[str], quality: int) -> List[ImageVariant]:
+    """
+    Подготовить оригинал без EXIF и уменьшенные копии
+
+    Выполняется в дочернем процессе, поэтому принимает и возвращает только
+    сериализуемые значения. Исходный файл читается с диска, а не передается
+    в процесс целиком.
+
+    Args:
+        path: Путь к исходному файлу
+        widths: Ширины уменьшенных копий; копии не шире оригинала пропускаются
+        formats: Форматы уменьшенных копий
+        quality: Качество кодирования (0-100)
+
+    Returns:
+        Оригинал в JPEG и варианты от меньшей ширины к большей
+    """
+    with Image.open(path) as source:
+        # Поворот по EXIF Orientation до удаления метаданных
+        image = ImageOps.exif_transpose(source)
+        image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+
+    variants = [
+        ImageVariant(image.width, image.height, "jpeg", _encode(image, "jpeg", 90), resized=False)
+    ]
+
+    for width in sorted(set(widths)):
+        if width >= image.width:
+            continue
+        height = round(image.height * width / image.width)
+        resized = image.resize((width, height), Image.Resampling.LANCZOS)
+        for fmt in formats:
+            variants.append(ImageVariant(width, height, fmt, _encode(resized, fmt, quality)))
+
+    return variants
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=config.image_workers)
+        return _pool
+
+
+async def process_image_async(path: str) -> List[ImageVariant]:
+    """Обработать файл изображения в пуле процессов с настройками из конфигурации"""
+    formats = available_formats(config.image_variant_formats)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_pool(),
+        process_image,
+        path,
+        tuple(config.image_variant_widths),
+        tuple(formats),
+        config.image_quality
+    )
+
+
+def shutdown_image_pool() -> None:
+    """Остановить пул процессов обработки изображений (при остановке бота)"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True)
+            _pool = None
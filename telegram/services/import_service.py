@@ -0,0 +1,419 @@
+"""
+Массовый импорт коллекций из CSV/JSON-документов
+
+Файл скачивается из Telegram во временный файл (в памяти до 1 МиБ, дальше
+на диске) и разбирается построчно: записи проверяются по одной и
+вставляются пачками `INSERT ... ON CONFLICT DO NOTHING` в одной транзакции.
+Если хотя бы одна запись не прошла проверку, транзакция откатывается
+целиком.
+
+Записи без поля id получают детерминированный UUID по естественному ключу
+(исполнитель + название, название + автор, бренд + название), поэтому
+повторная загрузка того же файла не создает дубликатов.
+"""
+import csv
+import io
+import json
+import logging
+import sys
+import os
+import tempfile
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, IO, Iterator, List, Optional, Tuple
+
+from aiogram import Bot
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator, model_validator
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import config
+
+# Добавляем путь к backend для импорта моделей и репозиториев
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../backend'))
+
+# Импорты после добавления пути
+from app.models.books import Book  # noqa: E402
+from app.models.coffee import Coffee, CoffeeBrand  # noqa: E402
+from app.models.vinyl import VinylRecord  # noqa: E402
+from app.repositories.data_version import DataVersionRepository  # noqa: E402
+from services.vocabulary_service import vocabulary_cache  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+# Пространство имен UUID для записей, импортированных без id
+IMPORT_NAMESPACE = uuid.UUID("6f1c2b9e-4a57-4d0e-9c3b-2f8e5d7a1b60")
+
+# Сколько ошибок проверки показывать пользователю
+MAX_REPORTED_ERRORS = 10
+
+# Данные в памяти до сброса временного файла на диск
+SPOOL_MAX_SIZE = 1024 * 1024
+
+JSON_CHUNK_SIZE = 64 * 1024
+
+SUPPORTED_EXTENSIONS = (".csv", ".json", ".jsonl", ".ndjson")
+
+
+def natural_id(kind: str, *parts: Optional[str]) -> uuid.UUID:
+    """Детерминированный UUID записи по ее естественному ключу"""
+    key = "\x1f".join([kind] + [(part or "").strip().casefold() for part in parts])
+    return uuid.uuid5(IMPORT_NAMESPACE, key)
+
+
+# === ПРОВЕРКА ЗАПИСЕЙ ===
+
+class ImportRow(BaseModel):
+    """Общие правила: пустые строки CSV означают отсутствие значения"""
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True)
+
+    id: Optional[uuid.UUID] = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def empty_strings_to_none(cls, data: Any) -> Any:
+        if isinstance(data, dict):
+            return {key: (None if value == "" else value) for key, value in data.items()}
+        return data
+
+
+class VinylRow(ImportRow):
+    artist: str = Field(min_length=1)
+    title: str = Field(min_length=1)
+    year: Optional[int] = Field(default=None, ge=1800, le=2100)
+    genres: List[str] = []
+
+    @field_validator("genres", mode="before")
+    @classmethod
+    def split_genres(cls, value: Any) -> Any:
+        # В CSV жанры перечисляются через ";"
+        if value is None:
+            return []
+        if isinstance(value, str):
+            return [genre.strip() for genre in value.split(";") if genre.strip()]
+        return value
+
+    def values(self) -> Dict[str, Any]:
+        return {
+            "id": self.id or natural_id("vinyl", self.artist, self.title),
+            "artist": self.artist,
+            "title": self.title,
+            "year": self.year,
+            "genres": self.genres,
+        }
+
+
+class BookRow(ImportRow):
+    title: str = Field(min_length=1)
+    author: Optional[str] = None
+    genre: Optional[str] = None
+    language: Optional[str] = None
+    format: Optional[str] = None
+    review: Optional[str] = None
+    opinion: Optional[str] = None
+
+    def values(self) -> Dict[str, Any]:
+        return {
+            "id": self.id or natural_id("book", self.title, self.author),
+            "title": self.title,
+            "author": self.author,
+            "genre": self.genre,
+            "language": self.language,
+            "format": self.format,
+            "review": self.review,
+            "opinion": self.opinion,
+        }
+
+
+class CoffeeRow(ImportRow):
+    brand: str = Field(min_length=1)
+    name: str = Field(min_length=1)
+    region: Optional[str] = None
+    processing: Optional[str] = None
+
+    def values(self) -> Dict[str, Any]:
+        return {
+            "id": self.id or natural_id("coffee", self.brand, self.name),
+            "name": self.name,
+            "region": self.region,
+            "processing": self.processing,
+        }
+
+
+# Коллекция -> (модель, схема строки, название для сообщений)
+COLLECTIONS = {
+    "vinyl": (VinylRecord, VinylRow, "винил"),
+    "books": (Book, BookRow, "книги"),
+    "coffee": (Coffee, CoffeeRow, "кофе"),
+}
+
+
+class ImportValidationError(ValueError):
+    """Файл содержит некорректные записи; ничего не импортировано"""
+
+    def __init__(self, errors: List[str], total: int):
+        self.errors = errors
+        self.total = total
+        super().__init__(f"{total} invalid records")
+
+
+@dataclass
+class ImportResult:
+    """Прогресс и итог импорта"""
+    processed: int = 0
+    inserted: int = 0
+    errors: List[str] = field(default_factory=list)
+    error_count: int = 0
+
+    @property
+    def skipped(self) -> int:
+        """Записи, которые уже были в базе"""
+        return self.processed - self.error_count - self.inserted
+
+
+# === ЧТЕНИЕ ФАЙЛОВ ===
+
+def iter_json_array(stream: IO[str], chunk_size: int = JSON_CHUNK_SIZE) -> Iterator[Any]:
+    """Элементы JSON-массива верхнего уровня без загрузки всего документа"""
+    decoder = json.JSONDecoder()
+    buffer = stream.read(chunk_size).lstrip()
+    if not buffer.startswith("["):
+        raise ValueError("JSON document must be an array of objects")
+    buffer = buffer[1:]
+    expect_value = True
+
+    while True:
+        buffer = buffer.lstrip()
+        if not buffer or (buffer[0] not in ",]" and not expect_value):
+            if buffer:
+                raise ValueError("Expected ',' or ']' between JSON array items")
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                raise ValueError("Unexpected end of JSON document")
+            buffer = chunk
+            continue
+        if buffer[0] == "]":
+            return
+        if buffer[0] == ",":
+            if expect_value:
+                raise ValueError("Unexpected ',' in JSON array")
+            buffer = buffer[1:]
+            expect_value = True
+            continue
+
+        try:
+            value, end = decoder.raw_decode(buffer)
+        except json.JSONDecodeError:
+            # Элемент разрезан границей чтения
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                raise
+            buffer += chunk
+            continue
+        if end == len(buffer):
+            # Число в конце буфера может продолжаться в следующем куске
+            chunk = stream.read(chunk_size)
+            if chunk:
+                buffer += chunk
+                continue
+
+        yield value
+        buffer = buffer[end:]
+        expect_value = False
+
+
+def read_records(stream: IO[bytes], filename: str) -> Iterator[Tuple[int, Any]]:
+    """
+    Записи документа по одной: (номер строки или элемента, запись)
+
+    Поддерживаются CSV с заголовком, JSON-массив объектов и JSON Lines.
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    extension = os.path.splitext(filename.lower())[1]
+
+    if extension == ".csv":
+        reader = csv.DictReader(text)
+        for row in reader:
+            yield reader.line_num, row
+    elif extension in (".jsonl", ".ndjson"):
+        yield from _iter_json_lines(text)
+    elif extension == ".json":
+        # JSON Lines тоже часто сохраняют с расширением .json
+        first = text.read(1)
+        while first.isspace():
+            first = text.read(1)
+        text.seek(0)
+        if first == "[":
+            for number, record in enumerate(iter_json_array(text), 1):
+                yield number, record
+        else:
+            yield from _iter_json_lines(text)
+    else:
+        raise ValueError(f"Unsupported file type: {extension or filename}")
+
+
+def _iter_json_lines(text: IO[str]) -> Iterator[Tuple[int, Any]]:
+    for number, line in enumerate(text, 1):
+        if line.strip():
+            try:
+                yield number, json.loads(line)
+            except json.JSONDecodeError as e:
+                yield number, e
+
+
+def format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc']) or 'запись'}: {item['msg']}"
+        for item in error.errors()
+    )
+
+
+# === ИМПОРТ ===
+
+class ImportService:
+    """Сервис массового импорта коллекций"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def import_records(
+        self,
+        collection: str,
+        records: Iterator[Tuple[int, Any]],
+        progress: Optional[Callable[[ImportResult], Awaitable[None]]] = None
+    ) -> ImportResult:
+        """
+        Проверить и вставить записи пачками в текущей транзакции
+
+        После первой некорректной записи вставка прекращается, но проверка
+        продолжается до конца файла, чтобы сообщить обо всех ошибках сразу.
+
+        Raises:
+            ImportValidationError: если есть некорректные записи
+        """
+        model, row_schema, _ = COLLECTIONS[collection]
+        result = ImportResult()
+        batch: List[BaseModel] = []
+
+        for number, record in records:
+            result.processed += 1
+            try:
+                if isinstance(record, Exception):
+                    raise ValueError(f"некорректный JSON: {record}")
+                if not isinstance(record, dict):
+                    raise ValueError("ожидается объект")
+                row = row_schema.model_validate(record)
+            except (ValidationError, ValueError) as e:
+                result.error_count += 1
+                if len(result.errors) < MAX_REPORTED_ERRORS:
+                    message = format_validation_error(e) if isinstance(e, ValidationError) else str(e)
+                    result.errors.append(f"#{number}: {message}")
+                continue
+
+            if result.error_count:
+                continue
+
+            batch.append(row)
+            if len(batch) >= config.import_batch_size:
+                result.inserted += await self._insert_batch(model, batch)
+                batch = []
+                if progress is not None:
+                    await progress(result)
+
+        if result.error_count:
+            raise ImportValidationError(result.errors, result.error_count)
+
+        if batch:
+            result.inserted += await self._insert_batch(model, batch)
+
+        if result.inserted:
+            # Одно увеличение версии данных на весь импорт
+            await DataVersionRepository(self.db).bump()
+
+        if progress is not None:
+            await progress(result)
+        return result
+
+    async def _insert_batch(self, model, batch: List[BaseModel]) -> int:
+        """Вставить пачку записей, пропуская существующие; вернуть число вставленных"""
+        rows = [row.values() for row in batch]
+        if model is Coffee:
+            brand_ids = await self._ensure_brands({row.brand for row in batch})
+            for row, values in zip(batch, rows):
+                values["brand_id"] = brand_ids[row.brand]
+
+        statement = (
+            insert(model)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=[model.id])
+            .returning(model.id)
+        )
+        result = await self.db.execute(statement)
+        return len(result.all())
+
+    async def _ensure_brands(self, names: set) -> Dict[str, uuid.UUID]:
+        """
+        Создать недостающие бренды кофе и вернуть id всех брендов пачки
+
+        Бренды сравниваются без учета регистра, как в natural_id: "Lavazza"
+        и "lavazza" — один бренд, он создается один раз в первом написании.
+        """
+        spellings: Dict[str, str] = {}
+        for name in sorted(names):
+            spellings.setdefault(name.casefold(), name)
+
+        brand_ids = await self._find_brands(spellings.values())
+        missing = [name for key, name in spellings.items() if key not in brand_ids]
+        if missing:
+            # Без цели конфликта пропускаются совпадения и по id, и по имени
+            await self.db.execute(
+                insert(CoffeeBrand)
+                .values([{"id": natural_id("coffee_brand", name), "name": name} for name in missing])
+                .on_conflict_do_nothing()
+            )
+            brand_ids.update(await self._find_brands(missing))
+        return {name: brand_ids[name.casefold()] for name in names}
+
+    async def _find_brands(self, names) -> Dict[str, uuid.UUID]:
+        """id существующих брендов по названию без учета регистра"""
+        result = await self.db.execute(
+            select(CoffeeBrand.name, CoffeeBrand.id)
+            .where(func.lower(CoffeeBrand.name).in_([name.lower() for name in names]))
+        )
+        return {name.casefold(): brand_id for name, brand_id in result.all()}
+
+    async def commit(self):
+        """Зафиксировать импорт"""
+        await self.db.commit()
+        vocabulary_cache.invalidate_model(Book)
+        vocabulary_cache.invalidate_model(VinylRecord)
+
+    async def rollback(self):
+        """Откатить импорт"""
+        await self.db.rollback()
+
+
+async def download_document(bot: Bot, file_id: str) -> IO[bytes]:
+    """
+    Скачать документ из Telegram во временный файл
+
+    Raises:
+        ValueError: если файл больше IMPORT_MAX_BYTES
+    """
+    file = await bot.get_file(file_id)
+    url = bot.session.api.file_url(bot.token, file.file_path)
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    size = 0
+    try:
+        async for chunk in bot.session.stream_content(url=url, raise_for_status=True):
+            size += len(chunk)
+            if size > config.import_max_bytes:
+                raise ValueError(f"File is larger than {config.import_max_bytes} bytes")
+            spool.write(chunk)
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool
+
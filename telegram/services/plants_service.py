@@ -13,7 +13,9 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '../../backend'))
 
 # Импорты после добавления пути
 from app.models.plants import Plant  # noqa: E402
+from app.repositories.base import DEFAULT_SEARCH_LIMIT  # noqa: E402
 from app.repositories.plants import PlantRepository  # noqa: E402
+from services.vocabulary_service import VocabularyService, vocabulary_cache  # noqa: E402
 
 
 class PlantsService:
@@ -81,18 +83,9 @@ class PlantsService:
         """Удалить растение"""
         return await self.plant_repo.delete(plant_id)
 
-    async def search_plants(self, query: str) -> List[Plant]:
-        """Поиск растений по любому полю"""
-        all_plants = await self.get_all_plants()
-        query_lower = query.lower()
-
-        return [
-            plant for plant in all_plants
-            if (plant.family and query_lower in plant.family.lower()) or
-            (plant.genus and query_lower in plant.genus.lower()) or
-            (plant.species and query_lower in plant.species.lower()) or
-            (plant.common_name and query_lower in plant.common_name.lower())
-        ]
+    async def search_plants(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Plant]:
+        """Поиск растений по любому полю (ILIKE по trigram-индексам, лучшие совпадения первыми)"""
+        return await self.plant_repo.search(query, ("family", "genus", "species", "common_name"), limit=limit)
 
     async def get_plants_by_family(self, family: str) -> List[Plant]:
         """Получить растения по семейству"""
@@ -157,25 +150,11 @@ class PlantsService:
 
     async def get_all_families(self) -> List[str]:
         """Получить все уникальные семейства"""
-        all_plants = await self.get_all_plants()
-        families = set()
-
-        for plant in all_plants:
-            if plant.family:
-                families.add(plant.family)
-
-        return sorted(list(families))
+        return await VocabularyService(self.db).get("plant_families")
 
     async def get_all_genera(self) -> List[str]:
         """Получить все уникальные роды"""
-        all_plants = await self.get_all_plants()
-        genera = set()
-
-        for plant in all_plants:
-            if plant.genus:
-                genera.add(plant.genus)
-
-        return sorted(list(genera))
+        return await VocabularyService(self.db).get("plant_genera")
 
     async def add_photo_to_plant(
         self,
@@ -208,6 +187,8 @@ class PlantsService:
     async def commit(self):
         """Зафиксировать изменения в БД"""
         await self.db.commit()
+        # Новые значения должны сразу появиться в клавиатурах
+        vocabulary_cache.invalidate_model(Plant)
 
     async def rollback(self):
         """Откатить изменения в БД"""
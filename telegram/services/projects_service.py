@@ -13,7 +13,9 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '../../backend'))
 
 # Импорты после добавления пути
 from app.models.projects import Project  # noqa: E402
+from app.repositories.base import DEFAULT_SEARCH_LIMIT  # noqa: E402
 from app.repositories.projects import ProjectRepository  # noqa: E402
+from services.vocabulary_service import VocabularyService, vocabulary_cache  # noqa: E402
 
 
 class ProjectsService:
@@ -71,16 +73,9 @@ class ProjectsService:
         """Удалить проект"""
         return await self.project_repo.delete(project_id)
 
-    async def search_projects(self, query: str) -> List[Project]:
-        """Поиск проектов по названию или описанию"""
-        all_projects = await self.get_all_projects()
-        query_lower = query.lower()
-
-        return [
-            project for project in all_projects
-            if (query_lower in project.name.lower()) or
-            (query_lower in project.description.lower())
-        ]
+    async def search_projects(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Project]:
+        """Поиск проектов по названию или описанию (ILIKE по trigram-индексам, лучшие совпадения первыми)"""
+        return await self.project_repo.search(query, ("name", "description"), limit=limit)
 
     async def get_projects_by_tag(self, tag: str) -> List[Project]:
         """Получить проекты по тегу"""
@@ -105,26 +100,11 @@ class ProjectsService:
 
     async def get_all_tags(self) -> List[str]:
         """Получить все уникальные теги"""
-        all_projects = await self.get_all_projects()
-        all_tags = set()
-
-        for project in all_projects:
-            if project.tags:
-                all_tags.update(project.tags)
-
-        return sorted(list(all_tags))
+        return await VocabularyService(self.db).get("project_tags")
 
     async def get_projects_count_by_tag(self) -> dict:
         """Получить количество проектов по тегам"""
-        all_projects = await self.get_all_projects()
-        tag_counts = {}
-
-        for project in all_projects:
-            if project.tags:
-                for tag in project.tags:
-                    tag_counts[tag] = tag_counts.get(tag, 0) + 1
-
-        return tag_counts
+        return await self.project_repo.count_by_tag()
 
     async def add_tag_to_project(self, project_id: str, tag: str) -> Optional[Project]:
         """Добавить тег к проекту"""
@@ -163,6 +143,8 @@ class ProjectsService:
     async def commit(self):
         """Зафиксировать изменения в БД"""
         await self.db.commit()
+        # Новые значения должны сразу появиться в клавиатурах
+        vocabulary_cache.invalidate_model(Project)
 
     async def rollback(self):
         """Откатить изменения в БД"""
@@ -13,7 +13,9 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '../../backend'))
 
 # Импорты после добавления пути
 from app.models.research import Publication, Infographic  # noqa: E402
+from app.repositories.base import DEFAULT_SEARCH_LIMIT  # noqa: E402
 from app.repositories.research import PublicationRepository, InfographicRepository  # noqa: E402
+from services.vocabulary_service import VocabularyService, vocabulary_cache  # noqa: E402
 
 
 class ResearchService:
@@ -77,16 +79,9 @@ class ResearchService:
         """Удалить публикацию"""
         return await self.publication_repo.delete(publication_id)
 
-    async def search_publications(self, query: str) -> List[Publication]:
-        """Поиск публикаций по названию или месту публикации"""
-        all_publications = await self.get_all_publications()
-        query_lower = query.lower()
-
-        return [
-            pub for pub in all_publications
-            if (query_lower in pub.title.lower()) or
-            (pub.venue and query_lower in pub.venue.lower())
-        ]
+    async def search_publications(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Publication]:
+        """Поиск публикаций по названию или месту публикации (ILIKE по trigram-индексам, лучшие совпадения первыми)"""
+        return await self.publication_repo.search(query, ("title", "venue"), limit=limit)
 
     async def get_publications_by_year(self, year: int) -> List[Publication]:
         """Получить публикации по году"""
@@ -194,36 +189,15 @@ class ResearchService:
 
     async def get_all_publication_years(self) -> List[int]:
         """Получить все уникальные годы публикаций"""
-        all_publications = await self.get_all_publications()
-        years = set()
-
-        for pub in all_publications:
-            if pub.year:
-                years.add(pub.year)
-
-        return sorted(list(years), reverse=True)
+        return await VocabularyService(self.db).get("publication_years")
 
     async def get_all_venues(self) -> List[str]:
         """Получить все уникальные места публикаций"""
-        all_publications = await self.get_all_publications()
-        venues = set()
-
-        for pub in all_publications:
-            if pub.venue:
-                venues.add(pub.venue)
-
-        return sorted(list(venues))
+        return await VocabularyService(self.db).get("publication_venues")
 
     async def get_all_topics(self) -> List[str]:
         """Получить все уникальные темы инфографик"""
-        all_infographics = await self.get_all_infographics()
-        topics = set()
-
-        for info in all_infographics:
-            if info.topic:
-                topics.add(info.topic)
-
-        return sorted(list(topics))
+        return await VocabularyService(self.db).get("infographic_topics")
 
     async def get_publications_count_by_year(self) -> dict:
         """Получить количество публикаций по годам"""
@@ -239,6 +213,9 @@ class ResearchService:
     async def commit(self):
         """Зафиксировать изменения в БД"""
         await self.db.commit()
+        # Новые значения должны сразу появиться в клавиатурах
+        vocabulary_cache.invalidate_model(Publication)
+        vocabulary_cache.invalidate_model(Infographic)
 
     async def rollback(self):
         """Откатить изменения в БД"""
@@ -1,17 +1,158 @@
 """
 Сервис для работы с S3 хранилищем Яндекс.Облако
 """
+import asyncio
+import functools
+import hashlib
+import json
 import os
-import uuid
+import sys
+import tempfile
+import threading
 import logging
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import IO, Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 from aiogram import Bot
 from aiogram.types import PhotoSize
 
+from config import config
+from database import get_db_session
+from services.image_processing import ImageVariant, process_image_async
+
+# Добавляем путь к backend для импорта репозиториев
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../backend'))
+
+from app.repositories.photo_refs import PhotoReferenceRepository  # noqa: E402
+
 logger = logging.getLogger(__name__)
 
+# boto3 синхронный, поэтому вызовы S3 выполняются в отдельном пуле потоков,
+# размер которого ограничивает число одновременных запросов к хранилищу.
+# Клиент потокобезопасен и переиспользуется всеми экземплярами S3Service,
+# чтобы не открывать новое HTTPS-соединение на каждую загрузку.
+_executor: Optional[ThreadPoolExecutor] = None
+_clients: Dict[Tuple[str, str, str, str], Any] = {}
+_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=config.s3_max_concurrency,
+                thread_name_prefix="s3"
+            )
+        return _executor
+
+
+def _get_client(endpoint_url: str, access_key: str, secret_key: str, region: str):
+    """Общий S3 клиент с пулом соединений и повторами с экспоненциальной задержкой"""
+    # Смена секрета при том же ключе доступа должна давать новый клиент;
+    # в ключе кэша храним хеш, а не сам секрет
+    secret_hash = hashlib.sha256(secret_key.encode()).hexdigest()
+    cache_key = (endpoint_url, access_key, secret_hash, region)
+    with _lock:
+        client = _clients.get(cache_key)
+        if client is None:
+            client = boto3.client(
+                's3',
+                endpoint_url=endpoint_url,
+                aws_access_key_id=access_key,
+                aws_secret_access_key=secret_key,
+                region_name=region,
+                config=Config(
+                    max_pool_connections=config.s3_max_concurrency,
+                    connect_timeout=config.s3_connect_timeout,
+                    read_timeout=config.s3_read_timeout,
+                    # standard: экспоненциальная задержка с jitter для 5xx,
+                    # throttling и сетевых ошибок
+                    retries={"mode": "standard", "max_attempts": config.s3_max_attempts}
+                )
+            )
+            _clients[cache_key] = client
+        return client
+
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Максимум ключей в одном запросе DeleteObjects
+DELETE_BATCH_SIZE = 1000
+# Длина хеша (hex) в ключе: 128 бит достаточно, чтобы исключить коллизии
+CONTENT_HASH_LENGTH = 32
+
+
+def content_key(folder: str, digest: str, extension: str, suffix: str = "") -> str:
+    """Ключ объекта, определяемый содержимым: vinyl/<sha256>[_640].webp"""
+    return f"{folder}/{digest[:CONTENT_HASH_LENGTH]}{suffix}.{extension}"
+
+
+def photo_gc_cutoff(grace: Optional[timedelta] = None) -> datetime:
+    """Фото, загруженные после этого момента, еще не удаляются"""
+    grace = grace if grace is not None else timedelta(hours=config.photo_gc_grace_hours)
+    return datetime.now(timezone.utc) - grace
+
+
+def content_stem(s3_key: str) -> str:
+    """Общая часть ключей оригинала, его копий и манифеста: vinyl/<sha256>"""
+    folder, _, name = s3_key.rpartition("/")
+    stem = name.split(".", 1)[0].split("_", 1)[0]
+    return f"{folder}/{stem}" if folder else stem
+
+
+async def _read_chunks(spool: IO[bytes]) -> AsyncIterator[bytes]:
+    """Поток байтов временного файла с начала, чанками как при скачивании"""
+    spool.seek(0)
+    while chunk := spool.read(config.s3_download_chunk_size):
+        yield chunk
+
+
+# S3 требует не менее 5 МиБ в каждой части multipart-загрузки, кроме последней
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+class TransferMetrics:
+    """Метрики потоковых загрузок в S3
+
+    bytes_in_flight — байты, уже скачанные из Telegram, но еще не
+    подтвержденные S3; именно они определяют потребление памяти.
+    """
+
+    def __init__(self):
+        self.bytes_in_flight = 0
+        self.peak_bytes_in_flight = 0
+        self.bytes_uploaded = 0
+        self.uploads = 0
+        self.multipart_uploads = 0
+        self.failed_uploads = 0
+
+    def buffered(self, size: int) -> None:
+        self.bytes_in_flight += size
+        self.peak_bytes_in_flight = max(self.peak_bytes_in_flight, self.bytes_in_flight)
+
+    def released(self, size: int, uploaded: bool = True) -> None:
+        self.bytes_in_flight -= size
+        if uploaded:
+            self.bytes_uploaded += size
+
+    def as_dict(self) -> Dict[str, int]:
+        return dict(vars(self))
+
+
+transfer_metrics = TransferMetrics()
+
+
+def shutdown_s3() -> None:
+    """Дождаться завершения запросов к S3 и освободить потоки (при остановке бота)"""
+    global _executor
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
+
 
 class S3Service:
     """Сервис для загрузки файлов в S3 Яндекс.Облако"""
@@ -30,22 +171,278 @@ class S3Service:
         else:
             self.configured = True
             try:
-                # Создаем S3 клиент для Яндекс.Облако
-                self.s3_client = boto3.client(
-                    's3',
-                    endpoint_url=self.endpoint_url,
-                    aws_access_key_id=self.access_key,
-                    aws_secret_access_key=self.secret_key,
-                    region_name=self.region
+                # Общий S3 клиент для Яндекс.Облако
+                self.s3_client = _get_client(
+                    self.endpoint_url, self.access_key, self.secret_key, self.region
                 )
             except Exception as e:
                 logger.error(f"Failed to create S3 client: {e}")
                 self.configured = False
                 self.s3_client = None
 
-    async def upload_photo(self, bot: Bot, photo: PhotoSize, folder: str = "vinyl") -> Optional[str]:
+    async def _call(self, method: Callable, **kwargs) -> Any:
+        """Выполнить синхронный вызов boto3 в пуле потоков S3, не блокируя event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), functools.partial(method, **kwargs))
+
+    async def upload_stream(self, chunks: AsyncIterator[bytes], s3_key: str, content_type: str) -> int:
         """
-        Загрузить фото в S3 Яндекс.Облако и вернуть URL
+        Загрузить поток байтов в S3 без буферизации всего файла
+
+        Файл меньше одной части уходит одним PutObject. Более крупный
+        загружается multipart-частями по S3_PART_SIZE; одновременно в полете
+        не больше S3_PARTS_IN_FLIGHT частей, поэтому память ограничена
+        примерно (S3_PARTS_IN_FLIGHT + 1) * S3_PART_SIZE. Ключ должен
+        определяться содержимым: объект отдается с кешированием навсегда.
+
+        Returns:
+            Размер загруженного файла в байтах
+        """
+        part_size = max(config.s3_part_size, MIN_PART_SIZE)
+        slots = asyncio.Semaphore(max(config.s3_parts_in_flight, 1))
+        buffer = bytearray()
+        total = 0
+        upload_id: Optional[str] = None
+        parts: List[Dict[str, Any]] = []
+        tasks: List[asyncio.Task] = []
+        # Размеры частей, еще не подтвержденных S3
+        pending: Dict[int, int] = {}
+
+        async def upload_part(number: int, body: bytes) -> None:
+            try:
+                response = await self._call(
+                    self.s3_client.upload_part,
+                    Bucket=self.bucket_name,
+                    Key=s3_key,
+                    UploadId=upload_id,
+                    PartNumber=number,
+                    Body=body
+                )
+            finally:
+                slots.release()
+            parts.append({"PartNumber": number, "ETag": response["ETag"]})
+            transfer_metrics.released(pending.pop(number))
+
+        async def flush_part() -> None:
+            nonlocal buffer, upload_id
+            if upload_id is None:
+                response = await self._call(
+                    self.s3_client.create_multipart_upload,
+                    Bucket=self.bucket_name,
+                    Key=s3_key,
+                    ContentType=content_type,
+                    CacheControl=IMMUTABLE_CACHE_CONTROL,
+                    ACL='public-read'
+                )
+                upload_id = response["UploadId"]
+                transfer_metrics.multipart_uploads += 1
+            await slots.acquire()
+            # Не продолжаем скачивание, если одна из частей уже не загрузилась
+            for task in tasks:
+                if task.done() and task.exception():
+                    slots.release()
+                    raise task.exception()
+            number = len(tasks) + 1
+            body, buffer = bytes(buffer), bytearray()
+            pending[number] = len(body)
+            tasks.append(asyncio.create_task(upload_part(number, body)))
+
+        try:
+            async for chunk in chunks:
+                buffer += chunk
+                total += len(chunk)
+                transfer_metrics.buffered(len(chunk))
+                if len(buffer) >= part_size:
+                    await flush_part()
+
+            if upload_id is None:
+                # Небольшой файл: одна часть, multipart не нужен
+                await self._call(
+                    self.s3_client.put_object,
+                    Bucket=self.bucket_name,
+                    Key=s3_key,
+                    Body=bytes(buffer),
+                    ContentType=content_type,
+                    CacheControl=IMMUTABLE_CACHE_CONTROL,
+                    ACL='public-read'
+                )
+                transfer_metrics.released(len(buffer))
+                buffer = bytearray()
+            else:
+                if buffer:
+                    await flush_part()
+                await asyncio.gather(*tasks)
+                await self._call(
+                    self.s3_client.complete_multipart_upload,
+                    Bucket=self.bucket_name,
+                    Key=s3_key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": sorted(parts, key=lambda part: part["PartNumber"])}
+                )
+
+            transfer_metrics.uploads += 1
+            return total
+
+        except BaseException:
+            transfer_metrics.failed_uploads += 1
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            transfer_metrics.released(len(buffer) + sum(pending.values()), uploaded=False)
+            if upload_id is not None:
+                try:
+                    await self._call(
+                        self.s3_client.abort_multipart_upload,
+                        Bucket=self.bucket_name,
+                        Key=s3_key,
+                        UploadId=upload_id
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to abort multipart upload {s3_key}: {e}")
+            raise
+
+    @staticmethod
+    def _download_stream(bot: Bot, file_path: str) -> AsyncIterator[bytes]:
+        """Поток байтов файла с серверов Telegram"""
+        url = bot.session.api.file_url(bot.token, file_path)
+        return bot.session.stream_content(
+            url=url,
+            chunk_size=config.s3_download_chunk_size,
+            raise_for_status=True
+        )
+
+    def _public_url(self, s3_key: str) -> str:
+        return f"{self.endpoint_url}/{self.bucket_name}/{s3_key}"
+
+    def _key_from_url(self, url: str) -> Optional[str]:
+        prefix = f"{self.endpoint_url}/{self.bucket_name}/"
+        return url[len(prefix):] if url and url.startswith(prefix) else None
+
+    async def _object_exists(self, s3_key: str) -> bool:
+        """HEAD-запрос: есть ли объект с таким ключом"""
+        try:
+            await self._call(self.s3_client.head_object, Bucket=self.bucket_name, Key=s3_key)
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+
+    async def _put_if_absent(self, s3_key: str, body: bytes, content_type: str) -> bool:
+        """
+        Загрузить объект, если его еще нет (HEAD перед PUT)
+
+        Returns:
+            True, если объект был загружен, False — если уже существовал
+        """
+        if await self._object_exists(s3_key):
+            return False
+        await self._call(
+            self.s3_client.put_object,
+            Bucket=self.bucket_name,
+            Key=s3_key,
+            Body=body,
+            ContentType=content_type,
+            # Ключ определяется содержимым, поэтому файл можно кешировать навсегда
+            CacheControl=IMMUTABLE_CACHE_CONTROL,
+            ACL='public-read'
+        )
+        return True
+
+    async def _touch(self, s3_key: str, content_type: str) -> None:
+        """Обновить LastModified объекта, скопировав его в себя"""
+        await self._call(
+            self.s3_client.copy_object,
+            Bucket=self.bucket_name,
+            Key=s3_key,
+            CopySource={"Bucket": self.bucket_name, "Key": s3_key},
+            MetadataDirective="REPLACE",
+            ContentType=content_type
+        )
+
+    async def last_uploaded(self, s3_key: str) -> Optional[datetime]:
+        """Время последней загрузки фото: самый новый из объектов с его хешем"""
+        newest = None
+        async for item in self.list_objects(content_stem(s3_key)):
+            if newest is None or item["LastModified"] > newest:
+                newest = item["LastModified"]
+        return newest
+
+    async def _spool_download(self, bot: Bot, file_path: str, spool: IO[bytes]) -> str:
+        """
+        Скачать файл из Telegram во временный файл, не больше IMAGE_MAX_BYTES
+
+        Returns:
+            SHA-256 содержимого (hex)
+        """
+        hasher = hashlib.sha256()
+        size = 0
+        async for chunk in self._download_stream(bot, file_path):
+            size += len(chunk)
+            if size > config.image_max_bytes:
+                raise ValueError(f"Image is larger than {config.image_max_bytes} bytes")
+            hasher.update(chunk)
+            spool.write(chunk)
+        spool.flush()
+        return hasher.hexdigest()
+
+    async def _get_manifest(self, s3_key: str) -> Optional[Dict[str, Any]]:
+        try:
+            response = await self._call(self.s3_client.get_object, Bucket=self.bucket_name, Key=s3_key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+        return json.loads(response["Body"].read())
+
+    async def _upload_variants(self, folder: str, digest: str, processed: List[ImageVariant]) -> Dict[str, Any]:
+        """Загрузить оригинал без EXIF и уменьшенные копии, вернуть их URL"""
+        keys = [
+            content_key(folder, digest, variant.extension) if not variant.resized
+            else content_key(folder, digest, variant.extension, suffix=f"_{variant.width}")
+            for variant in processed
+        ]
+
+        results = await asyncio.gather(
+            *(
+                self._put_if_absent(key, variant.data, variant.content_type)
+                for key, variant in zip(keys, processed)
+            ),
+            return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            # Не оставляем в бакете неполный набор файлов; уже существовавшие
+            # объекты могут использоваться другими записями
+            await self.delete_objects([key for key, result in zip(keys, results) if result is True])
+            raise errors[0]
+
+        return {
+            "url": self._public_url(keys[0]),
+            "variants": [
+                {
+                    "url": self._public_url(key),
+                    "width": variant.width,
+                    "height": variant.height,
+                    "format": variant.format,
+                }
+                for key, variant in zip(keys[1:], processed[1:])
+            ],
+        }
+
+    async def upload_image(self, bot: Bot, photo: PhotoSize, folder: str = "vinyl") -> Optional[Dict[str, Any]]:
+        """
+        Загрузить фото вместе с уменьшенными копиями в современных форматах
+
+        Оригинал сохраняется в JPEG без EXIF (включая GPS), копии — в
+        ширинах IMAGE_VARIANT_WIDTHS и форматах IMAGE_VARIANT_FORMATS.
+        Ключи строятся из хеша исходного файла, а результат запоминается в
+        манифесте рядом с ним, поэтому повторная загрузка того же фото не
+        обрабатывает и не загружает его заново.
+
+        Исходный файл скачивается во временный файл на диске, а не в память:
+        его открывает по имени процесс обработки, а файл неподдерживаемого
+        формата передается в S3 потоком через upload_stream.
 
         Args:
             bot: Экземпляр бота для скачивания файла
@@ -53,41 +450,52 @@ class S3Service:
             folder: Папка в S3 для сохранения
 
         Returns:
-            URL загруженного файла или None в случае ошибки
+            {"url": str, "variants": [{"url", "width", "height", "format"}, ...]}
+            — подходит и для photo_url/photo_variants, и как основа записи
+            галереи растения; None в случае ошибки
         """
         if not self.configured or not self.s3_client:
             logger.error("S3 credentials not configured")
             return None
 
         try:
-            # Получаем файл из Telegram
             file = await bot.get_file(photo.file_id)
-            file_path = file.file_path
+            with tempfile.NamedTemporaryFile(prefix="photo-") as spool:
+                digest = await self._spool_download(bot, file.file_path, spool)
+                manifest_key = content_key(folder, digest, "json")
 
-            # Генерируем уникальное имя файла
-            file_extension = file_path.split('.')[-1] if '.' in file_path else 'jpg'
-            unique_filename = f"{uuid.uuid4()}.{file_extension}"
-            s3_key = f"{folder}/{unique_filename}"
+                uploaded = await self._get_manifest(manifest_key)
+                if uploaded is not None:
+                    # Новое время манифеста откладывает удаление фото, пока
+                    # сценарий не сохранит запись с его URL
+                    await self._touch(manifest_key, "application/json")
+                    logger.info(f"Photo already in S3, reusing: {uploaded['url']}")
+                    return uploaded
 
-            # Скачиваем файл из Telegram
-            file_data_io = await bot.download_file(file_path)
+                try:
+                    processed = await process_image_async(spool.name)
+                except OSError as e:
+                    # UnidentifiedImageError и поврежденные файлы: Pillow не смог
+                    # их декодировать, загружаем исходный файл как есть
+                    logger.warning(f"Cannot decode image ({e}), uploading without variants")
+                    extension = file.file_path.split('.')[-1] if '.' in file.file_path else 'jpg'
+                    s3_key = content_key(folder, digest, extension)
+                    if not await self._object_exists(s3_key):
+                        await self.upload_stream(_read_chunks(spool), s3_key, f'image/{extension}')
+                    uploaded = {"url": self._public_url(s3_key), "variants": []}
+                else:
+                    uploaded = await self._upload_variants(folder, digest, processed)
 
-            # Получаем байты из BytesIO объекта
-            file_data = file_data_io.getvalue()
-
-            # Загружаем файл в S3 с публичным доступом
-            self.s3_client.put_object(
+            # Манифест загружается последним: его наличие означает полный набор файлов
+            await self._call(
+                self.s3_client.put_object,
                 Bucket=self.bucket_name,
-                Key=s3_key,
-                Body=file_data,
-                ContentType=f'image/{file_extension}',
-                ACL='public-read'
+                Key=manifest_key,
+                Body=json.dumps(uploaded).encode(),
+                ContentType="application/json"
             )
-
-            # Формируем публичный URL
-            upload_url = f"{self.endpoint_url}/{self.bucket_name}/{s3_key}"
-            logger.info(f"Photo uploaded to S3: {upload_url}")
-            return upload_url
+            logger.info(f"Photo uploaded to S3: {uploaded['url']} ({len(uploaded['variants'])} variants)")
+            return uploaded
 
         except NoCredentialsError:
             logger.error("S3 credentials not found")
@@ -99,12 +507,50 @@ class S3Service:
             logger.error(f"Unexpected error uploading photo: {e}")
             return None
 
-    async def delete_photo(self, photo_url: str) -> bool:
+    async def delete_objects(self, keys: List[str]) -> List[str]:
         """
-        Удалить фото из S3 Яндекс.Облако
+        Удалить объекты по ключам пакетами DeleteObjects (до 1000 ключей в запросе)
+
+        Args:
+            keys: Ключи объектов в бакете
+
+        Returns:
+            Ключи, которые не удалось удалить
+        """
+        failed: List[str] = []
+        for start in range(0, len(keys), DELETE_BATCH_SIZE):
+            batch = keys[start:start + DELETE_BATCH_SIZE]
+            response = await self._call(
+                self.s3_client.delete_objects,
+                Bucket=self.bucket_name,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True}
+            )
+            for error in response.get("Errors", []):
+                logger.warning(f"Failed to delete {error.get('Key')}: {error.get('Message')}")
+                failed.append(error.get("Key"))
+        return failed
+
+    async def list_objects(self, prefix: str) -> AsyncIterator[Dict[str, Any]]:
+        """Перебрать объекты бакета с префиксом (постранично, по 1000)"""
+        kwargs = {"Bucket": self.bucket_name, "Prefix": prefix}
+        while True:
+            response = await self._call(self.s3_client.list_objects_v2, **kwargs)
+            for item in response.get("Contents", []):
+                yield item
+            if not response.get("IsTruncated"):
+                return
+            kwargs["ContinuationToken"] = response["NextContinuationToken"]
+
+    async def delete_photo(self, photo_url: str, variants: Optional[List[Dict[str, Any]]] = None) -> bool:
+        """
+        Удалить фото (его уменьшенные копии и манифест) из S3 Яндекс.Облако
+
+        Объекты общие для всех записей с тем же содержимым, поэтому
+        обработчики должны вызывать release_photo, а не удалять напрямую.
 
         Args:
             photo_url: URL фото для удаления
+            variants: Варианты фото, как их вернул upload_image
 
         Returns:
             True если удаление успешно, False иначе
@@ -114,15 +560,13 @@ class S3Service:
 
         try:
             # Проверяем, что URL содержит наш bucket
-            if self.bucket_name in photo_url:
-                # Извлекаем ключ из URL
-                s3_key = photo_url.replace(f"{self.endpoint_url}/{self.bucket_name}/", "")
+            s3_key = self._key_from_url(photo_url)
+            if s3_key:
+                variant_keys = [self._key_from_url(variant["url"]) for variant in variants or []]
+                manifest_key = f"{content_stem(s3_key)}.json"
 
-                # Удаляем файл из S3
-                self.s3_client.delete_object(
-                    Bucket=self.bucket_name,
-                    Key=s3_key
-                )
+                # Удаляем файлы из S3
+                await self.delete_objects([s3_key, manifest_key] + [key for key in variant_keys if key])
 
                 logger.info(f"Photo deleted from S3: {photo_url}")
                 return True
@@ -135,3 +579,44 @@ class S3Service:
             return False
 
         return False
+
+    async def release_photo(self, photo_url: Optional[str], variants: Optional[List[Dict[str, Any]]] = None) -> bool:
+        """
+        Удалить фото из S3, если на него больше не ссылается ни одна запись
+
+        Вызывается после коммита изменений, убравших ссылку на фото.
+        Ссылки считаются по vinyl_records и plants.photos. Фото, загруженное
+        позже чем PHOTO_GC_GRACE_HOURS назад, не удаляется: незавершенный
+        сценарий мог получить тот же ключ и еще не сохранить запись. Такое
+        фото уберет gc_photos.py, когда оно станет старше этого срока.
+
+        Returns:
+            True если фото было удалено
+        """
+        if not photo_url or not self.configured or not self.s3_client:
+            return False
+
+        try:
+            async with get_db_session() as db:
+                references = await PhotoReferenceRepository(db).count(photo_url)
+        except Exception as e:
+            # Не удаляем без уверенности: сироту позже уберет gc_photos.py
+            logger.error(f"Не удалось посчитать ссылки на фото {photo_url}: {e}")
+            return False
+
+        if references:
+            logger.info(f"Photo still referenced {references} time(s), keeping: {photo_url}")
+            return False
+
+        s3_key = self._key_from_url(photo_url)
+        if not s3_key:
+            return False
+        try:
+            uploaded_at = await self.last_uploaded(s3_key)
+        except ClientError as e:
+            logger.error(f"S3 client error checking photo age: {e}")
+            return False
+        if uploaded_at is not None and uploaded_at > photo_gc_cutoff():
+            logger.info(f"Photo uploaded recently, leaving it to gc_photos.py: {photo_url}")
+            return False
+        return await self.delete_photo(photo_url, variants)
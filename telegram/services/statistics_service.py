@@ -0,0 +1,109 @@
+"""
+Статистика коллекций для экрана «📊 Статистика»
+
+Все показатели считаются одним агрегирующим запросом в PostgreSQL
+(StatisticsRepository). Результат кешируется по глобальной версии данных,
+которую увеличивает каждая запись через репозитории — и из бота, и из
+backend, — поэтому повторный показ стоит одного чтения версии.
+"""
+import sys
+import os
+from typing import Any, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Добавляем путь к backend для импорта репозиториев
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../backend'))
+
+# Импорты после добавления пути
+from app.repositories.data_version import DataVersionRepository  # noqa: E402
+from app.repositories.statistics import DEFAULT_TOP, StatisticsRepository  # noqa: E402
+
+
+def escape_markdown(value: str) -> str:
+    """Экранировать символы разметки Markdown в пользовательских значениях"""
+    for char in ("_", "*", "`", "["):
+        value = value.replace(char, "\\" + char)
+    return value
+
+
+class StatisticsCache:
+    """Последняя посчитанная статистика и версия данных, для которой она верна"""
+
+    def __init__(self):
+        self.statistics: Optional[Dict[str, Any]] = None
+
+    def get(self, version: int) -> Optional[Dict[str, Any]]:
+        if self.statistics is not None and self.statistics["version"] == version:
+            return self.statistics
+        return None
+
+    def set(self, statistics: Dict[str, Any]) -> None:
+        self.statistics = statistics
+
+    def clear(self) -> None:
+        self.statistics = None
+
+
+statistics_cache = StatisticsCache()
+
+
+class StatisticsService:
+    """Сервис статистики по всем коллекциям"""
+
+    def __init__(self, db: AsyncSession, cache: StatisticsCache = statistics_cache):
+        self.db = db
+        self.cache = cache
+
+    async def get_statistics(self, top: int = DEFAULT_TOP) -> Dict[str, Any]:
+        """Статистика из кеша, если данные не менялись, иначе — свежая"""
+        version = await DataVersionRepository(self.db).get()
+        statistics = self.cache.get(version)
+        if statistics is not None:
+            return statistics
+
+        statistics = await StatisticsRepository(self.db).collect(top)
+        self.cache.set(statistics)
+        return statistics
+
+    @staticmethod
+    def format_statistics(statistics: Dict[str, Any]) -> str:
+        """Форматировать статистику для сообщения (Markdown)"""
+        counts = statistics["counts"]
+        text = (
+            "📊 *Статистика*\n\n"
+            f"🎵 Винил: {counts['vinyl']}\n"
+            f"📚 Книги: {counts['books']}\n"
+            f"☕ Кофе: {counts['coffee']} "
+            f"(брендов: {counts['coffee_brands']}, отзывов: {counts['coffee_reviews']})\n"
+            f"🎭 Фигурки: {counts['figures']}\n"
+            f"🚀 Проекты: {counts['projects']}\n"
+            f"📄 Публикации: {counts['publications']}, инфографики: {counts['infographics']}\n"
+            f"🌱 Растения: {counts['plants']}\n"
+        )
+
+        sections = [
+            ("🎶 Жанры винила", statistics["vinyl_genres"]),
+            ("📖 Жанры книг", statistics["book_genres"]),
+            ("🏷️ Теги проектов", statistics["project_tags"]),
+            ("🏭 Бренды фигурок", statistics["figure_brands"]),
+        ]
+        for title, items in sections:
+            if items:
+                top = ", ".join(f"{escape_markdown(item['name'])} ({item['count']})" for item in items)
+                text += f"\n*{title}:* {top}\n"
+
+        if statistics["coffee_rating"] is not None:
+            text += f"\n⭐ *Средняя оценка кофе:* {statistics['coffee_rating']}/10\n"
+            for method in statistics["coffee_methods"]:
+                text += f"   • {escape_markdown(method['name'])}: {method['rating']} ({method['count']})\n"
+
+        if statistics["top_coffee"]:
+            text += "\n🏆 *Лучший кофе:*\n"
+            for i, coffee in enumerate(statistics["top_coffee"], 1):
+                text += (
+                    f"{i}. {escape_markdown(coffee['brand'])} — {escape_markdown(coffee['name'])}: "
+                    f"{coffee['rating']} ({coffee['count']})\n"
+                )
+
+        return text
@@ -8,11 +8,14 @@ from typing import List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from config import config
+
 # Добавляем путь к backend для импорта моделей и репозиториев
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../backend'))
 
 # Импорты после добавления пути
 from app.models.vinyl import VinylRecord  # noqa: E402
+from app.repositories.base import Page  # noqa: E402
 from app.repositories.vinyl import VinylRepository  # noqa: E402
 
 
@@ -29,13 +32,18 @@ class VinylService:
         """Получить все виниловые записи"""
         return await self.vinyl_repo.list()
 
+    async def get_vinyl_page(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page[VinylRecord]:
+        """Страница винила (новые первыми) и курсор следующей страницы"""
+        return await self.vinyl_repo.list_page(limit or config.page_size, after=cursor or None, descending=True)
+
     async def create_vinyl(
         self,
         artist: str,
         title: str,
         year: Optional[int] = None,
         genres: Optional[List[str]] = None,
-        photo_url: Optional[str] = None
+        photo_url: Optional[str] = None,
+        photo_variants: Optional[List[dict]] = None
     ) -> VinylRecord:
         """Создать новую виниловую запись"""
         return await self.vinyl_repo.create(
@@ -43,7 +51,8 @@ class VinylService:
             title=title,
             year=year,
             genres=genres or [],
-            photo_url=photo_url
+            photo_url=photo_url,
+            photo_variants=photo_variants
         )
 
     async def get_vinyl_by_id(self, vinyl_id: str) -> Optional[VinylRecord]:
@@ -57,9 +66,11 @@ class VinylService:
         title: Optional[str] = None,
         year: Optional[int] = None,
         genres: Optional[List[str]] = None,
-        photo_url: Optional[str] = None
+        photo_url: Optional[str] = None,
+        photo_variants: Optional[List[dict]] = None,
+        clear_photo: bool = False
     ) -> Optional[VinylRecord]:
-        """Обновить виниловую запись"""
+        """Обновить виниловую запись (clear_photo=True убирает фото)"""
         update_data = {}
         if artist is not None:
             update_data['artist'] = artist
@@ -71,6 +82,11 @@ class VinylService:
             update_data['genres'] = genres
         if photo_url is not None:
             update_data['photo_url'] = photo_url
+        if photo_variants is not None:
+            update_data['photo_variants'] = photo_variants
+        if clear_photo:
+            update_data['photo_url'] = None
+            update_data['photo_variants'] = None
 
         if not update_data:
             return await self.get_vinyl_by_id(vinyl_id)
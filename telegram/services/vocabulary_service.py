@@ -0,0 +1,101 @@
+"""
+Словари уникальных значений для клавиатур бота (жанры, языки, теги...)
+
+Значения выбираются запросами SELECT DISTINCT / unnest и кешируются в
+памяти процесса с TTL. Сервисы сбрасывают кеш своей модели после commit(),
+поэтому бот сразу видит собственные изменения, а TTL ограничивает
+устаревание при записи из других процессов.
+"""
+import sys
+import os
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from sqlalchemy import distinct, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import config
+
+# Добавляем путь к backend для импорта моделей
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../backend'))
+
+# Импорты после добавления пути
+from app.models.books import Book  # noqa: E402
+from app.models.figures import Figure  # noqa: E402
+from app.models.plants import Plant  # noqa: E402
+from app.models.projects import Project  # noqa: E402
+from app.models.research import Infographic, Publication  # noqa: E402
+
+# Имя словаря -> (колонка, колонка-массив?, сортировка по убыванию?)
+VOCABULARIES = {
+    "book_genres": (Book.genre, False, False),
+    "book_languages": (Book.language, False, False),
+    "book_formats": (Book.format, False, False),
+    "project_tags": (Project.tags, True, False),
+    "figure_brands": (Figure.brand, False, False),
+    "plant_families": (Plant.family, False, False),
+    "plant_genera": (Plant.genus, False, False),
+    "publication_years": (Publication.year, False, True),
+    "publication_venues": (Publication.venue, False, False),
+    "infographic_topics": (Infographic.topic, False, False),
+}
+
+
+class VocabularyCache:
+    """In-process кеш словарей с TTL"""
+
+    def __init__(self, ttl: float, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: Dict[str, Tuple[float, list]] = {}
+
+    def get(self, name: str) -> Optional[list]:
+        entry = self._entries.get(name)
+        if entry is None or entry[0] <= self.clock():
+            return None
+        return entry[1]
+
+    def set(self, name: str, values: list) -> None:
+        if self.ttl > 0:
+            self._entries[name] = (self.clock() + self.ttl, values)
+
+    def invalidate_model(self, model) -> None:
+        """Сбросить все словари, построенные по таблице модели"""
+        for name, (column, _, _) in VOCABULARIES.items():
+            if column.class_ is model:
+                self._entries.pop(name, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+vocabulary_cache = VocabularyCache(ttl=config.vocabulary_cache_ttl)
+
+
+class VocabularyService:
+    """Уникальные значения колонок без загрузки строк целиком"""
+
+    def __init__(self, db: AsyncSession, cache: VocabularyCache = vocabulary_cache):
+        self.db = db
+        self.cache = cache
+
+    async def get(self, name: str) -> list:
+        """Отсортированные уникальные непустые значения словаря"""
+        values = self.cache.get(name)
+        if values is not None:
+            return list(values)
+
+        column, is_array, descending = VOCABULARIES[name]
+        if is_array:
+            value = func.unnest(column).label("value")
+            inner = select(value).subquery()
+            query = select(distinct(inner.c.value)).where(inner.c.value.isnot(None))
+        else:
+            query = select(distinct(column)).where(column.isnot(None))
+
+        result = await self.db.execute(query)
+        # Сортировка в Python повторяет прежнее sorted(), независимо от collation БД
+        values = sorted((value for value in result.scalars() if value != ""), reverse=descending)
+
+        self.cache.set(name, values)
+        return list(values)
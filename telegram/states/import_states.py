@@ -0,0 +1,9 @@
+"""
+FSM состояния для массового импорта
+"""
+from aiogram.fsm.state import State, StatesGroup
+
+
+class ImportStates(StatesGroup):
+    """Состояния для импорта коллекций из файла"""
+    waiting_for_document = State()
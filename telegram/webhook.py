@@ -0,0 +1,157 @@
+"""
+Webhook-режим Telegram-бота
+
+aiohttp-приложение принимает обновления от Telegram, проверяет секретный
+токен и передает их в ограниченный пул воркеров, поэтому ответ Telegram
+отправляется сразу, а обработка идет параллельно.
+"""
+import asyncio
+import hmac
+import logging
+from typing import List, Optional
+
+from aiogram import Bot, Dispatcher
+from aiogram.types import Update
+from aiohttp import web
+from pydantic import ValidationError
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+SECRET_TOKEN_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+
+class UpdateWorkerPool:
+    """Ограниченный пул воркеров для обработки обновлений
+
+    Очередь имеет фиксированный размер: при переполнении обновление не
+    принимается, и Telegram повторит доставку позже. Обновления одного
+    пользователя сериализуются events_isolation диспетчера.
+    """
+
+    def __init__(self, dp: Dispatcher, bot: Bot, workers: int, queue_size: int):
+        self.dp = dp
+        self.bot = bot
+        self.workers = workers
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        for index in range(self.workers):
+            self._tasks.append(asyncio.create_task(self._worker(), name=f"update-worker-{index}"))
+        logger.info(f"Пул обработки обновлений запущен: {self.workers} воркеров")
+
+    def submit(self, update: Update) -> bool:
+        """Поставить обновление в очередь; False, если очередь заполнена"""
+        try:
+            self.queue.put_nowait(update)
+        except asyncio.QueueFull:
+            logger.warning(f"Очередь обновлений заполнена, update_id={update.update_id} отклонен")
+            return False
+        return True
+
+    async def stop(self) -> None:
+        """Дождаться обработки принятых обновлений и остановить воркеры"""
+        await self.queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def _worker(self) -> None:
+        while True:
+            update = await self.queue.get()
+            try:
+                await self.dp.feed_update(self.bot, update)
+            except Exception as e:
+                logger.error(f"Ошибка обработки update_id={update.update_id}: {e}")
+            finally:
+                self.queue.task_done()
+
+
+def _secret_is_valid(request: web.Request, secret: str) -> bool:
+    # Без секрета обновление нельзя отличить от поддельного
+    if not secret:
+        return False
+    received = request.headers.get(SECRET_TOKEN_HEADER, "")
+    return hmac.compare_digest(received.encode(), secret.encode())
+
+
+async def handle_update(request: web.Request) -> web.Response:
+    """Принять обновление от Telegram"""
+    if not _secret_is_valid(request, config.webhook_secret):
+        return web.Response(status=401)
+
+    bot: Bot = request.app["bot"]
+    pool: UpdateWorkerPool = request.app["pool"]
+
+    try:
+        update = Update.model_validate(await request.json(), context={"bot": bot})
+    except (ValueError, ValidationError):
+        return web.Response(status=400)
+
+    if not pool.submit(update):
+        return web.Response(status=503)
+    return web.Response()
+
+
+async def handle_health(request: web.Request) -> web.Response:
+    pool: UpdateWorkerPool = request.app["pool"]
+    return web.json_response({"status": "ok", "queued": pool.queue.qsize()})
+
+
+def create_app(dp: Dispatcher, bot: Bot, pool: Optional[UpdateWorkerPool] = None) -> web.Application:
+    """Собрать aiohttp-приложение webhook-сервера"""
+    pool = pool or UpdateWorkerPool(
+        dp, bot,
+        workers=config.webhook_workers,
+        queue_size=config.webhook_queue_size
+    )
+
+    app = web.Application()
+    app["bot"] = bot
+    app["pool"] = pool
+    app.router.add_post(config.webhook_path, handle_update)
+    app.router.add_get("/healthz", handle_health)
+
+    async def on_startup(app: web.Application) -> None:
+        pool.start()
+
+    async def on_shutdown(app: web.Application) -> None:
+        await pool.stop()
+
+    app.on_startup.append(on_startup)
+    app.on_shutdown.append(on_shutdown)
+    return app
+
+
+async def run_webhook(dp: Dispatcher, bot: Bot) -> None:
+    """Запустить webhook-сервер и зарегистрировать webhook в Telegram"""
+    if not config.webhook_secret:
+        raise ValueError("WEBHOOK_SECRET обязателен в webhook-режиме")
+
+    app = create_app(dp, bot)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, config.webhook_host, config.webhook_port)
+    await site.start()
+    logger.info(f"🌐 Webhook-сервер слушает {config.webhook_host}:{config.webhook_port}{config.webhook_path}")
+
+    if config.webhook_base_url:
+        url = config.webhook_base_url.rstrip("/") + config.webhook_path
+        await bot.set_webhook(
+            url,
+            secret_token=config.webhook_secret,
+            allowed_updates=dp.resolve_used_update_types(),
+            max_connections=config.webhook_workers,
+        )
+        logger.info(f"Webhook зарегистрирован: {url}")
+    else:
+        # Локальный режим: обновления присылаются вручную (post_update.py)
+        logger.warning("WEBHOOK_BASE_URL не задан, webhook в Telegram не регистрируется")
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()